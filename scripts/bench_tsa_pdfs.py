@@ -0,0 +1,947 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for scripts/generate_tsa_pdfs.py.
+Run from repo root: python scripts/bench_tsa_pdfs.py [BENCHMARK ...] [--repeat N]
+List benchmarks: python scripts/bench_tsa_pdfs.py --list
+Regression check: run once with --save-baseline, then with --baseline after a change
+(exit status 1 when a metric got worse by more than --tolerance).
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPTS_DIR)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+# Benchmark name -> function(repeat) returning a dict of metrics
+BENCHMARKS = {}
+
+# Timings are machine-specific, so the baseline is a local (git-ignored) file
+BASELINE_PATH = os.path.join(SCRIPTS_DIR, '.bench-baseline.json')
+
+
+def benchmark(name):
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+def _summary(samples):
+    return {
+        'min_ms': min(samples) * 1000,
+        'median_ms': statistics.median(samples) * 1000,
+        'max_ms': max(samples) * 1000,
+        'runs': len(samples),
+    }
+
+
+def _time_subprocess(code, repeat):
+    """Wall time of `python -c code` in fresh interpreters (cold import, no shared state)."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=SCRIPTS_DIR, check=True)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+@benchmark('import')
+def bench_import(repeat):
+    """Cold import of generate_tsa_pdfs vs. importing its ReportLab dependencies alone.
+
+    The difference is what the module itself costs at import; it must not touch the
+    network, the font search paths or the logo thumbnail.
+    """
+    deps = 'import reportlab.platypus, reportlab.pdfbase.ttfonts, reportlab.lib.styles'
+    check = (
+        'import sys, generate_tsa_pdfs as g; '
+        'assert g.SIGNATURE_FONT is None and g.OPT_LOGO is None, "resources initialized at import"; '
+        'assert "urllib.request" not in sys.modules, "network module imported"'
+    )
+    image_cache = os.path.join(SCRIPTS_DIR, '.image-cache')
+    mtime_before = os.path.getmtime(image_cache) if os.path.exists(image_cache) else None
+    subprocess.run([sys.executable, '-c', check], cwd=SCRIPTS_DIR, check=True)
+    baseline = _time_subprocess(deps, repeat)
+    module = _time_subprocess('import generate_tsa_pdfs', repeat)
+    mtime_after = os.path.getmtime(image_cache) if os.path.exists(image_cache) else None
+    return {
+        'reportlab_import': _summary(baseline),
+        'module_import': _summary(module),
+        'module_overhead_ms': (statistics.median(module) - statistics.median(baseline)) * 1000,
+        'logo_rewritten': mtime_before != mtime_after,
+    }
+
+
+@benchmark('first-use')
+def bench_first_use(repeat):
+    """Cost of the lazily initialized resources on first use, then when memoized."""
+    code = (
+        'import time, generate_tsa_pdfs as g; '
+        't = time.perf_counter(); g.init_resources(); first = time.perf_counter() - t; '
+        't = time.perf_counter(); g.init_resources(); again = time.perf_counter() - t; '
+        'print(first, again)'
+    )
+    first, again = [], []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code], cwd=SCRIPTS_DIR, check=True,
+                             capture_output=True, text=True).stdout.split()
+        first.append(float(out[0]))
+        again.append(float(out[1]))
+    return {'first_call': _summary(first), 'memoized_call': _summary(again)}
+
+
+@benchmark('fonts')
+def bench_fonts(repeat):
+    """Signature font setup per process: search vs the cached resolved path; font bytes per PDF."""
+    import tempfile
+    import generate_tsa_pdfs as g
+    code = (
+        'import sys, time, generate_tsa_pdfs as g; '
+        'g.FONT_CACHE_DIR = sys.argv[1]; g.FONT_CACHE_INDEX = sys.argv[1] + "/resolved.json"; '
+        't = time.perf_counter(); g.get_signature_font(); print(time.perf_counter() - t, g.SIGNATURE_FONT_PATH)'
+    )
+    cold, warm, path = [], [], None
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as cache:
+            for samples in (cold, warm):
+                out = subprocess.run([sys.executable, '-c', code, cache], cwd=SCRIPTS_DIR, check=True,
+                                     capture_output=True, text=True).stdout.split(maxsplit=1)
+                samples.append(float(out[0]))
+                path = out[1].strip()
+    results = {'font': path, 'uncached': _summary(cold), 'cached': _summary(warm)}
+    with tempfile.TemporaryDirectory() as tmp:
+        g.init_resources()
+        for name, spec_path in g.find_specs().items():
+            out = os.path.join(tmp, f'{name}.pdf')
+            g.render_spec(g.load_spec(spec_path), out)
+            results[f'{name}_font_bytes'] = g.font_bytes(out)
+    return results
+
+
+def _synthetic_phases(count):
+    """Work-log phases shaped like scripts/documents/work-log.json."""
+    return [{
+        'title': f'Phase {i}: Feature Development and Review',
+        'dates': 'November 1-5, 2025',
+        'hours': 5 + i % 20,
+        'team': 'All team members',
+        'tasks': ['Planned work', 'Implemented features', 'Reviewed pull requests', 'Fixed bugs'],
+        'outcome': 'Feature shipped and documented',
+    } for i in range(1, count + 1)]
+
+
+def _synthetic_resume(jobs=3):
+    """resume_data shaped like the resume builder's (lib/ai/gemini.ts ResumeData)."""
+    return {
+        'personalInfo': {'firstName': 'Jordan', 'lastName': 'Rivera', 'email': 'jordan@example.com', 'phone': '(704) 555-0142',
+                         'address': 'Monroe, NC', 'linkedin': 'linkedin.com/in/jordan-rivera', 'website': 'jordan.dev'},
+        'summary': 'Student developer who builds accessible web tools for local nonprofits, from planning to launch.',
+        'experience': [{'id': f'e{i}', 'company': 'Monroe Public Library', 'position': 'Technology Volunteer',
+                        'startDate': '2024-06-01', 'endDate': '', 'current': i == 0, 'description': 'Weekly device help desk.',
+                        'achievements': ['Taught 40+ seniors basic smartphone skills', 'Set up a Chromebook lending program',
+                                         'Wrote how-to guides used at three branches']} for i in range(jobs)],
+        'education': [{'id': 'd1', 'institution': 'Central Academy of Technology and Arts', 'degree': 'High School Diploma',
+                       'field': 'Computer Science', 'startDate': '2022-08-20', 'endDate': '2026-06-05', 'gpa': '4.1'}],
+        'skills': ['Python', 'TypeScript', 'React', 'SQL', 'Figma', 'Public speaking'],
+        'certifications': [{'id': 'c1', 'name': 'CompTIA IT Fundamentals', 'issuer': 'CompTIA', 'date': '2025-03-01'}],
+        'languages': [{'id': 'l1', 'language': 'Spanish', 'proficiency': 'Fluent'}],
+    }
+
+
+def _measure(fn, repeat):
+    """(best wall seconds, bytes still held by one run's result) for a no-argument callable."""
+    import tracemalloc
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    tracemalloc.start()
+    result = fn()
+    allocated, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return min(samples), allocated
+
+
+@benchmark('phase-styles')
+def bench_phase_styles(repeat, phases=500):
+    """Per-phase style cost: fresh ParagraphStyle/TableStyle objects per phase vs the shared registry."""
+    import generate_tsa_pdfs as g
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import TableStyle
+    g.init_resources()
+
+    def per_phase_objects():
+        # What the phase loop used to allocate on every iteration
+        kept = []
+        for _ in range(phases):
+            kept.append((
+                TableStyle([
+                    ('BACKGROUND', (0, 0), (-1, -1), g.CARD_BG),
+                    ('TEXTCOLOR', (0, 0), (0, -1), g.PRIMARY_BLUE),
+                    ('TEXTCOLOR', (1, 0), (1, -1), g.TEXT_DARK),
+                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+                    ('GRID', (0, 0), (-1, -1), 0.5, g.BORDER),
+                    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+                    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+                    ('TOPPADDING', (0, 0), (-1, -1), 8),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ]),
+                ParagraphStyle('Meta', fontName='Helvetica', fontSize=9, textColor=g.TEXT_MUTED, spaceAfter=6),
+                ParagraphStyle('Tasks', fontName='Helvetica', fontSize=9, textColor=g.TEXT_DARK, leftIndent=12, spaceAfter=4),
+                ParagraphStyle('Outcome', fontName='Helvetica-Oblique', fontSize=10, textColor=g.CIVIC_GREEN, spaceAfter=12),
+            ))
+        return kept
+
+    def registry_lookups():
+        kept = []
+        for _ in range(phases):
+            styles = g.get_styles()
+            kept.append((g.table_style_phase_header(), styles['PhaseMeta'], styles['PhaseTasks'], styles['PhaseOutcome']))
+        return kept
+
+    spec = g.compile_spec({'phases': _synthetic_phases(phases), 'blocks': [{'type': 'phases'}]})
+    before_s, before_b = _measure(per_phase_objects, repeat)
+    after_s, after_b = _measure(registry_lookups, repeat)
+    sheet_s, sheet_b = _measure(g.build_styles, repeat)
+    render_s, render_b = _measure(lambda: g.build_story(spec), repeat)
+    return {
+        'phases': phases,
+        'per_phase_styles_before': {'us': before_s / phases * 1e6, 'bytes': before_b / phases},
+        'per_phase_styles_after': {'us': after_s / phases * 1e6, 'bytes': after_b / phases},
+        'build_styles_per_document': {'ms': sheet_s * 1000, 'bytes': sheet_b},
+        'render_phase_flowables': {'us_per_phase': render_s / phases * 1e6, 'bytes_per_phase': render_b / phases},
+    }
+
+
+def _peak_memory(fn):
+    """(wall seconds, peak traced bytes) for one call."""
+    import tracemalloc
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+STREAM_PAGE_BOUND_BYTES = 12 * 1024  # documented bound (StreamingDocTemplate): retained per finished page
+
+
+@benchmark('stream')
+def bench_stream(repeat, sizes=(100, 400, 1000)):
+    """Peak memory of a work log built from a phase list vs streamed from a generator.
+
+    A streamed story is never held whole, but the canvas keeps each finished page until save,
+    so streamed peaks grow with the page count: stream_bytes_per_page is that growth per page
+    over the smallest size, checked against STREAM_PAGE_BOUND_BYTES.
+    """
+    import tempfile
+    import generate_tsa_pdfs as g
+    g.init_resources()
+    results = {}
+    first = None
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, 'stream.pdf')
+        for count in sizes:
+            pages = []
+
+            def as_list():
+                story = list(g.phase_flowables(_synthetic_phases(count)))
+                doc = g.render_flowables(story, out, 'WORK LOG', 'Benchmark')
+                pages.append(doc.page)
+
+            def as_stream():
+                doc = g.render_flowables(g.phase_flowables(iter(_synthetic_phases(count))), out, 'WORK LOG', 'Benchmark')
+                pages.append(doc.page)
+
+            list_s, list_peak = _peak_memory(as_list)
+            stream_s, stream_peak = _peak_memory(as_stream)
+            results[f'{count}_phases'] = {
+                'pages': pages[-1],
+                'list_peak_mb': list_peak / 1e6,
+                'stream_peak_mb': stream_peak / 1e6,
+                'list_s': list_s,
+                'stream_s': stream_s,
+            }
+            if first is None:
+                first = (pages[-1], stream_peak)
+            elif pages[-1] > first[0]:
+                per_page = (stream_peak - first[1]) / (pages[-1] - first[0])
+                results[f'{count}_phases'].update(stream_bytes_per_page=per_page,
+                                                  stream_within_page_bound=per_page <= STREAM_PAGE_BOUND_BYTES)
+    return results
+
+
+@benchmark('pagination')
+def bench_pagination(repeat, sizes=(100, 400, 1600)):
+    """Work-log layout time and Paragraph wraps per phase vs phase count: KeepTogether cards vs
+    PlannedGroup (measured once, explicit page breaks). Per-phase cost should stay flat."""
+    from unittest import mock
+    from reportlab.platypus import KeepTogether, Paragraph
+    import generate_tsa_pdfs as g
+    g.init_resources()
+    wrap = Paragraph.wrap
+    wraps = [0]
+
+    def counting_wrap(self, *args):
+        wraps[0] += 1
+        return wrap(self, *args)
+
+    def keep_together(phases):
+        for flowable in g.phase_flowables(phases):
+            yield KeepTogether(flowable.content) if isinstance(flowable, g.PlannedGroup) else flowable
+
+    results = {}
+    with mock.patch.object(Paragraph, 'wrap', counting_wrap):
+        for count in sizes:
+            phases = _synthetic_phases(count)
+            for label, story in (('keep_together', keep_together), ('planned', g.phase_flowables)):
+                samples = []
+                for _ in range(repeat):
+                    wraps[0] = 0
+                    start = time.perf_counter()
+                    g.render_pdf(story(phases), 'WORK LOG', 'Benchmark')
+                    samples.append(time.perf_counter() - start)
+                results[f'{count}_phases_{label}'] = {
+                    'ms': min(samples) * 1000,
+                    'us_per_phase': min(samples) / count * 1e6,
+                    'paragraph_wraps_per_phase': wraps[0] / count,
+                }
+    return results
+
+
+@benchmark('chrome')
+def bench_chrome(repeat, phases=300):
+    """Pages/s and bytes/page of a long work log: header/footer drawn per page vs one shared form."""
+    import tempfile
+    from contextlib import ExitStack
+    from unittest import mock
+    import generate_tsa_pdfs as g
+    g.init_resources()
+
+    def per_page(canvas, doc, title, subtitle):
+        # What every page callback drew before the chrome became a form XObject
+        canvas.setPageCompression(1)
+        g.draw_white_background(canvas, doc)
+        g.draw_header(canvas, doc, title, subtitle)
+        g._draw_footer(canvas, doc)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, 'chrome.pdf')
+        for label, callback in (('per_page_drawing', per_page), ('shared_form', None)):
+            samples, pages = [], 0
+            with ExitStack() as stack:
+                if callback:
+                    stack.enter_context(mock.patch.object(g, 'first_page_cb', callback))
+                    stack.enter_context(mock.patch.object(g, 'later_pages_cb', callback))
+                exists = stack.enter_context(mock.patch('os.path.exists', wraps=os.path.exists))
+                for _ in range(repeat):
+                    exists.reset_mock()
+                    start = time.perf_counter()
+                    pages = g.render_flowables(g.phase_flowables(_synthetic_phases(phases)), out, 'WORK LOG', 'Benchmark').page
+                    samples.append(time.perf_counter() - start)
+            results[label] = {
+                'pages': pages,
+                'pages_per_s': pages / min(samples),
+                'bytes_per_page': os.path.getsize(out) / pages,
+                'exists_calls_per_page': exists.call_count / pages,
+            }
+    return results
+
+
+@benchmark('build-styles')
+def bench_build_styles(repeat):
+    """build_styles() from scratch vs the memoized get_styles() registry."""
+    import generate_tsa_pdfs as g
+    fresh = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        g.build_styles()
+        fresh.append(time.perf_counter() - start)
+    g.get_styles()
+    cached = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        g.get_styles()
+        cached.append(time.perf_counter() - start)
+    return {'build_styles': _summary(fresh), 'get_styles_memoized': _summary(cached)}
+
+
+@benchmark('documents')
+def bench_documents(repeat):
+    """Each committed document spec: compile and render to a temporary file."""
+    import tempfile
+    import generate_tsa_pdfs as g
+    g.init_resources()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, path in g.find_specs().items():
+            out = os.path.join(tmp, f'{name}.pdf')
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                spec = g.compile_spec(g._parse_spec_file(path), path)
+                doc = g.render_flowables(g.iter_story(spec), out, spec.title, spec.subtitle, spec.metadata)
+                samples.append(time.perf_counter() - start)
+            results[name] = dict(_summary(samples), pages=doc.page, bytes=os.path.getsize(out))
+    return results
+
+
+@benchmark('page-chrome')
+def bench_page_chrome(repeat, pages=200):
+    """draw_header/_draw_footer drawn on every page vs the shared chrome form, on blank pages."""
+    import io
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen.canvas import Canvas
+    import generate_tsa_pdfs as g
+    g.init_resources()
+
+    def per_page(canvas):
+        g.draw_white_background(canvas, None)
+        g.draw_header(canvas, None, 'WORK LOG', 'Benchmark')
+        g._draw_footer(canvas, None)
+
+    def shared_form(canvas):
+        g.draw_page_chrome(canvas, None, 'WORK LOG', 'Benchmark')
+
+    results = {}
+    for label, draw in (('per_page_drawing', per_page), ('shared_form', shared_form)):
+        samples = []
+        for _ in range(repeat):
+            canvas = Canvas(io.BytesIO(), pagesize=letter)
+            start = time.perf_counter()
+            for _page in range(pages):
+                draw(canvas)
+                canvas.showPage()
+            samples.append(time.perf_counter() - start)
+            canvas.save()
+        results[label] = {'us_per_page': min(samples) / pages * 1e6}
+    return results
+
+
+@benchmark('scaled-work-log')
+def bench_scaled_work_log(repeat, sizes=(10, 1000, 10000)):
+    """Work logs with 10, 1,000 and 10,000 synthetic phases (large sizes are timed once)."""
+    import tempfile
+    import generate_tsa_pdfs as g
+    g.init_resources()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, 'work-log.pdf')
+        for count in sizes:
+            spec = g.compile_spec({'phases': _synthetic_phases(count), 'blocks': [
+                {'type': 'phases'},
+                {'type': 'phase_summary', 'header': ['Phase', 'Dates', 'Hours', 'Team'], 'col_widths': [2.2, 1.6, 0.7, 1.5]},
+            ]})
+            samples = []
+            for _ in range(repeat if count < 1000 else 1):
+                start = time.perf_counter()
+                doc = g.render_flowables(g.iter_story(spec), out, 'WORK LOG', 'Benchmark')
+                samples.append(time.perf_counter() - start)
+            results[f'{count}_phases'] = {'s': min(samples), 'pages': doc.page, 'pages_per_s': doc.page / min(samples),
+                                          'bytes_per_page': os.path.getsize(out) / doc.page}
+    return results
+
+
+@benchmark('scaled-checklist')
+def bench_scaled_checklist(repeat, sizes=(100, 1000, 5000)):
+    """Checklist-style zebra tables with 100, 1,000 and 5,000 rows (large sizes are timed once)."""
+    import tempfile
+    import generate_tsa_pdfs as g
+    g.init_resources()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, 'checklist.pdf')
+        for count in sizes:
+            rows = [[f'Asset {i}', 'Image' if i % 3 else 'Font', 'Original work by the team, no attribution required',
+                     'Yes' if i % 2 else 'N/A'] for i in range(count)]
+            spec = g.compile_spec({'blocks': [{'type': 'table', 'zebra': True, 'header_rule': True,
+                                               'header': ['Item', 'Type', 'Source / License', 'Permission'],
+                                               'col_widths': [1.8, 0.9, 3.0, 1.0], 'rows': rows}]})
+            samples = []
+            for _ in range(repeat if count < 1000 else 1):
+                start = time.perf_counter()
+                doc = g.render_flowables(g.iter_story(spec), out, 'CHECKLIST', 'Benchmark')
+                samples.append(time.perf_counter() - start)
+            results[f'{count}_rows'] = {'s': min(samples), 'pages': doc.page, 'rows_per_s': count / min(samples)}
+    return results
+
+
+@benchmark('paragraph-cache')
+def bench_paragraph_cache(repeat, documents=50):
+    """Table-cell Paragraphs for a batch of checklists: parsed every time vs the (text, style) cache."""
+    import generate_tsa_pdfs as g
+    from reportlab.platypus import Paragraph
+    g.init_resources()
+    styles = g.get_styles()
+    cells = []
+    spec = g.load_spec(g.resolve_spec('student-copyright-checklist'))
+    for block in spec.blocks:
+        if block['type'] in ('meta', 'table'):
+            cells += [(text, 'CellHeader') for text in block.get('header', [])]
+            cells += [(text, 'Cell') for row in block['rows'] for text in row]
+
+    def parse_every_time():
+        return [Paragraph(g._escape(text), styles[name]) for _ in range(documents) for text, name in cells]
+
+    def cached():
+        g.clear_paragraph_cache()
+        return [g.cell_para(text, styles, name) for _ in range(documents) for text, name in cells]
+
+    before, _ = _measure(parse_every_time, repeat)
+    after, _ = _measure(cached, repeat)
+    count = documents * len(cells)
+    return {
+        'cells': count,
+        'parse_every_time': {'us_per_cell': before / count * 1e6},
+        'cached': {'us_per_cell': after / count * 1e6},
+        'hit_rate': g.PARAGRAPH_CACHE_STATS['hits'] / count,
+        'speedup': before / after,
+    }
+
+
+@benchmark('optimize')
+def bench_optimize(repeat):
+    """Committed documents: bytes as built vs after optimize_pdf_bytes(), and the optimizer's cost."""
+    import generate_tsa_pdfs as g
+    g.init_resources()
+    results = {}
+    for name, spec_path in g.find_specs().items():
+        built = g.render_spec_bytes(g.load_spec(spec_path))
+        samples, stats = [], None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            optimized = g.optimize_pdf_bytes(built)
+            samples.append(time.perf_counter() - start)
+            if optimized is None:
+                return {'skipped': 'pikepdf is not installed'}
+            stats = optimized[1]
+        results[name] = {'built_bytes': stats['before'], 'optimized_bytes': stats['after'],
+                         'saved_pct': 100 * (1 - stats['after'] / stats['before']), 'optimize_ms': min(samples) * 1000}
+    return results
+
+
+@benchmark('memory-target')
+def bench_memory_target(repeat):
+    """Rendering to a file and reading it back vs rendering to bytes, and into a pre-sized buffer."""
+    import tempfile
+    import generate_tsa_pdfs as g
+    g.init_resources()
+    spec = g.load_spec(g.resolve_spec('work-log'))
+    buffer = bytearray(1024 * 1024)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'work-log.pdf')
+
+        def via_file():
+            g.render_flowables(g.iter_story(spec), path, spec.title, spec.subtitle, spec.metadata)
+            with open(path, 'rb') as f:
+                return f.read()
+
+        for label, fn in (('file_roundtrip', via_file), ('bytes', lambda: g.render_spec_bytes(spec)),
+                          ('buffer', lambda: g.render_spec_bytes(spec, buffer))):
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                samples.append(time.perf_counter() - start)
+            results[label] = _summary(samples)
+    return results
+
+
+@benchmark('preview')
+def bench_preview(repeat):
+    """Dashboard previews vs a full PDF render: static HTML, and page-1 thumbnails with a cold
+    layout cache (one recorded PDF render) and a warm one (display list reused)."""
+    import generate_tsa_pdfs as g
+    import preview_tsa_pdfs as p
+    g.init_resources()
+    spec = g.load_spec(g.resolve_spec('work-log'))
+
+    def cold_thumbnail():
+        p.clear_layout_cache()
+        return p.render_thumbnails(spec, pages=[0])
+
+    results = {}
+    for label, fn in (('pdf', lambda: g.render_spec_bytes(spec, reproducible=True)),
+                      ('html', lambda: p.render_html(spec)),
+                      ('thumbnail_cold', cold_thumbnail),
+                      ('thumbnail_warm', lambda: p.render_thumbnails(spec, pages=[0]))):
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+        results[label] = _summary(samples)
+    return results
+
+
+@benchmark('images')
+def bench_images(repeat):
+    """Image derivative cache: every site image at every size as PNG and JPEG, generated from
+    scratch, then found on disk by a new process (index and stat only) and memoized in-process."""
+    import glob
+    import tempfile
+    import generate_tsa_pdfs as g
+    sources = [os.path.join(REPO_ROOT, 'public', 'logo.png'), os.path.join(REPO_ROOT, 'image.png')]
+    sources += sorted(glob.glob(os.path.join(REPO_ROOT, 'public', 'images', '*.png')))
+    requests = [(source, size, fmt) for source in sources for size in g.IMAGE_SIZES for fmt in ('PNG', 'JPEG')]
+    saved = g.IMAGE_CACHE_DIR, g.IMAGE_CACHE_INDEX
+    cold, disk, memo = [], [], []
+    try:
+        for _ in range(repeat):
+            with tempfile.TemporaryDirectory() as tmp:
+                g.IMAGE_CACHE_DIR, g.IMAGE_CACHE_INDEX = tmp, os.path.join(tmp, 'sources.json')
+                g._IMAGE_SOURCES, g._IMAGE_PATHS = None, {}
+                start = time.perf_counter()
+                paths = g.image_derivatives(requests)
+                cold.append(time.perf_counter() - start)
+                g._IMAGE_SOURCES, g._IMAGE_PATHS = None, {}
+                start = time.perf_counter()
+                g.image_derivatives(requests)
+                disk.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                g.image_derivatives(requests)
+                memo.append(time.perf_counter() - start)
+                sizes = {fmt: sum(os.path.getsize(path) for path in set(paths) if path.endswith(ext))
+                         for fmt, ext in (('PNG', '.png'), ('JPEG', '.jpg'))}
+    finally:
+        g.IMAGE_CACHE_DIR, g.IMAGE_CACHE_INDEX = saved
+        g._IMAGE_SOURCES, g._IMAGE_PATHS = None, {}
+    return {
+        'derivatives': len(requests),
+        'cold': _summary(cold),
+        'warm_disk': _summary(disk),
+        'warm_memo': _summary(memo),
+        'source_bytes': sum(os.path.getsize(source) for source in sources),
+        'derivative_bytes': sizes,
+    }
+
+
+@benchmark('resume')
+def bench_resume(repeat, raster_width=816):
+    """Vector resume PDFs per template vs the raster export they replace: each page painted at
+    2x of 816 px (html2canvas' scale for a letter page at 96 dpi) and embedded as a PNG page
+    image. Text is painted as greeked bars, so raster bytes and time are a lower bound."""
+    from io import BytesIO
+    from reportlab.lib.utils import ImageReader
+    import generate_tsa_pdfs as g
+    import generate_resumes as r
+    import preview_tsa_pdfs as p
+    g.init_resources()
+
+    def timed(fn):
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+        return _summary(samples)
+
+    results = {}
+    for jobs in (3, 12):
+        resume = _synthetic_resume(jobs)
+        for template in r.TEMPLATES:
+            vector_bytes = r.render_resume_bytes(resume, template, reproducible=True)
+            vector = timed(lambda: r.render_resume_bytes(resume, template, reproducible=True))
+            display = r.render_resume(resume, BytesIO(), template, canvasmaker=p.RecordingCanvas).canv.display_list()
+
+            def raster_pdf():
+                out = BytesIO()
+                canvas = g.Canvas(out, pagesize=display.page_size)
+                for index in range(len(display.pages)):
+                    painter = p.ThumbnailPainter(display, raster_width)
+                    page = BytesIO()
+                    painter.paint(index).save(page, 'PNG')
+                    canvas.drawImage(ImageReader(page), 0, 0, *display.page_size)
+                    canvas.showPage()
+                canvas.save()
+                return out.getvalue()
+
+            raster_bytes = raster_pdf()
+            raster = timed(raster_pdf)
+            results[f'{template}_{jobs}_jobs'] = {
+                'pages': len(display.pages),
+                'vector_kb': len(vector_bytes) / 1024,
+                'raster_kb': len(raster_bytes) / 1024,
+                'size_ratio': len(raster_bytes) / len(vector_bytes),
+                'vector': vector,
+                'raster': raster,
+            }
+    return results
+
+
+@benchmark('chunked')
+def bench_chunked(repeat, phases=1000, workers=(1, 2, 4, 8)):
+    """One long work log rendered whole vs split into chunks on 1, 2, 4 and 8 warm worker
+    processes and merged; speedup is against the single-process render."""
+    import json
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+    import generate_tsa_pdfs as g
+    g.init_resources()
+    raw = dict(g.load_spec(g.resolve_spec('work-log')).raw, phases=_synthetic_phases(phases))
+    raw.pop('size_budget_kb', None)
+    results = {'cpus': os.cpu_count()}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'long-work-log.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(raw, f)
+        spec = g.load_spec(path)
+        g.render_spec_bytes(spec)  # warm the paragraph and style caches
+        single = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            data = g.render_spec_bytes(spec)
+            single.append(time.perf_counter() - start)
+        results['single'] = {'ms': min(single) * 1000, 'kb': len(data) / 1024}
+        for count in workers:
+            with ProcessPoolExecutor(max_workers=count, initializer=g._init_worker) as pool:
+                g.render_spec_chunked(spec, count, pool)  # warm: workers started, start pages known
+                samples = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    data, stats = g.render_spec_chunked(spec, count, pool)
+                    samples.append(time.perf_counter() - start)
+            results[f'{count}_workers'] = {
+                'ms': min(samples) * 1000,
+                'speedup': min(single) / min(samples),
+                'chunks': stats['chunks'],
+                'kb': len(data) / 1024,
+            }
+            if stats['pages']:
+                results[f'{count}_workers']['pages'] = stats['pages']
+    return results
+
+
+@benchmark('catalog-export')
+def bench_catalog_export(repeat, resources=100000, export_sizes=(1000, 5000)):
+    """Resource catalog from a synthetic SQLite mirror: streaming every row with keyset pages
+    vs OFFSET pages, and full PDF exports, with peak traced memory (should not grow with rows)."""
+    import tempfile
+    import export_resource_catalog as export
+    import generate_tsa_pdfs as g
+    import resource_db
+    g.init_resources()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'resources.sqlite3')
+        resource_db.mirror_synthetic(resources, path)
+        with resource_db.ResourceDatabase(path) as db:
+            def keyset():
+                return sum(1 for _ in db.iter_resources())
+
+            def offset():
+                # What the catalog would do with LIMIT/OFFSET paging over a joined query
+                count = 0
+                with db.pool.connection() as conn:
+                    while True:
+                        rows = conn.execute('SELECT r.id, r.name, c.name FROM resources r JOIN categories c ON c.id = r.category_id '
+                                            'WHERE r.is_approved ORDER BY c.name, r.name, r.id LIMIT ? OFFSET ?',
+                                            (resource_db.PAGE_SIZE, count)).fetchall()
+                        count += len(rows)
+                        if len(rows) < resource_db.PAGE_SIZE:
+                            return count
+
+            for label, fn in (('keyset_fetch', keyset), ('offset_fetch', offset)):
+                seconds, peak = _peak_memory(fn)
+                results[f'{resources}_{label}'] = {'ms': seconds * 1000, 'peak_mb': peak / 1e6}
+        for count in export_sizes:
+            path = os.path.join(tmp, f'resources-{count}.sqlite3')
+            resource_db.mirror_synthetic(count, path)
+            with resource_db.ResourceDatabase(path) as db:
+                pages = []
+                seconds, peak = _peak_memory(lambda: pages.append(export.export_catalog(db, g.PdfSink())[1]))
+            results[f'{count}_export'] = {'s': seconds, 'pages': pages[0], 'peak_mb': peak / 1e6,
+                                          'us_per_resource': seconds / count * 1e6}
+    return results
+
+
+@benchmark('hours-store')
+def bench_hours_store(repeat, entries=50000):
+    """Work-log analytics over many time entries: loading the columnar store, then aggregating
+    in plain loops vs NumPy."""
+    import random
+    from datetime import date
+    import generate_tsa_pdfs as g
+    rng = random.Random(1)
+    first = date(2025, 9, 1).toordinal()
+    teams = ['Design team', 'Backend team', 'Frontend team', 'Content team', 'QA team']
+    records = [{'date': date.fromordinal(first + rng.randrange(180)).isoformat(), 'hours': rng.randrange(1, 17) / 4,
+                'team': rng.choice(teams)} for _ in range(entries)]
+    load, _ = _measure(lambda: g.HoursStore.from_records(records), repeat)
+    store = g.HoursStore.from_records(records)
+
+    def aggregate():
+        return store.total(), store.by_team(), store.date_range(), store.burndown()
+
+    results = {'entries': entries, 'load_ms': load * 1000}
+    threshold = g.VECTORIZE_MIN_RECORDS
+    try:
+        g.VECTORIZE_MIN_RECORDS = entries + 1
+        results['loops_ms'] = _measure(aggregate, repeat)[0] * 1000
+        g.VECTORIZE_MIN_RECORDS = 0
+        if g._numpy(entries) is not None:
+            aggregate()  # NumPy import outside the timing
+            results['numpy_ms'] = _measure(aggregate, repeat)[0] * 1000
+    finally:
+        g.VECTORIZE_MIN_RECORDS = threshold
+    return results
+
+
+@benchmark('service')
+def bench_service(repeat, concurrent=8):
+    """On-demand service: a fresh render, identical concurrent requests (coalesced) and a cache hit."""
+    import asyncio
+    import serve_tsa_pdfs as s
+
+    async def run():
+        service = s.PdfService(jobs=2)
+        try:
+            renders, coalesced, hits = [], [], []
+            for n in range(repeat):
+                plan = service.plan('/documents/work-log.pdf', f'team_name=Bench+{n}')
+                start = time.perf_counter()
+                await service.render(*plan)
+                renders.append(time.perf_counter() - start)
+                plan = service.plan('/documents/work-log.pdf', f'team_name=Crowd+{n}')
+                start = time.perf_counter()
+                await asyncio.gather(*(service.render(*plan) for _ in range(concurrent)))
+                coalesced.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                await service.render(*plan)
+                hits.append(time.perf_counter() - start)
+            return {'render': _summary(renders), f'coalesced_x{concurrent}': _summary(coalesced),
+                    'cache_hit': _summary(hits), 'renders_per_coalesced_batch': (service.stats['renders'] - repeat) / repeat}
+        finally:
+            service.close()
+
+    return asyncio.run(run())
+
+
+# Metric name suffixes and whether a larger value is worse; other metrics are informational
+LOWER_IS_BETTER = ('_ms', '_s', '_us', 'us_per_page', 'us_per_phase', 'bytes', 'bytes_per_page', 'bytes_per_phase', '_mb')
+HIGHER_IS_BETTER = ('per_s',)
+
+
+# Too noisy to gate on: single worst runs and sub-10-microsecond timings
+NOISY_METRICS = ('max_ms',)
+NOISE_FLOOR_MS = 0.01
+
+
+def _direction(key):
+    if key in NOISY_METRICS:
+        return 0
+    if key.endswith(HIGHER_IS_BETTER):
+        return -1
+    if key == 's' or key.endswith(LOWER_IS_BETTER):
+        return 1
+    return 0
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """(path, baseline, current, change) for every metric that got worse by more than `tolerance`."""
+    regressions = []
+
+    def walk(current, previous, path):
+        for key, value in current.items():
+            if key not in previous:
+                continue
+            if isinstance(value, dict) and isinstance(previous[key], dict):
+                walk(value, previous[key], f'{path}.{key}' if path else key)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool) and previous[key]:
+                direction = _direction(key)
+                if key.endswith('_ms') and abs(previous[key]) < NOISE_FLOOR_MS:
+                    continue
+                change = (value - previous[key]) / abs(previous[key])
+                if direction and change * direction > tolerance:
+                    regressions.append((f'{path}.{key}', previous[key], value, change))
+
+    walk(results, baseline, '')
+    return regressions
+
+
+def _environment():
+    import reportlab
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'reportlab': reportlab.Version,
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def _print_metrics(metrics, indent='  '):
+    for key, value in metrics.items():
+        if isinstance(value, dict):
+            print(f'{indent}{key}:')
+            _print_metrics(value, indent + '  ')
+        elif isinstance(value, float):
+            print(f'{indent}{key}: {value:.2f}')
+        else:
+            print(f'{indent}{key}: {value}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the TSA PDF generator.')
+    parser.add_argument('benchmarks', nargs='*', metavar='BENCHMARK', help='benchmarks to run (default: all)')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per measurement (default: 5)')
+    parser.add_argument('--list', action='store_true', help='list benchmarks and exit')
+    parser.add_argument('--output', metavar='FILE', help='also write the results as JSON to FILE')
+    parser.add_argument('--save-baseline', action='store_true', help=f'store the results as the baseline ({os.path.relpath(BASELINE_PATH, REPO_ROOT)})')
+    parser.add_argument('--baseline', nargs='?', const=BASELINE_PATH, metavar='FILE',
+                        help='compare against a baseline JSON (default: the stored baseline); exit 1 on regressions')
+    parser.add_argument('--tolerance', type=float, default=0.10, help='allowed slowdown before a metric counts as a regression (default: 0.10)')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, fn in BENCHMARKS.items():
+            print(f'{name:<16} {fn.__doc__.splitlines()[0]}')
+        return 0
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+    baseline = None
+    if args.baseline:
+        if not os.path.isfile(args.baseline):
+            parser.error(f'no baseline at {args.baseline}; create one with --save-baseline')
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {}
+    for name in args.benchmarks or BENCHMARKS:
+        print(f'{name}:')
+        results[name] = BENCHMARKS[name](args.repeat)
+        _print_metrics(results[name])
+    report = {'environment': _environment(), 'repeat': args.repeat, 'benchmarks': results}
+    for path in filter(None, (args.output, BASELINE_PATH if args.save_baseline else None)):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f'Results written to {path}')
+
+    if baseline is None:
+        return 0
+    regressions = compare_to_baseline(results, baseline['benchmarks'], args.tolerance)
+    for metric, before, after, change in regressions:
+        print(f'  REGRESSION {metric}: {before:.4g} -> {after:.4g} ({change:+.0%})')
+    print(f"{len(regressions)} regression(s) against baseline from {baseline['environment']['time']} "
+          f'(tolerance {args.tolerance:.0%})')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Export the printed resource catalog straight from the resources database: every approved
+resource, grouped by category, as one PDF with the TSA header, footer and directory cards.
+Rows stream from keyset-paginated queries into the layout engine, so at most one page of rows
+is held at once (memory still grows with the PDF's pages; see StreamingDocTemplate).
+Run from repo root: python scripts/export_resource_catalog.py [--db DSN] [--out FILE]
+Database: --db, else $RESOURCES_DATABASE_URL, else the SQLite mirror (python scripts/resource_db.py mirror)
+Output: public/documents/resource-catalog.pdf
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from reportlab.platypus import Paragraph
+
+import generate_resource_directory as directory
+import generate_tsa_pdfs as g
+import resource_db
+
+CATALOG_OUT_PATH = os.path.join(g.OUT_DIR, 'resource-catalog.pdf')
+
+
+def catalog_entry(row):
+    """A database row as a directory card entry: contact details share the address line."""
+    contact = ' | '.join(part for part in (row.address, row.phone, row.email, row.website) if part)
+    return None, directory.Resource(row.name, row.category, contact, row.description, None, None)
+
+
+def catalog_flowables(rows, counts, styles=None):
+    """Category heading and count, then one card per resource, for rows in catalog order."""
+    styles = styles or g.get_styles()
+    current = None
+    for row in rows:
+        if row.category_id != current:
+            current = row.category_id
+            yield Paragraph(g._escape(row.category), styles['SectionAccent'])
+            yield g.cell_para(directory.resource_count(counts.get(current, 0)), styles, 'MutedNote')
+        yield from directory.directory_flowables([catalog_entry(row)], styles)
+
+
+def export_catalog(db, out_path=CATALOG_OUT_PATH, reproducible=False, page_size=resource_db.PAGE_SIZE):
+    """Render the catalog from `db` (a ResourceDatabase) to out_path, a path or writable binary
+    target (see generate_tsa_pdfs.render_flowables). Returns (resources, pages)."""
+    categories = db.categories()
+    counts = db.category_counts()
+    exported = [0]
+
+    def rows():
+        for row in db.iter_resources(categories, page_size=page_size):
+            exported[0] += 1
+            yield row
+
+    doc = g.render_flowables(catalog_flowables(rows(), counts), out_path, 'RESOURCE CATALOG',
+                             'Community Resources | Monroe Resource Hub', {'title': 'Resource Catalog'}, reproducible)
+    return exported[0], doc.page
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export the resource catalog PDF from the resources database.')
+    parser.add_argument('--db', metavar='DSN', help=f'postgresql://... or a SQLite path (default: ${resource_db.DATABASE_URL_ENV}, '
+                                                    'else scripts/data/resources.sqlite3)')
+    parser.add_argument('--out', default=CATALOG_OUT_PATH, help='output PDF (default: public/documents/resource-catalog.pdf)')
+    parser.add_argument('--page-size', type=int, default=resource_db.PAGE_SIZE, help=f'rows per query (default: {resource_db.PAGE_SIZE})')
+    parser.add_argument('--reproducible', action='store_true', help='byte-identical PDFs for identical data')
+    args = parser.parse_args(argv)
+    try:
+        db = resource_db.ResourceDatabase(args.db)
+    except (FileNotFoundError, RuntimeError) as e:
+        parser.error(str(e))
+    g.init_resources()
+    start = time.perf_counter()
+    with db:
+        resources, pages = export_catalog(db, args.out, args.reproducible, args.page_size)
+    print(f'Generated: {args.out} ({directory.resource_count(resources)}, {pages} pages, {db.backend}) '
+          f'in {time.perf_counter() - start:.2f}s')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Generate printable resource directories from public/data/locations.json (GeoJSON FeatureCollection).
+One PDF per category (default) or per neighborhood (spatial grid cell), using the TSA PDF header,
+footer and card styles from generate_tsa_pdfs.py.
+Run from repo root: python scripts/generate_resource_directory.py [--group-by neighborhood] [--near LAT,LON]
+Output: public/documents/resource-directory/
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict, namedtuple
+
+from reportlab.lib.units import inch
+from reportlab.platypus import Spacer, Table, TableStyle
+
+import generate_tsa_pdfs as g
+
+LOCATIONS_PATH = os.path.join(g.REPO_ROOT, 'public', 'data', 'locations.json')
+DIRECTORY_OUT_DIR = os.path.join(g.OUT_DIR, 'resource-directory')
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEG_LAT = 111.32
+ZIP_RE = re.compile(r'\b(\d{5})(?:-\d{4})?\s*$')
+
+Resource = namedtuple('Resource', 'name category address description lat lon')
+
+# Entry card: name | category on top, address and description spanning both columns
+ENTRY_COL_WIDTHS = [4.6 * inch, 2.4 * inch]
+ENTRY_SPANS = TableStyle([
+    ('SPAN', (0, 1), (1, 1)),
+    ('SPAN', (0, 2), (1, 2)),
+    ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+])
+
+
+def load_resources(path=LOCATIONS_PATH):
+    """Point features from a GeoJSON FeatureCollection; features without a Point geometry are skipped."""
+    with open(path, encoding='utf-8') as f:
+        collection = json.load(f)
+    resources = []
+    for feature in collection.get('features', []):
+        geometry = feature.get('geometry') or {}
+        if geometry.get('type') != 'Point':
+            continue
+        lon, lat = geometry['coordinates'][:2]
+        props = feature.get('properties') or {}
+        resources.append(Resource(
+            name=props.get('name', 'Unnamed resource'),
+            category=props.get('category') or 'Uncategorized',
+            address=props.get('address', ''),
+            description=props.get('description', ''),
+            lat=float(lat),
+            lon=float(lon),
+        ))
+    return resources
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class SpatialGrid:
+    """Uniform lat/lon grid of roughly cell_km x cell_km cells, built in one pass.
+
+    Cells double as neighborhoods, and radius queries only visit the cells that can
+    intersect the search circle, so grouping and lookups stay linear in the number of
+    features instead of comparing every pair.
+    """
+
+    def __init__(self, resources, cell_km=2.0):
+        self.cell_km = cell_km
+        ref_lat = sum(r.lat for r in resources) / len(resources) if resources else 0.0
+        self.dlat = cell_km / KM_PER_DEG_LAT
+        self.dlon = cell_km / (KM_PER_DEG_LAT * max(math.cos(math.radians(ref_lat)), 0.01))
+        self.cells = defaultdict(list)
+        for r in resources:
+            self.cells[self.cell_of(r.lat, r.lon)].append(r)
+
+    def cell_of(self, lat, lon):
+        return (math.floor(lat / self.dlat), math.floor(lon / self.dlon))
+
+    def cell_center(self, cell):
+        return ((cell[0] + 0.5) * self.dlat, (cell[1] + 0.5) * self.dlon)
+
+    def within(self, lat, lon, radius_km):
+        """(distance_km, resource) pairs within radius_km of a point, nearest first."""
+        row, col = self.cell_of(lat, lon)
+        reach = int(math.ceil(radius_km / self.cell_km)) + 1
+        # A degree of longitude shrinks with cos(latitude): measure the circle's east-west
+        # extent at its latitude farthest from the equator, not at the grid's reference latitude
+        lat_reach = radius_km / KM_PER_DEG_LAT
+        widest = min(abs(lat) + lat_reach, 90.0)
+        lon_degrees = radius_km / (KM_PER_DEG_LAT * max(math.cos(math.radians(widest)), 0.01))
+        lon_reach = int(math.ceil(lon_degrees / self.dlon)) + 1
+        found = []
+        for i in range(row - reach, row + reach + 1):
+            for j in range(col - lon_reach, col + lon_reach + 1):
+                for r in self.cells.get((i, j), ()):
+                    d = haversine_km(lat, lon, r.lat, r.lon)
+                    if d <= radius_km:
+                        found.append((d, r))
+        found.sort(key=lambda pair: (pair[0], pair[1].name))
+        return found
+
+
+def _zip_code(address):
+    m = ZIP_RE.search(address)
+    return m.group(1) if m else None
+
+
+def group_by_category(resources):
+    groups = defaultdict(list)
+    for r in resources:
+        groups[r.category].append(r)
+    return dict(groups)
+
+
+def group_by_neighborhood(grid):
+    """Grid cell -> resources, labelled by the cell's most common ZIP code and centre point."""
+    groups = {}
+    for cell, members in grid.cells.items():
+        lat, lon = grid.cell_center(cell)
+        zips = Counter(z for z in (_zip_code(r.address) for r in members) if z)
+        area = f'ZIP {zips.most_common(1)[0][0]}' if zips else 'Area'
+        groups[f'{area} near {lat:.3f}, {lon:.3f}'] = members
+    return groups
+
+
+def _slug(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'directory'
+
+
+def unique_slugs(labels):
+    """Label -> file-name slug; labels that slug alike get -2, -3, ... so no file overwrites another."""
+    slugs, seen = {}, Counter()
+    for label in labels:
+        slug = base = _slug(label)
+        while slug in seen:
+            seen[base] += 1
+            slug = f'{base}-{seen[base]}'
+        seen[slug] += 1
+        slugs[label] = slug
+    return slugs
+
+
+def resource_count(count):
+    return f"{count} resource{'' if count == 1 else 's'}"
+
+
+def directory_flowables(entries, styles=None):
+    """One card per (distance_km or None, resource) entry, generated lazily for streaming layout."""
+    styles = styles or g.get_styles()
+    for distance, r in entries:
+        right = r.category if distance is None else f'{r.category} | {distance:.1f} km'
+        card = Table([
+            [g.cell_para(r.name, styles, 'CellHeader'), g.cell_para(right, styles, 'CellMuted')],
+            [g.cell_para(r.address, styles, 'CellMuted'), ''],
+            [g.cell_para(r.description, styles), ''],
+        ], colWidths=ENTRY_COL_WIDTHS)
+        card.setStyle(g.table_style_card())
+        card.setStyle(ENTRY_SPANS)
+        yield card
+        yield Spacer(1, 0.12 * inch)
+
+
+def build_directory(label, entries, out_path, reproducible=False):
+    """Write one directory PDF for a group of (distance_km or None, resource) entries to out_path,
+    a file path or writable binary target (see generate_tsa_pdfs.render_flowables)."""
+    styles = g.get_styles()
+    heading = g.cell_para(label, styles, 'SectionAccent')
+    intro = g.cell_para(resource_count(len(entries)), styles, 'MutedNote')
+
+    def story():
+        yield heading
+        yield intro
+        yield from directory_flowables(entries, styles)
+
+    g.render_flowables(story(), out_path, 'RESOURCE DIRECTORY', f'{label} | Monroe Resource Hub',
+                       {'title': f'Resource Directory: {label}'}, reproducible)
+    return out_path
+
+
+def plan_directories(resources, group_by='category', near=None, radius_km=None, cell_km=2.0):
+    """Group label -> entries sorted by distance from `near` (when given) or by name."""
+    grid = SpatialGrid(resources, cell_km)
+    if near is not None:
+        if radius_km is None:
+            pairs = sorted(((haversine_km(near[0], near[1], r.lat, r.lon), r) for r in resources),
+                           key=lambda pair: (pair[0], pair[1].name))
+        else:
+            pairs = grid.within(near[0], near[1], radius_km)
+        distance = {id(r): d for d, r in pairs}
+        resources = [r for _d, r in pairs]  # nearest first; grouping keeps this order
+    groups = group_by_category(resources) if group_by == 'category' else group_by_neighborhood(grid)
+    plans = {}
+    for label, members in sorted(groups.items()):
+        if near is not None:
+            entries = [(distance[id(r)], r) for r in members if id(r) in distance]
+            entries.sort(key=lambda e: (e[0], e[1].name))  # no-op for category groups, orders grid cells
+        else:
+            entries = [(None, r) for r in sorted(members, key=lambda r: r.name)]
+        if entries:
+            plans[label] = entries
+    return plans
+
+
+def _parse_point(text):
+    try:
+        lat, lon = (float(v) for v in text.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError('expected LAT,LON') from None
+    return lat, lon
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate resource directory PDFs from locations.json.')
+    parser.add_argument('--input', default=LOCATIONS_PATH, help='GeoJSON FeatureCollection (default: public/data/locations.json)')
+    parser.add_argument('--out-dir', default=DIRECTORY_OUT_DIR, help='output folder (default: public/documents/resource-directory)')
+    parser.add_argument('--group-by', choices=('category', 'neighborhood'), default='category')
+    parser.add_argument('--near', type=_parse_point, metavar='LAT,LON', help='sort entries by distance from this point')
+    parser.add_argument('--radius-km', type=float, help='with --near, only include resources within this distance')
+    parser.add_argument('--cell-km', type=float, default=2.0, help='neighborhood grid cell size in km (default: 2)')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    resources = load_resources(args.input)
+    plans = plan_directories(resources, args.group_by, args.near, args.radius_km, args.cell_km)
+    planned = time.perf_counter()
+    slugs = unique_slugs(plans)
+    for label, entries in plans.items():
+        out_path = build_directory(label, entries, os.path.join(args.out_dir, f'{slugs[label]}.pdf'))
+        print(f'Generated: {out_path} ({resource_count(len(entries))})')
+    done = time.perf_counter()
+    print(f'{resource_count(len(resources))} -> {len(plans)} directories '
+          f'(grouping {1000 * (planned - start):.0f} ms, rendering {done - planned:.2f}s)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,585 @@
+#!/usr/bin/env python3
+"""
+Render saved resumes (the `resume_data` JSON of the site's `resumes` table, see lib/ai/gemini.ts)
+as vector PDFs, one per resume and template, laid out with the ReportLab styles and tables of
+generate_tsa_pdfs.py. Text stays selectable and links clickable, and a resume is a few KB.
+Templates match components/resume/TemplateSelector.tsx: modern, classic, creative, minimal.
+Run from repo root: python scripts/generate_resumes.py resumes.jsonl [--template all] [--jobs 4]
+Input: a JSON file (one resume_data object, or a list of rows), a JSONL file of rows
+({"id", "title", "resume_data", optional "template"}), or --db DSN to read the resumes table.
+Output: public/documents/resumes/<id>-<template>.pdf
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import statistics
+import sys
+import time
+import traceback
+from collections import namedtuple
+from datetime import date
+
+from reportlab.lib.colors import HexColor
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, Spacer, Table
+
+import generate_tsa_pdfs as g
+
+RESUME_OUT_DIR = os.path.join(g.OUT_DIR, 'resumes')
+RESUME_MARGIN = 0.75 * inch
+RESUME_WIDTH = letter[0] - 2 * RESUME_MARGIN
+ACCENT_DARK = HexColor('#264E8E')  # primary-600, the web preview's company and rule colour
+CHIP_BG = g.ROW_ALT
+COLUMN_GAP = 0.3 * inch
+TWO_COLUMN_MAX_ENTRIES = 8  # modern: education beside certifications/languages only while short (a row cannot split)
+
+# resume_data with every field present (ResumeBuilder's initialResumeData)
+EMPTY_RESUME = {
+    'personalInfo': {'firstName': '', 'lastName': '', 'email': '', 'phone': '', 'address': '', 'linkedin': '', 'website': ''},
+    'summary': '',
+    'experience': [],
+    'education': [],
+    'skills': [],
+    'certifications': [],
+    'languages': [],
+}
+
+# Per template: header, section heading and entry layout, skills layout, and whether education
+# sits beside certifications/languages (as in ResumePreview's modern template)
+Theme = namedtuple('Theme', 'header heading entry skills two_column accent')
+
+
+class ResumeError(ValueError):
+    """resume_data that cannot be rendered (not an object, unknown template)."""
+
+
+def load_resume(data):
+    """resume_data with missing fields filled in, blank achievements and skills dropped."""
+    if isinstance(data, str):
+        data = json.loads(data)
+    if not isinstance(data, dict):
+        raise ResumeError(f'resume_data must be an object, not {type(data).__name__}')
+    resume = {key: data.get(key) or default for key, default in EMPTY_RESUME.items()}
+    resume['personalInfo'] = dict(EMPTY_RESUME['personalInfo'], **{k: v for k, v in resume['personalInfo'].items() if v})
+    for section in ('experience', 'education', 'certifications', 'languages'):
+        # null fields read as missing ones, so they render as '' rather than 'None'
+        resume[section] = [{k: v for k, v in entry.items() if v is not None} for entry in resume[section]]
+    resume['skills'] = _texts(resume['skills'])
+    resume['experience'] = [dict(exp, achievements=_texts(exp.get('achievements') or [])) for exp in resume['experience']]
+    return resume
+
+
+def _texts(items):
+    """Non-blank items as stripped text (resume_data is user JSON: numbers and nulls turn up in lists,
+    and a lone string or number where a list belongs)."""
+    if not isinstance(items, (list, tuple)):
+        items = [items]
+    return [text for text in (str(item).strip() for item in items if item is not None) if text]
+
+
+def format_date(text):
+    """'2024-06-01' -> 'June 1, 2024' and '2024-06' -> 'June 2024' (as formatDate in lib/utils.ts); other text as is."""
+    match = re.fullmatch(r'(\d{4})-(\d{2})(?:-(\d{2}))?', (text or '').strip())
+    if not match:
+        return text or ''
+    year, month, day = match.groups()
+    try:
+        when = date(int(year), int(month), int(day or 1))
+    except ValueError:
+        return text
+    return f'{when:%B} {when.day}, {when.year}' if day else f'{when:%B} {when.year}'
+
+
+def date_range(start, end, current=False):
+    start, end = format_date(start), 'Present' if current else format_date(end)
+    return f'{start} - {end}' if start and end else start or end
+
+
+def full_name(resume):
+    info = resume['personalInfo']
+    return f"{info['firstName']} {info['lastName']}".strip() or 'Resume'
+
+
+def _link(url, label=None):
+    href = url if re.match(r'[a-z]+:', url) else f'https://{url}'
+    return f'<a href="{g._escape(href).replace(chr(34), "&quot;")}">{g._escape(label or url)}</a>'
+
+
+# --- Styles: one registry per template, built once per process ---
+def build_resume_styles(template):
+    """Paragraph styles for one template (see TEMPLATES), by role."""
+    theme = TEMPLATES[template]
+    body_font, bold_font = 'Helvetica', 'Helvetica-Bold'
+    centered = theme.header == 'centered'
+    name = {
+        'centered': dict(fontName=bold_font, fontSize=24, leading=28, textColor=g.TEXT_DARK, alignment=TA_CENTER),
+        'ruled': dict(fontName=bold_font, fontSize=28, leading=32, textColor=g.TEXT_DARK),
+        'band': dict(fontName=bold_font, fontSize=24, leading=28, textColor=g.WHITE_TEXT),
+        'plain': dict(fontName=body_font, fontSize=20, leading=24, textColor=g.TEXT_DARK),
+    }[theme.header]
+    heading = {
+        'rule': dict(fontName=bold_font, fontSize=13, leading=16, textColor=g.TEXT_DARK),
+        'plain': dict(fontName=bold_font, fontSize=12, leading=15, textColor=g.TEXT_DARK),
+        'bar': dict(fontName=bold_font, fontSize=12, leading=15, textColor=theme.accent),
+        'caps': dict(fontName=body_font, fontSize=9, leading=12, textColor=g.TEXT_MUTED),
+    }[theme.heading]
+    definitions = {
+        'Name': name,
+        'Contact': dict(fontName=body_font, fontSize=9.5, leading=13, alignment=TA_CENTER if centered else 0,
+                        textColor=g.WHITE_TEXT if theme.header == 'band' else g.TEXT_MUTED),
+        'Heading': dict(heading, spaceBefore=14, spaceAfter=6),
+        'Body': dict(fontName=body_font, fontSize=10, leading=14, textColor=g.TEXT_DARK),
+        'Title': dict(fontName=bold_font, fontSize=11.5, leading=14, textColor=g.TEXT_DARK),
+        'Org': dict(fontName=bold_font if theme.heading != 'caps' else body_font, fontSize=10, leading=13, textColor=theme.accent),
+        'Dates': dict(fontName=body_font, fontSize=8.5, leading=14, textColor=g.TEXT_MUTED, alignment=TA_RIGHT),
+        'Note': dict(fontName=body_font, fontSize=9, leading=12, textColor=g.TEXT_MUTED),
+        'Bullet': dict(fontName=body_font, fontSize=9.5, leading=13, textColor=g.TEXT_DARK, leftIndent=12, bulletIndent=2,
+                       spaceBefore=1),
+        'Chips': dict(fontName=bold_font, fontSize=8, leading=17, textColor=g.TEXT_DARK),
+        'Cell': dict(fontName=body_font, fontSize=9.5, leading=13, textColor=g.TEXT_DARK),
+    }
+    return {role: ParagraphStyle(f'Resume{template.title()}{role}', splitLongWords=False, **attrs)
+            for role, attrs in definitions.items()}
+
+
+_RESUME_STYLES = {}
+
+
+def get_resume_styles(template):
+    if template not in _RESUME_STYLES:
+        _RESUME_STYLES[template] = build_resume_styles(template)
+    return _RESUME_STYLES[template]
+
+
+# --- Header layouts ---
+def _contact_lines(info, separator):
+    lines = [separator.join(g._escape(info[key]) for key in ('email', 'phone', 'address') if info[key])]
+    links = [_link(info[key], label) for key, label in (('linkedin', 'LinkedIn'), ('website', 'Website')) if info[key]]
+    if links:
+        lines.append(separator.join(links))
+    return [line for line in lines if line]
+
+
+def _header_centered(resume, styles, theme):
+    return [Paragraph(g._escape(full_name(resume)), styles['Name']),
+            Paragraph('<br/>'.join(_contact_lines(resume['personalInfo'], ' &nbsp;&nbsp; ')), styles['Contact']),
+            Spacer(1, 6)]
+
+
+def _header_ruled(resume, styles, theme):
+    header = Table([[Paragraph(g._escape(full_name(resume)), styles['Name'])],
+                    [Paragraph('<br/>'.join(_contact_lines(resume['personalInfo'], ' &nbsp;|&nbsp; ')), styles['Contact'])]],
+                   colWidths=[RESUME_WIDTH])
+    header.setStyle(g._cached_table_style('resume_ruled_header', lambda: [
+        ('LINEBELOW', (0, -1), (-1, -1), 2, g.BORDER),
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, -1), (-1, -1), 14),
+    ]))
+    return [header, Spacer(1, 4)]
+
+
+def _header_band(resume, styles, theme):
+    band = Table([[Paragraph(g._escape(full_name(resume)), styles['Name'])],
+                  [Paragraph('<br/>'.join(_contact_lines(resume['personalInfo'], ' &nbsp;•&nbsp; ')), styles['Contact'])]],
+                 colWidths=[RESUME_WIDTH])
+    band.setStyle(g._cached_table_style('resume_band_header', lambda: [
+        ('BACKGROUND', (0, 0), (-1, -1), g.PRIMARY_BLUE),
+        ('LINEBELOW', (0, -1), (-1, -1), 4, g.ACCENT_CORAL),
+        ('LEFTPADDING', (0, 0), (-1, -1), 18),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 18),
+        ('TOPPADDING', (0, 0), (0, 0), 16),
+        ('BOTTOMPADDING', (0, -1), (-1, -1), 14),
+    ]))
+    return [band, Spacer(1, 4)]
+
+
+def _header_plain(resume, styles, theme):
+    return [Paragraph(g._escape(full_name(resume)), styles['Name']), Spacer(1, 2),
+            Paragraph('<br/>'.join(_contact_lines(resume['personalInfo'], ' &nbsp;·&nbsp; ')), styles['Contact']),
+            Spacer(1, 10)]
+
+
+HEADERS = {'centered': _header_centered, 'ruled': _header_ruled, 'band': _header_band, 'plain': _header_plain}
+
+
+# --- Section headings ---
+def _heading(text, styles, theme, width=RESUME_WIDTH):
+    if theme.heading == 'caps':
+        return Paragraph(g._escape(' '.join(text.upper())), styles['Heading'])  # letter-spaced capitals
+    if theme.heading == 'plain':
+        return Paragraph(g._escape(text.upper()), styles['Heading'])
+    style = styles['Heading']
+    if theme.heading == 'rule':
+        commands = ('resume_heading_rule', lambda: [
+            ('LINEBELOW', (0, 0), (-1, -1), 2, theme.accent),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+            ('TOPPADDING', (0, 0), (-1, -1), 0),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+        ])
+        table = Table([[Paragraph(g._escape(text.upper()), style)]], colWidths=[width])
+    else:  # bar: coral accent bar to the left, as the TSA card bar
+        commands = ('resume_heading_bar', lambda: [
+            ('BACKGROUND', (0, 0), (0, -1), g.ACCENT_CORAL),
+            ('LEFTPADDING', (0, 0), (0, -1), 0),
+            ('LEFTPADDING', (1, 0), (1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 1),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
+        ])
+        table = Table([['', Paragraph(g._escape(text.upper()), style)]], colWidths=[4, width - 4])
+    table.setStyle(g._cached_table_style(*commands))
+    table.spaceBefore, table.spaceAfter = style.spaceBefore, style.spaceAfter
+    return table
+
+
+# --- Entries (one job, one school) ---
+def _title_row(title, dates, styles, width):
+    """Title left, dates right, on one line while they fit."""
+    row = Table([[Paragraph(title, styles['Title']), Paragraph(g._escape(dates), styles['Dates'])]],
+                colWidths=[width - 1.9 * inch, 1.9 * inch])
+    row.setStyle(g._cached_table_style('resume_title_row', lambda: [
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ]))
+    return row
+
+
+def _entry(parts, theme, width=RESUME_WIDTH):
+    """One entry kept on a page: plain, with an accent bar (classic) or as a card (creative)."""
+    if theme.entry == 'plain':
+        return g.PlannedGroup(parts + [Spacer(1, 8)])
+    if theme.entry == 'bar':
+        table = Table([['', parts]], colWidths=[3, width - 3], splitInRow=1)
+        table.setStyle(g._cached_table_style('resume_entry_bar', lambda: [
+            ('BACKGROUND', (0, 0), (0, -1), theme.accent),
+            ('LEFTPADDING', (0, 0), (0, -1), 0),
+            ('LEFTPADDING', (1, 0), (1, -1), 12),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+            ('TOPPADDING', (0, 0), (-1, -1), 2),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ]))
+    else:
+        table = Table([[parts]], colWidths=[width], splitInRow=1)
+        table.setStyle(g.table_style_card())
+    table.spaceAfter = 8
+    return table
+
+
+def _experience_entry(exp, styles, theme, width=RESUME_WIDTH):
+    inner = width - (15 if theme.entry == 'bar' else 20 if theme.entry == 'card' else 0)
+    parts = [_title_row(g._escape(exp.get('position', '')), date_range(exp.get('startDate'), exp.get('endDate'), exp.get('current')),
+                        styles, inner)]
+    if exp.get('company'):
+        parts.append(Paragraph(g._escape(exp['company']), styles['Org']))
+    if exp.get('description'):
+        parts += [Spacer(1, 2), Paragraph(g._escape(exp['description']), styles['Note'])]
+    parts += [Paragraph(g._escape(item), styles['Bullet'], bulletText='•') for item in exp['achievements']]
+    return _entry(parts, theme, width)
+
+
+def _education_entry(edu, styles, theme, width=RESUME_WIDTH):
+    inner = width - (15 if theme.entry == 'bar' else 20 if theme.entry == 'card' else 0)
+    degree = ' in '.join(part for part in (edu.get('degree'), edu.get('field')) if part)
+    parts = [_title_row(g._escape(degree), date_range(edu.get('startDate'), edu.get('endDate')), styles, inner)]
+    if edu.get('institution'):
+        parts.append(Paragraph(g._escape(edu['institution']), styles['Org']))
+    if edu.get('gpa'):
+        parts.append(Paragraph(f"GPA: {g._escape(edu['gpa'])}", styles['Note']))
+    return _entry(parts, theme, width)
+
+
+# --- Skills ---
+def _skills_chips(skills, styles, theme):
+    chip = f'<font backColor="#{CHIP_BG.hexval()[2:]}">&nbsp; {{}} &nbsp;</font>'
+    return [Paragraph(' &nbsp; '.join(chip.format(g._escape(skill.upper())) for skill in skills), styles['Chips'])]
+
+
+def _skills_grid(skills, styles, theme, columns=3):
+    cells = [Paragraph(g._escape(skill), styles['Cell'], bulletText='•') for skill in skills]
+    rows = [cells[i:i + columns] + [''] * (columns - len(cells[i:i + columns])) for i in range(0, len(cells), columns)]
+    table = Table(rows, colWidths=[RESUME_WIDTH / columns] * columns)
+    table.setStyle(g._cached_table_style('resume_skills_grid', lambda: [
+        ('LEFTPADDING', (0, 0), (-1, -1), 12),
+        ('TOPPADDING', (0, 0), (-1, -1), 1),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
+    ]))
+    return [table]
+
+
+def _skills_inline(skills, styles, theme):
+    return [Paragraph(' · '.join(g._escape(skill) for skill in skills), styles['Body'])]
+
+
+SKILL_LAYOUTS = {'chips': _skills_chips, 'grid': _skills_grid, 'inline': _skills_inline}
+
+
+# --- Sections ---
+def _section(title, parts, styles, theme, width=RESUME_WIDTH):
+    """Heading kept with the first part, so a heading never ends a page."""
+    if not parts:
+        return []
+    return [g.PlannedGroup([_heading(title, styles, theme, width), parts[0]])] + parts[1:]
+
+
+def _certifications(resume, styles):
+    return [Paragraph(f"<b>{g._escape(cert.get('name', ''))}</b><br/>"
+                      f"<font color=\"#{g.TEXT_MUTED.hexval()[2:]}\">{g._escape(', '.join(filter(None, (cert.get('issuer'), format_date(cert.get('date'))))))}</font>",
+                      styles['Cell']) for cert in resume['certifications']]
+
+
+def _languages(resume, styles):
+    if not resume['languages']:
+        return []
+    return [Paragraph(' &nbsp;&nbsp; '.join(f"<b>{g._escape(lang.get('language', ''))}</b> ({g._escape(lang.get('proficiency', ''))})"
+                                            for lang in resume['languages']), styles['Cell'])]
+
+
+def _ungrouped(flowables):
+    """PlannedGroups replaced by their parts: table cells wrap their content without a canvas."""
+    for flowable in flowables:
+        if isinstance(flowable, g.PlannedGroup):
+            yield from _ungrouped(flowable.content)
+        else:
+            yield flowable
+
+
+def _side_by_side(left, right):
+    """Two half-width columns of sections in one table row (modern's education | certifications)."""
+    half = (RESUME_WIDTH - COLUMN_GAP) / 2
+    table = Table([[list(_ungrouped(left)), list(_ungrouped(right))]], colWidths=[half + COLUMN_GAP, half])
+    table.setStyle(g._cached_table_style('resume_columns', lambda: [
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (0, -1), COLUMN_GAP),
+        ('RIGHTPADDING', (1, 0), (1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ]))
+    return [table]
+
+
+def resume_flowables(resume, template='modern'):
+    """Flowables for a normalized resume (see load_resume) in one of TEMPLATES."""
+    if template not in TEMPLATES:
+        raise ResumeError(f"unknown template {template!r} (expected {', '.join(TEMPLATES)})")
+    theme = TEMPLATES[template]
+    styles = get_resume_styles(template)
+    story = HEADERS[theme.header](resume, styles, theme)
+    if resume['summary']:
+        summary = Paragraph(g._escape(resume['summary']), styles['Body'])
+        if theme.entry == 'card':
+            summary = Table([['', summary]], colWidths=[4, RESUME_WIDTH - 4], style=g.table_style_card_bar(), splitInRow=1)
+        story += _section('Professional Summary', [summary], styles, theme)
+    story += _section('Professional Experience', [_experience_entry(exp, styles, theme) for exp in resume['experience']],
+                      styles, theme)
+    skills = SKILL_LAYOUTS[theme.skills](resume['skills'], styles, theme) if resume['skills'] else []
+    if theme.two_column:
+        story += _section('Core Competencies', skills, styles, theme)
+    if (theme.two_column and resume['education'] and (resume['certifications'] or resume['languages'])
+            and len(resume['education']) + len(resume['certifications']) <= TWO_COLUMN_MAX_ENTRIES):
+        half = (RESUME_WIDTH - COLUMN_GAP) / 2
+        education = _section('Education', [_education_entry(edu, styles, theme, half) for edu in resume['education']],
+                             styles, theme, half)
+        extras = (_section('Certifications', _certifications(resume, styles), styles, theme, half)
+                  + _section('Languages', _languages(resume, styles), styles, theme, half))
+        return story + _side_by_side(education, extras)
+    extras = (_section('Certifications', _certifications(resume, styles), styles, theme)
+              + _section('Languages', _languages(resume, styles), styles, theme))
+    story += _section('Education', [_education_entry(edu, styles, theme) for edu in resume['education']], styles, theme)
+    if not theme.two_column:
+        story += _section('Skills', skills, styles, theme)
+    return story + extras
+
+
+# Template id (components/resume/TemplateSelector.tsx) -> layout
+TEMPLATES = {
+    'modern': Theme(header='centered', heading='rule', entry='plain', skills='chips', two_column=True, accent=ACCENT_DARK),
+    'classic': Theme(header='ruled', heading='plain', entry='bar', skills='grid', two_column=False, accent=ACCENT_DARK),
+    'creative': Theme(header='band', heading='bar', entry='card', skills='chips', two_column=False, accent=g.PRIMARY_BLUE),
+    'minimal': Theme(header='plain', heading='caps', entry='plain', skills='inline', two_column=False, accent=g.TEXT_DARK),
+}
+
+
+# --- Rendering ---
+def render_resume(resume, out_path, template='modern', reproducible=False, canvasmaker=None):
+    """Lay out resume_data (raw or normalized) to out_path, a file path or writable binary target
+    (see generate_tsa_pdfs.render_flowables). Returns the doc template (.page is the page count)."""
+    resume = load_resume(resume)
+    story = resume_flowables(resume, template)
+    if isinstance(out_path, (str, os.PathLike)):
+        os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    doc = g.StreamingDocTemplate(out_path, pagesize=letter, leftMargin=RESUME_MARGIN, rightMargin=RESUME_MARGIN,
+                                 topMargin=RESUME_MARGIN, bottomMargin=RESUME_MARGIN,
+                                 invariant=1 if reproducible else None)
+
+    def on_first(canvas, doc):
+        canvas.setTitle(f'{full_name(resume)} Resume')
+        canvas.setAuthor(full_name(resume))
+        canvas.setSubject(f'{template.title()} template')
+        canvas.setPageCompression(1)
+
+    def on_later(canvas, doc):
+        canvas.setPageCompression(1)
+
+    with g._span('stage', 'layout', document=g._target_name(out_path)), g._without_ascii85():
+        doc.build(story, onFirstPage=on_first, onLaterPages=on_later, canvasmaker=canvasmaker or g.Canvas)
+    return doc
+
+
+def render_resume_bytes(resume, template='modern', reproducible=False):
+    sink = g.PdfSink(None, f'{template}.pdf')
+    render_resume(resume, sink, template, reproducible)
+    return sink.getvalue()
+
+
+def iter_resume_rows(path):
+    """Rows {id, title, resume_data, template} from a JSON file (one resume_data object, one row,
+    or a list of rows) or a JSONL file of rows, read lazily; ids default to the row position."""
+    with open(path, encoding='utf-8') as f:
+        if path.lower().endswith(('.jsonl', '.ndjson')):
+            rows = (json.loads(line) for line in f if line.strip())
+        else:
+            data = json.load(f)
+            rows = data if isinstance(data, list) else [data]
+        for number, row in enumerate(rows, 1):
+            if 'resume_data' not in row:  # a bare resume_data object
+                row = {'resume_data': row}
+            yield {'id': str(row.get('id') or number), 'title': row.get('title') or '', 'resume_data': row['resume_data'],
+                   'template': row.get('template')}
+
+
+def _slug(text):
+    return re.sub(r'[^A-Za-z0-9]+', '-', str(text)).strip('-').lower() or 'resume'
+
+
+def _file_stem(resume_id):
+    """File name stem for a resume id: the id itself when it is already a slug, else its slug
+    plus a short hash of the id, so ids that slug alike ('a/b', 'a-b') get distinct files."""
+    resume_id = str(resume_id)
+    slug = _slug(resume_id)
+    if slug == resume_id:
+        return slug
+    return f"{slug}-{hashlib.sha256(resume_id.encode('utf-8')).hexdigest()[:8]}"
+
+
+def render_row(row, out_dir, templates, reproducible=False):
+    """Render one row in each template; one result dict per PDF (id, template, ok, path, bytes,
+    pages, error, seconds)."""
+    results = []
+    for template in templates:
+        path = os.path.join(out_dir, f"{_file_stem(row['id'])}-{template}.pdf")
+        start = time.perf_counter()
+        try:
+            doc = render_resume(row['resume_data'], path, template, reproducible)
+        except Exception:
+            results.append({'id': row['id'], 'template': template, 'ok': False, 'path': None, 'bytes': 0, 'pages': 0,
+                            'error': traceback.format_exc(), 'seconds': time.perf_counter() - start})
+            continue
+        results.append({'id': row['id'], 'template': template, 'ok': True, 'path': path, 'bytes': os.path.getsize(path),
+                        'pages': doc.page, 'error': None, 'seconds': time.perf_counter() - start})
+    return results
+
+
+def _templates_for(row, template):
+    if template == 'all':
+        return list(TEMPLATES)
+    return [template or row.get('template') or 'modern']
+
+
+def render_resumes(rows, out_dir=RESUME_OUT_DIR, template=None, jobs=1, reproducible=False):
+    """Render rows (see iter_resume_rows), serially or on `jobs` processes, yielding result
+    dicts as PDFs finish. `template` overrides each row's own ('all' renders every template)."""
+    os.makedirs(out_dir, exist_ok=True)
+    if jobs <= 1:
+        for row in rows:
+            yield from render_row(row, out_dir, _templates_for(row, template), reproducible)
+        return
+    # Imported here, as in generate_tsa_pdfs: serial runs never need multiprocessing
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    window = jobs * 4
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = set()
+        rows = iter(rows)
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < window:
+                row = next(rows, None)
+                if row is None:
+                    exhausted = True
+                else:
+                    pending.add(pool.submit(render_row, row, out_dir, _templates_for(row, template), reproducible))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render saved resumes as vector PDFs.')
+    parser.add_argument('input', nargs='?', help='JSON (resume_data, a row or a list of rows) or JSONL file of rows')
+    parser.add_argument('--db', metavar='DSN', help='read the resumes table instead (postgresql://..., needs psycopg)')
+    parser.add_argument('--template', choices=[*TEMPLATES, 'all'], help="template for every resume (default: each row's, else modern)")
+    parser.add_argument('--out-dir', default=RESUME_OUT_DIR, help='output folder (default: public/documents/resumes)')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='render in N worker processes (default: 1)')
+    parser.add_argument('--reproducible', action='store_true', help='byte-identical PDFs for identical data')
+    parser.add_argument('--quiet', action='store_true', help='print only the summary, not one line per PDF')
+    args = parser.parse_args(argv)
+    if bool(args.input) == bool(args.db):
+        parser.error('give either an input file or --db')
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    db = None
+    if args.db:
+        import resource_db
+        try:
+            db = resource_db.ResourceDatabase(args.db)
+        except (FileNotFoundError, RuntimeError) as e:
+            parser.error(str(e))
+        rows = ({'id': resume_id, 'title': title, 'resume_data': data, 'template': None}
+                for resume_id, title, data in db.iter_resumes())
+    else:
+        rows = iter_resume_rows(args.input)
+
+    start = time.perf_counter()
+    latencies, sizes, failed = [], [], 0
+    for result in render_resumes(rows, args.out_dir, args.template, args.jobs, args.reproducible):
+        if result['ok']:
+            latencies.append(result['seconds'])
+            sizes.append(result['bytes'])
+            if not args.quiet:
+                print(f"  OK     {result['id']:<20} {result['template']:<9} {result['seconds'] * 1000:7.1f}ms "
+                      f"{result['pages']}p {result['bytes'] / 1024:6.1f} KB  {result['path']}")
+        else:
+            failed += 1
+            print(f"  FAILED {result['id']:<20} {result['template']:<9} {result['seconds'] * 1000:7.1f}ms")
+            print(result['error'], file=sys.stderr)
+    if db is not None:
+        db.close()
+    wall = time.perf_counter() - start
+    if latencies:
+        print(f'Rendered {len(latencies)} resumes ({failed} failed) in {wall:.2f}s: latency p50 '
+              f'{statistics.median(latencies) * 1000:.1f}ms, p95 {_percentile(latencies, 0.95) * 1000:.1f}ms, '
+              f'max {max(latencies) * 1000:.1f}ms; {statistics.mean(sizes) / 1024:.1f} KB average')
+    else:
+        print(f'Rendered 0 resumes ({failed} failed) in {wall:.2f}s')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
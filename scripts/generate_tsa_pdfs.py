@@ -2,21 +2,45 @@
 """
 Generate TSA competition PDFs: student-copyright-checklist.pdf and work-log.pdf.
 Uses ReportLab. Run from repo root: python scripts/generate_tsa_pdfs.py
+Build documents in parallel worker processes: python scripts/generate_tsa_pdfs.py --jobs 4
+Profile a build (Chrome trace-event JSON): python scripts/generate_tsa_pdfs.py --force --profile trace.json
+Byte-identical output for identical inputs: python scripts/generate_tsa_pdfs.py --reproducible
+Documents are declarative specs in scripts/documents/ (JSON, or YAML with PyYAML installed).
 Install: pip install reportlab pillow
 Output: public/documents/
 """
 
+import argparse
+import csv
+import hashlib
+import importlib.util
+import io
+import json
+import math
 import os
+import re
 import sys
+import threading
+import time
+import traceback
+from array import array
+from collections import OrderedDict, namedtuple
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import islice
+from contextlib import contextmanager, nullcontext
+from types import MappingProxyType
 from reportlab.lib.colors import HexColor
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ListStyle, ParagraphStyle
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfbase.ttfonts import TTFont, TTFontFace
+from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Table, TableStyle, Spacer,
-    PageBreak, KeepTogether,
+    PageBreak, Flowable, FrameBreak, Image,
 )
 
 # --- Paths (run from repo root) ---
@@ -53,12 +77,262 @@ FOOTER_LINE_Y = 0.72 * inch  # line position from bottom
 FOOTER_TEXT_Y = 0.42 * inch  # footer text baseline from bottom
 BOTTOM_MARGIN = 1.0 * inch  # content must stay above this
 
+# Incremental builds: fingerprints of each document's inputs are stored next to the output.
+# Bump BUILD_CACHE_VERSION whenever layout code (not data) changes so stale PDFs are rebuilt.
+BUILD_CACHE_VERSION = 6
+MANIFEST_PATH = os.path.join(OUT_DIR, '.build-manifest.json')
+
+
+# Set TSA_PDF_DOWNLOAD_FONTS=1 (or pass --download-fonts) to let a missing script font be fetched once.
+FONT_DOWNLOAD_ENV = 'TSA_PDF_DOWNLOAD_FONTS'
+FONT_DOWNLOAD_URL = 'https://cdn.jsdelivr.net/gh/google/fonts@main/ofl/dancingscript/DancingScript-Regular.ttf'
+FONT_DOWNLOAD_TIMEOUT = 10  # seconds
+# Resolved font paths, reused across processes (git-ignored)
+FONT_CACHE_DIR = os.path.join(REPO_ROOT, 'scripts', 'fonts', '.cache')
+FONT_CACHE_INDEX = os.path.join(FONT_CACHE_DIR, 'resolved.json')
+# Resized, re-encoded copies of images embedded in PDFs, named by source hash, size and format (git-ignored)
+IMAGE_CACHE_DIR = os.path.join(REPO_ROOT, 'scripts', '.image-cache')
+IMAGE_CACHE_INDEX = os.path.join(IMAGE_CACHE_DIR, 'sources.json')
+IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # least recently used derivatives are deleted beyond this
+IMAGE_SIZES = (256, 512, 1024, 2048)  # px, max dimension; image blocks use the smallest that covers IMAGE_DPI
+IMAGE_DPI = 150
+IMAGE_JPEG_QUALITY = 85
+IMAGE_JOBS = 4  # threads generating derivatives (Pillow releases the GIL while decoding and encoding)
+OPT_LOGO_SIZE = 256  # px, max dimension (plenty for a small PDF icon)
+
+
+# --- Instrumentation (--profile): off unless a Profiler is active, then every hook is one global check ---
+_PROFILER = None
+_NO_SPAN = nullcontext()
+
+
+class _Span:
+    __slots__ = ('profiler', 'category', 'name', 'args', 'start', 'peak')
+
+    def __init__(self, profiler, category, name, args):
+        self.profiler, self.category, self.name, self.args = profiler, category, name, args
+        self.peak = 0
+
+    def __enter__(self):
+        self.profiler._note_peak()
+        self.profiler._open.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.profiler._note_peak()
+        self.profiler._open.remove(self)  # tracks interleave (a flowable can span a page break)
+        self.profiler._record(self, end)
+        return False
+
+
+class Profiler:
+    """Wall time, call counts and (with memory=True, via tracemalloc) peak memory per stage,
+    page and flowable type of the documents built while it is active; see profile().
+
+    Each category is its own track in the Chrome trace (chrome://tracing, ui.perfetto.dev).
+    Paragraph parsing and block rendering happen in tiny interleaved steps, so they are
+    only totalled, not traced event by event.
+    """
+
+    TRACKS = {'stage': 1, 'page': 2, 'flowable': 3}
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.events = []
+        self.totals = {}  # (category, name) -> [calls, seconds, peak bytes]
+        self._open = []
+        self._t0 = time.perf_counter()
+        if memory:
+            import tracemalloc
+            self._tracemalloc = tracemalloc
+            tracemalloc.start()
+
+    def span(self, category, name, args=None):
+        return _Span(self, category, name, args)
+
+    def add(self, category, name, seconds, calls=1, peak=0):
+        entry = self.totals.setdefault((category, name), [0, 0.0, 0])
+        entry[0] += calls
+        entry[1] += seconds
+        entry[2] = max(entry[2], peak)
+
+    def _note_peak(self):
+        # Every open span sees the peak since the last note, so nested spans report correctly
+        if self.memory:
+            peak = self._tracemalloc.get_traced_memory()[1]
+            for span in self._open:
+                span.peak = max(span.peak, peak)
+            self._tracemalloc.reset_peak()
+
+    def _record(self, span, end):
+        self.add(span.category, span.name, end - span.start, peak=span.peak)
+        args = dict(span.args or {})
+        if self.memory:
+            args['peak_kb'] = round(span.peak / 1024)
+        self.events.append({
+            'name': span.name, 'cat': span.category, 'ph': 'X', 'pid': os.getpid(),
+            'tid': self.TRACKS.get(span.category, 0), 'args': args,
+            'ts': round((span.start - self._t0) * 1e6, 1), 'dur': round((end - span.start) * 1e6, 1),
+        })
+
+    def close(self):
+        if self.memory and self._tracemalloc.is_tracing():
+            self._tracemalloc.stop()
+
+    def summary(self):
+        """{category: {name: {calls, total_ms, mean_ms[, peak_kb]}}}, slowest first."""
+        out = {}
+        for (category, name), (calls, seconds, peak) in sorted(self.totals.items(), key=lambda kv: -kv[1][1]):
+            entry = {'calls': calls, 'total_ms': round(seconds * 1000, 3),
+                     'mean_ms': round(seconds * 1000 / calls, 3) if calls else 0.0}
+            if self.memory and category in self.TRACKS:
+                entry['peak_kb'] = round(peak / 1024)
+            out.setdefault(category, {})[name] = entry
+        return out
+
+    def write(self, path):
+        """Chrome trace-event JSON; the per-name totals are under otherData.summary."""
+        names = [{'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid, 'args': {'name': category}}
+                 for category, tid in self.TRACKS.items()]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': names + self.events, 'displayTimeUnit': 'ms',
+                       'otherData': {'summary': self.summary()}}, f)
+
+    def report(self, top=8, file=None):
+        for category, entries in self.summary().items():
+            print(f'{category}:', file=file)
+            for name, entry in list(entries.items())[:top]:
+                peak = f"  peak {entry['peak_kb']} KB" if 'peak_kb' in entry else ''
+                print(f"  {name:<36} {entry['calls']:>7} calls {entry['total_ms']:>10.1f} ms{peak}", file=file)
+
+
+@contextmanager
+def profile(memory=False):
+    """Profile every build inside the block: `with profile() as prof: build_document('work-log')`,
+    then prof.summary(), prof.report() or prof.write('trace.json')."""
+    global _PROFILER
+    profiler = Profiler(memory)
+    previous, _PROFILER = _PROFILER, profiler
+    try:
+        yield profiler
+    finally:
+        _PROFILER = previous
+        profiler.close()
+
+
+def _span(category, name, **args):
+    return _PROFILER.span(category, name, args) if _PROFILER is not None else _NO_SPAN
+
+
+def _timed_block(render, block, styles, spec):
+    """A block's flowables, passed through while totalling the time spent producing them."""
+    start = time.perf_counter()
+    iterator = iter(render(block, styles, spec))
+    seconds = time.perf_counter() - start
+    while True:
+        start = time.perf_counter()
+        try:
+            flowable = next(iterator)
+        except StopIteration:
+            _PROFILER.add('block', block['type'], seconds + time.perf_counter() - start)
+            return
+        seconds += time.perf_counter() - start
+        yield flowable
+
+
+def _download_signature_font(dest):
+    """Fetch Dancing Script into scripts/fonts; only called when downloads are opted in."""
+    import urllib.request
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    tmp_path = dest + '.part'
+    with urllib.request.urlopen(FONT_DOWNLOAD_URL, timeout=FONT_DOWNLOAD_TIMEOUT) as resp, open(tmp_path, 'wb') as f:
+        f.write(resp.read())
+    os.replace(tmp_path, dest)
+
+
+def _load_font_index():
+    try:
+        with open(FONT_CACHE_INDEX, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_font_index(index):
+    try:
+        os.makedirs(FONT_CACHE_DIR, exist_ok=True)
+        tmp_path = FONT_CACHE_INDEX + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, FONT_CACHE_INDEX)
+    except OSError:
+        pass  # the cache is an optimization; a read-only checkout still builds
+
+
+def _stat_key(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _stub_name_table(postscript_name):
+    """TrueType 'name' table with only the PostScript name (format 0, one Windows record)."""
+    import struct
+    text = postscript_name.encode('utf-16-be')
+    return struct.pack('>HHH', 0, 1, 18) + struct.pack('>HHHHHH', 3, 1, 0x409, 6, len(text), 0) + text
+
+
+class SlimTTFontFace(TTFontFace):
+    """TTFontFace whose embedded subsets carry a stub 'name' table.
+
+    ReportLab already embeds only the glyphs a document uses, but copies the font's full
+    'name' table (often kilobytes of license text) into every subset. PDF viewers do not
+    need it for embedded TrueType (ISO 32000-1, 9.9), so subsets keep just the PostScript name.
+    """
+
+    _subsetting = False
+
+    def get_table(self, tag):
+        if tag == 'name' and self._subsetting:
+            return _stub_name_table(self.name.decode('latin-1') if isinstance(self.name, bytes) else str(self.name))
+        return TTFontFace.get_table(self, tag)
+
+    def makeSubset(self, subset):
+        self._subsetting = True
+        try:
+            return TTFontFace.makeSubset(self, subset)
+        finally:
+            self._subsetting = False
+
+
+def load_ttfont(name, path):
+    """TTFont for `path` (through ReportLab's public constructor) whose subsets carry a stub
+    'name' table. Parsing a TTF takes milliseconds, so only its resolved path is cached."""
+    with open(path, 'rb') as f:
+        font = TTFont(name, io.BytesIO(f.read()))
+    font.face.__class__ = SlimTTFontFace
+    return font
+
 
 def _register_cursive_font():
-    """Register a cursive/script TTF for signatures; return font name or fallback."""
+    """Register a cursive/script TTF for signatures; return (font name, TTF path) or the fallback with no path.
+
+    Offline-first: only local files are searched unless TSA_PDF_DOWNLOAD_FONTS=1. The resolved
+    path is remembered in FONT_CACHE_INDEX, so later processes check one file instead of searching.
+    """
     script_font_name = 'SignatureScript'
     fonts_dir = os.path.join(REPO_ROOT, 'scripts', 'fonts')
     local_ttf = os.path.join(fonts_dir, 'DancingScript-Regular.ttf')
+    index = _load_font_index()
+    cached = index.get(script_font_name)
+    if cached:
+        try:
+            if _stat_key(cached['path']) == cached['stat']:
+                pdfmetrics.registerFont(load_ttfont(script_font_name, cached['path']))
+                return script_font_name, cached['path']
+        except Exception:
+            pass  # moved, changed or unreadable: search again
     search_paths = [
         local_ttf,
         os.path.join(fonts_dir, 'Script.ttf'),
@@ -67,51 +341,231 @@ def _register_cursive_font():
         '/usr/share/fonts/truetype/google-dancing-script/DancingScript-Regular.ttf',
         os.path.expanduser('~/Library/Fonts/Dancing Script.ttf'),
     ]
-    # Try to download Dancing Script if not present
-    if not os.path.isfile(local_ttf):
+    found = [path for path in search_paths if os.path.isfile(path)]
+    if not found and os.environ.get(FONT_DOWNLOAD_ENV) == '1':
+        try:
+            _download_signature_font(local_ttf)
+            found = [local_ttf]
+        except Exception as e:
+            print(f'Font download failed: {e}', file=sys.stderr)
+    for path in found:
         try:
-            import urllib.request
-            os.makedirs(fonts_dir, exist_ok=True)
-            url = 'https://github.com/google/fonts/raw/main/ofl/dancingscript/DancingScript%5Bwght%5D.ttf'
-            # Use static Regular variant from jsDelivr
-            url = 'https://cdn.jsdelivr.net/gh/google/fonts@main/ofl/dancingscript/DancingScript-Regular.ttf'
-            urllib.request.urlretrieve(url, local_ttf)
+            pdfmetrics.registerFont(load_ttfont(script_font_name, path))
         except Exception:
-            pass
-    for path in search_paths:
-        if path and os.path.isfile(path):
-            try:
-                pdfmetrics.registerFont(TTFont(script_font_name, path))
-                return script_font_name
-            except Exception:
-                continue
+            continue
+        index[script_font_name] = {'path': path, 'stat': _stat_key(path)}
+        _save_font_index(index)
+        return script_font_name, path
     # Fallback: Helvetica-BoldOblique (not cursive but script-like)
-    return 'Helvetica-BoldOblique'
+    return 'Helvetica-BoldOblique', None
 
 
-SIGNATURE_FONT = _register_cursive_font()
-if SIGNATURE_FONT == 'Helvetica-BoldOblique':
-    print('Note: No cursive TTF found. Add scripts/fonts/DancingScript-Regular.ttf for signature style.', file=sys.stderr)
+def _file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
 
 
-from PIL import Image
+# --- Image derivative cache ---
+_IMAGE_SOURCES = None  # source path -> {'stat', 'sha256', 'alpha'}, loaded from IMAGE_CACHE_INDEX once per process
+_IMAGE_PATHS = {}  # (source path, stat, size, format) -> derivative path, for this process
 
-def _get_optimized_logo():
-    """Create a smaller version of the logo for PDF embedding to save space."""
-    opt_logo_path = os.path.join(OUT_DIR, 'logo_opt.png')
-    if os.path.exists(LOGO_PATH):
+
+def _load_image_index():
+    global _IMAGE_SOURCES
+    if _IMAGE_SOURCES is None:
         try:
-            os.makedirs(OUT_DIR, exist_ok=True)
-            with Image.open(LOGO_PATH) as img:
-                # Resize to 256px max dimension (plenty for a small PDF icon)
-                img.thumbnail((256, 256))
-                img.save(opt_logo_path, optimize=True)
-            return opt_logo_path
+            with open(IMAGE_CACHE_INDEX, encoding='utf-8') as f:
+                _IMAGE_SOURCES = json.load(f)
+        except (OSError, ValueError):
+            _IMAGE_SOURCES = {}
+    return _IMAGE_SOURCES
+
+
+def _save_image_index():
+    try:
+        os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+        tmp_path = f'{IMAGE_CACHE_INDEX}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(_IMAGE_SOURCES, f, indent=2)
+        os.replace(tmp_path, IMAGE_CACHE_INDEX)
+    except OSError:
+        pass  # the cache is an optimization; a read-only checkout still builds
+
+
+def _image_source(path):
+    """Hash and alpha flag of a source image; re-read only when its mtime or size changed."""
+    from PIL import Image as PILImage
+    index = _load_image_index()
+    stat = _stat_key(path)
+    entry = index.get(path)
+    if entry is None or entry['stat'] != stat or 'size' not in entry:
+        with PILImage.open(path) as img:
+            alpha = img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info
+            size = list(img.size)
+        entry = index[path] = {'stat': stat, 'sha256': _file_sha256(path), 'alpha': alpha, 'size': size}
+        _save_image_index()
+    return entry
+
+
+def _derivative_path(source, size, fmt):
+    """Cache path for (source, size, format); format 'auto' is PNG for images with transparency, else JPEG."""
+    entry = _image_source(source)
+    if fmt == 'auto':
+        fmt = 'PNG' if entry['alpha'] else 'JPEG'
+    ext = 'png' if fmt.upper() == 'PNG' else 'jpg'
+    return os.path.join(IMAGE_CACHE_DIR, f"{entry['sha256'][:32]}-{size}.{ext}")
+
+
+def _make_derivative(source, size, path):
+    """Write source scaled to fit size x size (never enlarged) to path, atomically."""
+    from PIL import Image as PILImage
+    with PILImage.open(source) as img:
+        img.thumbnail((size, size))
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        if path.endswith('.jpg'):
+            if img.mode not in ('RGB', 'L'):
+                flat = PILImage.new('RGB', img.size, 'white')
+                flat.paste(img, mask=img.convert('RGBA').getchannel('A'))
+                img = flat
+            img.save(tmp_path, 'JPEG', quality=IMAGE_JPEG_QUALITY, optimize=True, progressive=True)
+        else:
+            img.save(tmp_path, 'PNG', optimize=True)
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+def image_derivatives(requests, jobs=IMAGE_JOBS):
+    """Cached derivative paths for (source path, max px, format) requests, format 'PNG', 'JPEG'
+    or 'auto'. Missing derivatives are generated on `jobs` threads; a cached one costs a stat
+    (and its mtime is touched, for LRU eviction). Falls back to the source path for an image
+    that cannot be read."""
+    paths, missing = [], {}
+    for source, size, fmt in requests:
+        source = os.path.abspath(source)
+        key = None
+        try:
+            key = (source, tuple(_stat_key(source)), size, fmt)
+            path = _IMAGE_PATHS.get(key)
+            if path is None:
+                path = _derivative_path(source, size, fmt)
+                if os.path.exists(path):
+                    os.utime(path)
+                else:
+                    missing[path] = (source, size)
         except Exception as e:
-            print(f"Logo optimization failed: {e}")
-    return LOGO_PATH
+            print(f'Image {source} could not be read: {e}', file=sys.stderr)
+            path = source
+        if key is not None:
+            _IMAGE_PATHS[key] = path
+        paths.append(path)
+    if missing:
+        from concurrent.futures import ThreadPoolExecutor
+        os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+        with _span('stage', 'images', derivatives=len(missing)), ThreadPoolExecutor(max_workers=min(jobs, len(missing))) as pool:
+            written = list(pool.map(lambda item: _make_derivative(item[1][0], item[1][1], item[0]), missing.items()))
+        if sum(written):
+            evict_image_cache(keep=set(missing))
+    return paths
+
+
+def image_derivative(source, size, fmt='auto'):
+    """Path of `source` scaled to fit size x size px, from the derivative cache (see image_derivatives)."""
+    return image_derivatives([(source, size, fmt)])[0]
+
+
+def evict_image_cache(max_bytes=IMAGE_CACHE_MAX_BYTES, keep=()):
+    """Delete least recently used derivatives until the cache is under max_bytes; returns bytes freed."""
+    try:
+        names = [name for name in os.listdir(IMAGE_CACHE_DIR) if name.endswith(('.png', '.jpg'))]
+    except OSError:
+        return 0
+    files = []
+    for name in names:
+        path = os.path.join(IMAGE_CACHE_DIR, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        files.append((st.st_mtime_ns, st.st_size, path))
+    total = sum(size for _, size, _ in files)
+    freed = 0
+    for _, size, path in sorted(files):
+        if total - freed <= max_bytes:
+            break
+        if path in keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        freed += size
+    if freed:
+        stale = [key for key, path in _IMAGE_PATHS.items() if not os.path.exists(path)]
+        for key in stale:
+            del _IMAGE_PATHS[key]
+    return freed
+
+
+def image_size(source):
+    """(width, height) in px of a source image, from the cache index when it is unchanged."""
+    return tuple(_image_source(os.path.abspath(source))['size'])
+
+
+def _derivative_size(source, width, height, dpi=IMAGE_DPI):
+    """Smallest IMAGE_SIZES entry covering a width x height pt box at dpi (capped at the source size)."""
+    needed = min(max(width, height) / inch * dpi, max(image_size(source)))
+    return next((size for size in IMAGE_SIZES if size >= needed), IMAGE_SIZES[-1])
+
+
+def _image_bytes(path):
+    """In-memory copy of an image file for drawing. ReportLab names an image drawn from a path
+    by a digest of that path, so drawing from the bytes keeps --reproducible output independent
+    of where the repo is checked out."""
+    with open(path, 'rb') as f:
+        return io.BytesIO(f.read())
+
+
+def _get_optimized_logo():
+    """Logo thumbnail for PDF embedding, from the image derivative cache (the source logo if it is missing)."""
+    if not os.path.exists(LOGO_PATH):
+        return LOGO_PATH
+    return image_derivative(LOGO_PATH, OPT_LOGO_SIZE, 'PNG')
+
+
+# Lazily initialized on first use (see get_signature_font / get_logo_path); importing is side-effect free
+SIGNATURE_FONT = None
+SIGNATURE_FONT_PATH = None
+OPT_LOGO = None
+
+
+def get_signature_font():
+    """Name of the signature font, registered with ReportLab on first call."""
+    global SIGNATURE_FONT, SIGNATURE_FONT_PATH
+    if SIGNATURE_FONT is None:
+        with _span('stage', 'fonts'):
+            SIGNATURE_FONT, SIGNATURE_FONT_PATH = _register_cursive_font()
+        if SIGNATURE_FONT == 'Helvetica-BoldOblique':
+            print('Note: No cursive TTF found. Add scripts/fonts/DancingScript-Regular.ttf for signature style.', file=sys.stderr)
+    return SIGNATURE_FONT
+
+
+def get_logo_path():
+    """Path of the logo to embed (optimized thumbnail when available), resolved on first call."""
+    global OPT_LOGO
+    if OPT_LOGO is None:
+        with _span('stage', 'logo'):
+            OPT_LOGO = _get_optimized_logo()
+    return OPT_LOGO
+
+
+def init_resources():
+    """Register the signature font and optimize the logo once per process (idempotent)."""
+    get_signature_font()
+    get_logo_path()
 
-OPT_LOGO = _get_optimized_logo()
 
 def draw_white_background(canvas, _doc):
     """Draw full-page white background and enable compression."""
@@ -127,9 +581,10 @@ def draw_header(canvas, _doc, title_text, subtitle_text='Monroe Resource Hub | C
     canvas.saveState()
     page_w, page_h = letter[0], letter[1]
     # Logo at left
-    logo_to_use = OPT_LOGO if os.path.exists(OPT_LOGO) else LOGO_PATH
+    opt_logo = get_logo_path()
+    logo_to_use = opt_logo if os.path.exists(opt_logo) else LOGO_PATH
     if os.path.exists(logo_to_use):
-        canvas.drawImage(logo_to_use, MARGIN, page_h - MARGIN - LOGO_SIZE, width=LOGO_SIZE, height=LOGO_SIZE, preserveAspectRatio=True, mask='auto')
+        canvas.drawImage(ImageReader(_image_bytes(logo_to_use)), MARGIN, page_h - MARGIN - LOGO_SIZE, width=LOGO_SIZE, height=LOGO_SIZE, preserveAspectRatio=True, mask='auto')
     # Title to the right of logo (dark text on white)
     canvas.setFillColor(TEXT_DARK)
     canvas.setFont('Helvetica-Bold', 19)
@@ -149,16 +604,28 @@ def draw_header(canvas, _doc, title_text, subtitle_text='Monroe Resource Hub | C
     canvas.restoreState()
 
 
+CHROME_FORM = 'TSAPageChrome'
+
+
+def draw_page_chrome(canvas, doc, title, subtitle):
+    """Header and footer as one form XObject, drawn on the first page and referenced by
+    every later one, so the logo is read and embedded once per document. (No background
+    fill: PDF pages are already white, so painting them only adds content.)"""
+    if not canvas.hasForm(CHROME_FORM):
+        canvas.setPageCompression(1)  # Enable PDF compression (the form inherits it)
+        canvas.beginForm(CHROME_FORM)
+        draw_header(canvas, doc, title, subtitle)
+        _draw_footer(canvas, doc)
+        canvas.endForm()
+    canvas.doForm(CHROME_FORM)
+
+
 def first_page_cb(canvas, doc, title, subtitle):
-    draw_white_background(canvas, doc)
-    draw_header(canvas, doc, title, subtitle)
-    _draw_footer(canvas, doc)
+    draw_page_chrome(canvas, doc, title, subtitle)
 
 
 def later_pages_cb(canvas, doc, title, subtitle):
-    draw_white_background(canvas, doc)
-    draw_header(canvas, doc, title, subtitle)
-    _draw_footer(canvas, doc)
+    draw_page_chrome(canvas, doc, title, subtitle)
 
 
 def _draw_footer(canvas, doc):
@@ -242,14 +709,14 @@ def build_styles():
     ))
     styles.add(ParagraphStyle(
         name='Signature',
-        fontName=SIGNATURE_FONT,
+        fontName=get_signature_font(),
         fontSize=12,
         textColor=PRIMARY_BLUE,
         spaceAfter=0,
     ))
     styles.add(ParagraphStyle(
         name='SignatureTeal',
-        fontName=SIGNATURE_FONT,
+        fontName=get_signature_font(),
         fontSize=12,
         textColor=PRIMARY_BLUE,
         spaceAfter=0,
@@ -269,12 +736,87 @@ def build_styles():
         spaceAfter=6,
         leftIndent=0,
     ))
+    # Document-engine block styles (section headings, notes, card bodies, work-log phases)
+    styles.add(ParagraphStyle(name='SectionAccent', fontName='Helvetica-Bold', fontSize=11, textColor=CIVIC_GOLD, spaceAfter=6))
+    styles.add(ParagraphStyle(name='SectionHeading', fontName='Helvetica-Bold', fontSize=12, textColor=TEXT_DARK, spaceAfter=10))
+    styles.add(ParagraphStyle(name='ItalicNote', fontName='Helvetica-Oblique', fontSize=9, textColor=TEXT_MUTED, spaceAfter=12))
+    styles.add(ParagraphStyle(name='MutedNote', fontName='Helvetica', fontSize=9, textColor=TEXT_MUTED, spaceAfter=12))
+    styles.add(ParagraphStyle(name='PlainBody', fontName='Helvetica', fontSize=10, textColor=TEXT_DARK, spaceAfter=10, splitLongWords=False))
+    styles.add(ParagraphStyle(name='CardBody', fontName='Helvetica', fontSize=10, textColor=TEXT_DARK, leftIndent=12, spaceAfter=0,
+                              backColor=CARD_BG, leading=12, splitLongWords=False))
+    styles.add(ParagraphStyle(name='PhaseMeta', fontName='Helvetica', fontSize=9, textColor=TEXT_MUTED, spaceAfter=6))
+    styles.add(ParagraphStyle(name='PhaseTasks', fontName='Helvetica', fontSize=9, textColor=TEXT_DARK, leftIndent=12, spaceAfter=4))
+    styles.add(ParagraphStyle(name='PhaseOutcome', fontName='Helvetica-Oblique', fontSize=10, textColor=CIVIC_GREEN, spaceAfter=12))
     return styles
 
 
+class _ReadOnlyStyle:
+    """Style whose attributes cannot be assigned: the registry's styles are shared by every
+    document in the process, so one builder's change would leak into the others."""
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'shared style {self.name!r} is read-only; use style.clone(name, {name}=...)')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'shared style {self.name!r} is read-only')
+
+    def clone(self, name, parent=None, **kwds):
+        """A mutable copy (of the plain style class), with kwds applied."""
+        style = self._mutable_class.__new__(self._mutable_class)
+        style.__dict__.update(self.__dict__)
+        style.name, style.parent = name, parent or self
+        style._setKwds(**kwds)
+        return style
+
+
+class FrozenParagraphStyle(_ReadOnlyStyle, ParagraphStyle):
+    _mutable_class = ParagraphStyle
+
+
+class FrozenListStyle(_ReadOnlyStyle, ListStyle):
+    _mutable_class = ListStyle
+
+
+_FROZEN_STYLE_CLASSES = {ParagraphStyle: FrozenParagraphStyle, ListStyle: FrozenListStyle}
+
+
+def _frozen_style(style):
+    frozen = object.__new__(_FROZEN_STYLE_CLASSES[type(style)])
+    frozen.__dict__.update(style.__dict__)
+    return frozen
+
+
+_STYLE_REGISTRY = None
+
+
+def get_styles():
+    """Shared, read-only style registry (name -> style), built once per process.
+
+    Builders look styles up here instead of calling build_styles() per document. Both the
+    mapping and the styles in it are read-only (assigning an attribute raises AttributeError);
+    derive a variant with style.clone(name, fontSize=...).
+    """
+    global _STYLE_REGISTRY
+    if _STYLE_REGISTRY is None:
+        _STYLE_REGISTRY = MappingProxyType({name: _frozen_style(style) for name, style in build_styles().byName.items()})
+    return _STYLE_REGISTRY
+
+
+# TableStyles are only read by Table.setStyle(), so one instance is shared by every table.
+# Never .add() to a returned style; pass a second TableStyle to setStyle() instead.
+_TABLE_STYLES = {}
+
+
+def _cached_table_style(key, commands):
+    style = _TABLE_STYLES.get(key)
+    if style is None:
+        style = _TABLE_STYLES[key] = TableStyle(commands())
+    return style
+
+
 def table_style_card(bg=CARD_BG):
     """Table style with padding so borders/lines do not cover text."""
-    return TableStyle([
+    return _cached_table_style(('card', bg.hexval()), lambda: [
         ('BACKGROUND', (0, 0), (-1, -1), bg),
         ('TEXTCOLOR', (0, 0), (-1, -1), TEXT_DARK),
         ('GRID', (0, 0), (-1, -1), 0.5, BORDER),
@@ -286,126 +828,9 @@ def table_style_card(bg=CARD_BG):
     ])
 
 
-def _escape(s):
-    return str(s).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-
-
-def cell_para(text, styles, style_name='Cell'):
-    """Wrap text in a Paragraph so it wraps inside table cells and fits the box."""
-    return Paragraph(_escape(text), styles[style_name])
-
-
-def build_student_copyright_checklist():
-    out_path = os.path.join(OUT_DIR, 'student-copyright-checklist.pdf')
-    os.makedirs(OUT_DIR, exist_ok=True)
-
-    doc = SimpleDocTemplate(
-        out_path,
-        pagesize=letter,
-        leftMargin=MARGIN,
-        rightMargin=MARGIN,
-        topMargin=HEADER_HEIGHT + 0.25 * inch,
-        bottomMargin=BOTTOM_MARGIN,
-    )
-    styles = build_styles()
-    story = []
-
-    # Meta info grid (4 columns) — Paragraphs so text fits in cells
-    meta_data = [
-        [cell_para('PROJECT:', styles, 'CellMuted'), cell_para('Monroe Resource Hub', styles),
-         cell_para('SCHOOL:', styles, 'CellMuted'), cell_para('Central Academy of Technology and Arts', styles)],
-        [cell_para('ORGANIZATION:', styles, 'CellMuted'), cell_para('TSA', styles),
-         cell_para('DATE:', styles, 'CellMuted'), cell_para('01/15/2026', styles)],
-    ]
-    meta_table = Table(meta_data, colWidths=[1.3 * inch, 2.2 * inch, 1.3 * inch, 2.2 * inch])
-    meta_table.setStyle(table_style_card())
-    story.append(meta_table)
-    story.append(Spacer(1, 0.2 * inch))
-
-    # Italic note
-    story.append(Paragraph(
-        '<i>Use of copyrighted material without proper permission may result in disqualification.</i>',
-        ParagraphStyle('ItalicNote', fontName='Helvetica-Oblique', fontSize=9, textColor=TEXT_MUTED, spaceAfter=12)
-    ))
-    story.append(Spacer(1, 0.2 * inch))
-
-    # Section 1 - Images (all cells as Paragraphs so text fits and wraps)
-    story.append(Paragraph('1. Images', ParagraphStyle('Sect', fontName='Helvetica-Bold', fontSize=11, textColor=CIVIC_GOLD, spaceAfter=6)))
-    sect1_data = [
-        [cell_para('Image Description', styles, 'CellHeader'), cell_para('Source', styles, 'CellHeader'),
-         cell_para('License/Permission', styles, 'CellHeader'), cell_para('Location Used', styles, 'CellHeader')],
-        [cell_para('Unsplash Stock Photos', styles), cell_para('Unsplash.com', styles),
-         cell_para('Unsplash License (Free Use)', styles), cell_para('Hero sections, featured content', styles)],
-        [cell_para('Custom Logo Design', styles), cell_para('Original Design', styles),
-         cell_para('N/A - Original Work', styles), cell_para('Website branding, navigation', styles)],
-        [cell_para('Community Images', styles), cell_para('Original Photos', styles),
-         cell_para('N/A - Original Work', styles), cell_para('Various pages', styles)],
-    ]
-    t1 = Table(sect1_data, colWidths=[1.5 * inch, 1.4 * inch, 1.9 * inch, 1.5 * inch])
-    t1.setStyle(table_style_card())
-    t1.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), CIVIC_NAVY),
-        ('TEXTCOLOR', (0, 0), (-1, 0), WHITE_TEXT),
-    ]))
-    story.append(t1)
-    story.append(Spacer(1, 0.3 * inch))
-
-    # Section 2 - Text Content
-    story.append(Paragraph('2. Text Content', ParagraphStyle('Sect', fontName='Helvetica-Bold', fontSize=11, textColor=CIVIC_GOLD, spaceAfter=6)))
-    sect2_data = [
-        [cell_para('Image Description', styles, 'CellHeader'), cell_para('Source', styles, 'CellHeader'),
-         cell_para('License/Permission', styles, 'CellHeader'), cell_para('Location Used', styles, 'CellHeader')],
-        [cell_para('Community Resource Information', styles), cell_para('Monroe Community Organizations / City Government', styles),
-         cell_para('Public Information / Public Domain', styles), cell_para('Resource directory listings', styles)],
-        [cell_para('All Website Content', styles), cell_para('Original Writing by Student Team', styles),
-         cell_para('N/A - Original Work', styles), cell_para('Entire website', styles)],
-    ]
-    t2 = Table(sect2_data, colWidths=[1.6 * inch, 2.1 * inch, 1.6 * inch, 1.5 * inch])
-    t2.setStyle(table_style_card())
-    t2.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), CIVIC_NAVY),
-        ('TEXTCOLOR', (0, 0), (-1, 0), WHITE_TEXT),
-    ]))
-    story.append(t2)
-    story.append(Spacer(1, 0.3 * inch))
-
-    # Section 3 - Code and Libraries
-    story.append(Paragraph('3. Code and Libraries', ParagraphStyle('Sect', fontName='Helvetica-Bold', fontSize=11, textColor=CIVIC_GOLD, spaceAfter=6)))
-    sect3_rows = [
-        [cell_para('Library/Framework', styles, 'CellHeader'), cell_para('Version', styles, 'CellHeader'),
-         cell_para('License', styles, 'CellHeader'), cell_para('Usage', styles, 'CellHeader')],
-        [cell_para('Next.js', styles), cell_para('16.1.6', styles), cell_para('MIT License', styles), cell_para('Core framework (App Router)', styles)],
-        [cell_para('React', styles), cell_para('19.2.4', styles), cell_para('MIT License', styles), cell_para('UI library for all components', styles)],
-        [cell_para('Tailwind CSS', styles), cell_para('3.4', styles), cell_para('MIT License', styles), cell_para('Styling and responsive design', styles)],
-        [cell_para('TypeScript', styles), cell_para('5.9', styles), cell_para('Apache License 2.0', styles), cell_para('Type-safe development', styles)],
-        [cell_para('Node.js', styles), cell_para('22 LTS', styles), cell_para('MIT License', styles), cell_para('Server-side runtime and build tooling', styles)],
-        [cell_para('Supabase', styles), cell_para('Latest', styles), cell_para('Apache License 2.0', styles), cell_para('Database, authentication, backend services', styles)],
-        [cell_para('Lucide React', styles), cell_para('Latest', styles), cell_para('ISC License', styles), cell_para('All icons throughout application', styles)],
-        [cell_para('React Hook Form', styles), cell_para('Latest', styles), cell_para('MIT License', styles), cell_para('Form handling and validation', styles)],
-        [cell_para('Zod', styles), cell_para('Latest', styles), cell_para('MIT License', styles), cell_para('Schema validation for forms and API', styles)],
-        [cell_para('Google Generative AI (Gemini)', styles), cell_para('Latest', styles), cell_para('Terms of Service', styles), cell_para('AI resume builder and job assistant', styles)],
-        [cell_para('React Big Calendar', styles), cell_para('Latest', styles), cell_para('MIT License', styles), cell_para('Event calendar display', styles)],
-        [cell_para('jspdf and html2canvas', styles), cell_para('Latest', styles), cell_para('MIT License', styles), cell_para('Resume PDF export functionality', styles)],
-        [cell_para('Other libraries', styles), cell_para('See package.json', styles), cell_para('MIT / Apache', styles), cell_para('Various supporting utilities', styles)],
-    ]
-    t3 = Table(sect3_rows, colWidths=[1.9 * inch, 0.95 * inch, 1.55 * inch, 2.25 * inch])
-    t3.setStyle(table_style_card())
-    t3.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), CIVIC_NAVY),
-        ('TEXTCOLOR', (0, 0), (-1, 0), WHITE_TEXT),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [CARD_BG, ROW_ALT]),
-    ]))
-    story.append(t3)
-    story.append(Spacer(1, 0.3 * inch))
-
-    # Section 4 - Written Permissions (teal left bar, padding so text not covered)
-    story.append(Paragraph('4. Written Permissions', ParagraphStyle('Sect', fontName='Helvetica-Bold', fontSize=11, textColor=CIVIC_GOLD, spaceAfter=6)))
-    perm_text = """&bull; All materials used are original work, MIT/Apache/ISC licensed, Unsplash licensed, or public domain.<br/>
-&bull; No written permissions were required for the materials used in this project."""
-    perm_para = Paragraph(perm_text, ParagraphStyle('Body', fontName='Helvetica', fontSize=10, textColor=TEXT_DARK, leftIndent=12, spaceAfter=0,
-        backColor=CARD_BG, leading=12, splitLongWords=False))
-    perm_table = Table([['', perm_para]], colWidths=[0.1 * inch, 5.95 * inch])
-    perm_table.setStyle(TableStyle([
+def table_style_card_bar():
+    """Card with a teal left bar; padding so text fits inside."""
+    return _cached_table_style('card_bar', lambda: [
         ('BACKGROUND', (0, 0), (0, -1), CIVIC_GOLD),
         ('BACKGROUND', (1, 0), (1, -1), CARD_BG),
         ('LEFTPADDING', (1, 0), (1, -1), 14),
@@ -413,59 +838,49 @@ def build_student_copyright_checklist():
         ('TOPPADDING', (1, 0), (1, -1), 12),
         ('BOTTOMPADDING', (1, 0), (1, -1), 12),
         ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    story.append(perm_table)
-    story.append(Spacer(1, 0.25 * inch))
-
-    # Section 5 - Framework Template Statement
-    story.append(Paragraph('5. Framework Template Statement', ParagraphStyle('Sect', fontName='Helvetica-Bold', fontSize=11, textColor=CIVIC_GOLD, spaceAfter=6)))
-    frame_text = 'All templates, themes, components, and designs were custom-built by the CATA TSA team. No pre-built templates or themes were used.'
-    frame_para = Paragraph(_escape(frame_text), ParagraphStyle('Body', fontName='Helvetica', fontSize=10, textColor=TEXT_DARK, leftIndent=12, spaceAfter=0,
-        backColor=CARD_BG, leading=12, splitLongWords=False))
-    frame_table = Table([['', frame_para]], colWidths=[0.1 * inch, 5.95 * inch])
-    frame_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), CIVIC_GOLD),
-        ('BACKGROUND', (1, 0), (1, -1), CARD_BG),
-        ('LEFTPADDING', (1, 0), (1, -1), 14),
-        ('RIGHTPADDING', (1, 0), (1, -1), 14),
-        ('TOPPADDING', (1, 0), (1, -1), 12),
-        ('BOTTOMPADDING', (1, 0), (1, -1), 12),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    story.append(frame_table)
-    story.append(Spacer(1, 0.3 * inch))
-
-    # Section 6 - Student Signatures (cursive font for signature column)
-    story.append(Paragraph('6. Student Signatures', ParagraphStyle('Sect', fontName='Helvetica-Bold', fontSize=11, textColor=CIVIC_GOLD, spaceAfter=6)))
-    story.append(Paragraph('Students certify the accuracy of the information above.', ParagraphStyle('Muted', fontName='Helvetica', fontSize=9, textColor=TEXT_MUTED, spaceAfter=12)))
-
-    sig_date = '01/15/2026'
-    students = [
-        ('Yatish Grandhe', 'Yatish Grandhe'),
-        ('Dhyan Kanna', 'Dhyan Kanna'),
-        ('Vihaan Kotagiri', 'Vihaan Kotagiri'),
-    ]
-    for name, sig_name in students:
-        row = [
-            Paragraph('<b>Name</b><br/>' + _escape(name), styles['WhiteBody']),
-            Paragraph(sig_name, styles['Signature']),  # Cursive/script font
-            Paragraph('<b>Date</b><br/>' + _escape(sig_date), styles['WhiteBody']),
+    ])
+
+
+def table_style_header(zebra=False, total=False, header_rule=False):
+    """Navy header row; optional zebra body rows, navy total row and teal rule under the header."""
+    def commands():
+        cmds = [
+            ('BACKGROUND', (0, 0), (-1, 0), CIVIC_NAVY),
+            ('TEXTCOLOR', (0, 0), (-1, 0), WHITE_TEXT),
         ]
-        sig_t = Table([[cell_para('Name', styles, 'CellMuted'), cell_para('Signature', styles, 'CellMuted'), cell_para('Date', styles, 'CellMuted')], row],
-                     colWidths=[2.0 * inch, 2.2 * inch, 1.5 * inch])
-        sig_t.setStyle(table_style_card())
-        story.append(sig_t)
-        story.append(Spacer(1, 0.2 * inch))
-
-    # Advisor (cursive in teal)
-    advisor_row = [
-        Paragraph('<b>Name</b><br/>' + _escape('Tyler Powell'), styles['WhiteBody']),
-        Paragraph('Tyler Powell', styles['SignatureTeal']),  # Cursive in teal
-        Paragraph('<b>Date</b><br/>' + _escape(sig_date), styles['WhiteBody']),
-    ]
-    adv_table = Table([[cell_para('Name', styles, 'CellMuted'), cell_para('Signature', styles, 'CellMuted'), cell_para('Date', styles, 'CellMuted')], advisor_row],
-                     colWidths=[2.0 * inch, 2.2 * inch, 1.5 * inch])
-    adv_table.setStyle(TableStyle([
+        if zebra:
+            cmds.append(('ROWBACKGROUNDS', (0, 1), (-1, -2 if total else -1), [CARD_BG, ROW_ALT]))
+        if total:
+            cmds += [
+                ('BACKGROUND', (0, -1), (-1, -1), CIVIC_NAVY),
+                ('TEXTCOLOR', (0, -1), (-1, -1), WHITE_TEXT),
+                ('LINEABOVE', (0, -1), (-1, -1), 2, ACCENT_TEAL),
+            ]
+        if header_rule:
+            cmds.append(('LINEABOVE', (0, 0), (-1, 0), 2, ACCENT_TEAL))
+        return cmds
+    return _cached_table_style(('header', bool(zebra), bool(total), bool(header_rule)), commands)
+
+
+def table_style_phase_header():
+    """Work-log phase title bar: title left, date right, vertically centred."""
+    return _cached_table_style('phase_header', lambda: [
+        ('BACKGROUND', (0, 0), (-1, -1), CARD_BG),
+        ('TEXTCOLOR', (0, 0), (0, -1), PRIMARY_BLUE),
+        ('TEXTCOLOR', (1, 0), (1, -1), TEXT_DARK),
+        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+        ('GRID', (0, 0), (-1, -1), 0.5, BORDER),
+        ('LEFTPADDING', (0, 0), (-1, -1), 10),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ])
+
+
+def table_style_advisor():
+    """Advisor signature card: shaded, tighter padding, muted bold header row."""
+    return _cached_table_style('advisor', lambda: [
         ('BACKGROUND', (0, 0), (-1, -1), ROW_ALT),
         ('TEXTCOLOR', (0, 0), (-1, -1), TEXT_DARK),
         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
@@ -476,203 +891,1787 @@ def build_student_copyright_checklist():
         ('TOPPADDING', (0, 0), (-1, -1), 6),
         ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    story.append(adv_table)
+    ])
 
-    def on_first(canvas, doc):
-        canvas.setTitle('Student Copyright Checklist')
-        canvas.setAuthor('Monroe Resource Hub | CATA TSA')
-        first_page_cb(canvas, doc, 'STUDENT COPYRIGHT CHECKLIST', 'Monroe Resource Hub | Central Academy of Technology and Arts | TSA 2026')
 
-    def on_later(canvas, doc):
-        later_pages_cb(canvas, doc, 'STUDENT COPYRIGHT CHECKLIST', 'Monroe Resource Hub | Central Academy of Technology and Arts | TSA 2026')
+def _escape(s):
+    return str(s).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
 
-    doc.build(story, onFirstPage=on_first, onLaterPages=on_later)
-    print('Generated:', out_path)
-    return out_path
 
+# Parsed Paragraph fragments by (markup, style), least recently used evicted first. ReportLab
+# only reads frags after parsing (wrap/split build new ones), so they are shared between tables
+# and across documents in one process.
+PARAGRAPH_CACHE_SIZE = 4096
+_PARAGRAPH_CACHE = OrderedDict()
+PARAGRAPH_CACHE_STATS = {'hits': 0, 'misses': 0}
 
-def build_work_log():
-    out_path = os.path.join(OUT_DIR, 'work-log.pdf')
-    os.makedirs(OUT_DIR, exist_ok=True)
 
-    doc = SimpleDocTemplate(
-        out_path,
-        pagesize=letter,
-        leftMargin=MARGIN,
-        rightMargin=MARGIN,
-        topMargin=HEADER_HEIGHT + 0.25 * inch,
-        bottomMargin=BOTTOM_MARGIN,
-    )
-    styles = build_styles()
-    story = []
-
-    # Meta grid (Paragraphs so text fits)
-    meta_data = [
-        [cell_para('PROJECT:', styles, 'CellMuted'), cell_para('Monroe Resource Hub', styles),
-         cell_para('DATE RANGE:', styles, 'CellMuted'), cell_para('November 2025 - January 2026', styles)],
-        [cell_para('SCHOOL:', styles, 'CellMuted'), cell_para('Central Academy of Technology and Arts', styles),
-         cell_para('STUDENTS:', styles, 'CellMuted'), cell_para('Yatish Grandhe, Dhyan Kanna, Vihaan Kotagiri', styles)],
-        [cell_para('ORGANIZATION:', styles, 'CellMuted'), cell_para('TSA', styles),
-         cell_para('STATUS:', styles, 'CellMuted'), cell_para('Completed and Deployed', styles)],
-    ]
-    meta_table = Table(meta_data, colWidths=[1.3 * inch, 2.0 * inch, 1.3 * inch, 2.4 * inch])
-    meta_table.setStyle(table_style_card())
-    story.append(meta_table)
-    story.append(Spacer(1, 0.25 * inch))
-
-    # Project Summary card (teal left bar, padding so text fits)
-    summary_text = """The Monroe Resource Hub is a comprehensive community platform designed to connect residents of Monroe, North Carolina with vital resources, services, and opportunities. The platform includes a resource directory, an AI-powered resume builder, a job application assistant, a community events calendar, and volunteer opportunity listings. Built with Next.js, React, Supabase, and Google Gemini AI, the application is fully deployed at monroeresourcehub.us."""
-    summary_para = Paragraph(_escape(summary_text), ParagraphStyle('Body', fontName='Helvetica', fontSize=10, textColor=TEXT_DARK, leftIndent=12, spaceAfter=0, backColor=CARD_BG, leading=12, splitLongWords=False))
-    summary_table = Table([['', summary_para]], colWidths=[0.1 * inch, 5.95 * inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), CIVIC_GOLD),
-        ('BACKGROUND', (1, 0), (1, -1), CARD_BG),
-        ('LEFTPADDING', (1, 0), (1, -1), 14),
-        ('RIGHTPADDING', (1, 0), (1, -1), 14),
-        ('TOPPADDING', (1, 0), (1, -1), 12),
-        ('BOTTOMPADDING', (1, 0), (1, -1), 12),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    story.append(Paragraph('Project Summary', ParagraphStyle('Sect', fontName='Helvetica-Bold', fontSize=11, textColor=CIVIC_GOLD, spaceAfter=6)))
-    story.append(summary_table)
-    story.append(Spacer(1, 0.3 * inch))
-
-    # Work Log Entries
-    story.append(Paragraph('Work Log Entries', ParagraphStyle('Sect', fontName='Helvetica-Bold', fontSize=12, textColor=TEXT_DARK, spaceAfter=10)))
-
-    phases = [
-        (1, 'Project Planning and Research', 'November 1-5, 2025', '15 hours', 'All team members',
-         ['Community needs assessment', 'Researched existing platforms', 'Identified features', 'Created timeline and milestones', 'Selected tech stack (Next.js, Supabase, Tailwind CSS, TypeScript)'],
-         'Established project scope and technical requirements'),
-        (2, 'UI/UX Design and Wireframing', 'November 6-12, 2025', '20 hours', 'Design team',
-         ['Wireframes for all pages', 'Color scheme and branding', 'Custom logo design', 'Responsive layouts', 'Design system and component library'],
-         'Complete design system and visual mockups'),
-        (3, 'Database Setup and Backend Development', 'November 13-25, 2025', '25 hours', 'Backend team',
-         ['Database schema for resources/events/users', 'Supabase project setup', 'Authentication system', 'API routes', 'Row Level Security (RLS) policies'],
-         'Fully functional backend with secure authentication'),
-        (4, 'Frontend Development - Core Pages', 'November 26 - December 5, 2025', '30 hours', 'Frontend team',
-         ['Homepage with hero and categories', 'Resource directory with search and filters', 'Resource detail pages', 'Events calendar with React Big Calendar', 'About page and contact forms', 'Responsive navigation and footer'],
-         'Complete user-facing pages and navigation'),
-        (5, 'Career Center Development', 'December 6-20, 2025', '35 hours', 'AI/Backend team',
-         ['Google Gemini AI integration', 'AI-powered resume builder with templates', 'Job application assistant', 'Local job board', 'PDF export with jspdf and html2canvas'],
-         'Fully functional career center with AI-powered features'),
-        (6, 'Testing and Quality Assurance', 'December 21-31, 2025', '18 hours', 'All team members',
-         ['Cross-browser testing (Chrome, Firefox, Edge)', 'Responsive device testing', 'Security and vulnerability scans', 'Full user flow testing', 'Bug fixes and performance improvements', 'Accessibility validation'],
-         'Stable, tested, and secure application'),
-        (7, 'Content Population and Data Entry', 'January 1-15, 2026', '15 hours', 'Content team',
-         ['50+ community resources added', 'Organized by category', 'Event listings and calendar entries', 'Job listings', 'Wrote all page content'],
-         'Fully populated database with real community data'),
-        (8, 'Documentation and Final Preparation', 'January 16-31, 2026', '12 hours', 'All team members',
-         ['Reference page with all sources', 'Student copyright checklist', 'Work log entries', 'Presentation materials', 'User documentation', 'Final review and quality check'],
-         'Complete project documentation and competition-ready submission'),
+def cached_paragraph(markup, style):
+    """Paragraph for markup that is parsed once per (markup, style) and reused afterwards."""
+    key = (markup, style)
+    parsed = _PARAGRAPH_CACHE.get(key)
+    if parsed is None:
+        PARAGRAPH_CACHE_STATS['misses'] += 1
+        para = Paragraph(markup, style)
+        _PARAGRAPH_CACHE[key] = (para.text, para.style, para.bulletText, para.frags)
+        if len(_PARAGRAPH_CACHE) > PARAGRAPH_CACHE_SIZE:
+            _PARAGRAPH_CACHE.popitem(last=False)
+        return para
+    PARAGRAPH_CACHE_STATS['hits'] += 1
+    _PARAGRAPH_CACHE.move_to_end(key)
+    text, parsed_style, bullet_text, frags = parsed
+    return Paragraph(text, parsed_style, bullet_text, frags=frags)
+
+
+def clear_paragraph_cache():
+    _PARAGRAPH_CACHE.clear()
+    PARAGRAPH_CACHE_STATS.update(hits=0, misses=0)
+
+
+def cell_para(text, styles, style_name='Cell'):
+    """Wrap text in a Paragraph so it wraps inside table cells and fits the box."""
+    if _PROFILER is not None:
+        start = time.perf_counter()
+        para = cached_paragraph(_escape(text), styles[style_name])
+        _PROFILER.add('paragraph', style_name, time.perf_counter() - start)
+        return para
+    return cached_paragraph(_escape(text), styles[style_name])
+
+
+# --- Document engine: declarative specs (scripts/documents/*.json|yaml) rendered to PDF ---
+SPEC_DIR = os.path.join(REPO_ROOT, 'scripts', 'documents')
+SPEC_EXTENSIONS = ('.json', '.yaml', '.yml')
+
+# {{name}} or {{name.0}} in any spec string; values come from the spec's "defaults" or a merge row
+PLACEHOLDER_RE = re.compile(r'\{\{\s*([\w.]+)\s*\}\}')
+
+DocumentSpec = namedtuple('DocumentSpec', 'name title subtitle metadata phases blocks raw source')
+
+
+class SpecError(ValueError):
+    """A document spec is malformed (unknown block type, missing field, ...)."""
+
+
+def meta_rows(rows, styles):
+    """Label/value grid rows: even columns are muted labels, odd columns are values."""
+    return [[cell_para(text, styles, 'CellMuted' if i % 2 == 0 else 'Cell') for i, text in enumerate(row)] for row in rows]
+
+
+def table_rows(header, rows, styles, style_name='Cell'):
+    """Header row (bold) followed by body rows, every cell a wrapping Paragraph."""
+    return [[cell_para(text, styles, 'CellHeader') for text in header]] + \
+        [[cell_para(text, styles, style_name) for text in row] for row in rows]
+
+
+def _hours_text(hours):
+    return f'{hours:g}'
+
+
+def _card_table(para):
+    """Single-row card: narrow teal bar column, then the body paragraph."""
+    card = Table([['', para]], colWidths=[0.1 * inch, 5.95 * inch])
+    card.setStyle(table_style_card_bar())
+    return card
+
+
+def _render_meta(block, styles, spec):
+    table = Table(meta_rows(block['rows'], styles), colWidths=block['col_widths'])
+    table.setStyle(table_style_card())
+    return [table]
+
+
+def _render_spacer(block, styles, spec):
+    return [Spacer(1, block['height'])]
+
+
+def _render_image(block, styles, spec):
+    path = image_derivative(block['src'], block['px'], block.get('format', 'auto'))
+    image = Image(_image_bytes(path), block['width'], block['height'], hAlign=block.get('align', 'center').upper())
+    if not block.get('caption'):
+        return [image]
+    return [image, Spacer(1, 4), Paragraph(_escape(block['caption']), styles['MutedNote'])]
+
+
+def _render_section(block, styles, spec):
+    style_name = 'SectionHeading' if block.get('style') == 'heading' else 'SectionAccent'
+    return [Paragraph(_escape(block['text']), styles[style_name])]
+
+
+def _render_paragraph(block, styles, spec):
+    kind = block.get('style', 'body')
+    text = _escape(block['text'])
+    if kind == 'note':
+        return [Paragraph(f'<i>{text}</i>', styles['ItalicNote'])]
+    if kind == 'muted':
+        return [Paragraph(text, styles['MutedNote'])]
+    return [Paragraph(text, styles['PlainBody'])]
+
+
+def _render_card(block, styles, spec):
+    text = block['text'] if block.get('markup') else _escape(block['text'])
+    return [_card_table(Paragraph(text, styles['CardBody']))]
+
+
+# Tables with at least this many body rows take the uniform_table() fast path unless the
+# block sets "uniform" explicitly
+UNIFORM_TABLE_ROWS = 100
+CELL_PAD_X = 20  # table_style_card left + right padding
+CELL_PAD_Y = 16  # table_style_card top + bottom padding
+
+
+@lru_cache(maxsize=65536)
+def cached_string_width(text, font_name, font_size):
+    return pdfmetrics.stringWidth(text, font_name, font_size)
+
+
+def table_style_plain_cells(style):
+    """Font of plain-string body cells, matching the Paragraph style they stand in for."""
+    return _cached_table_style(('plain', style.name), lambda: [
+        ('FONTNAME', (0, 1), (-1, -1), style.fontName),
+        ('FONTSIZE', (0, 1), (-1, -1), style.fontSize),
+        ('LEADING', (0, 1), (-1, -1), style.leading),
+        ('TEXTCOLOR', (0, 1), (-1, -1), style.textColor),
+    ])
+
+
+def uniform_table(header, rows, col_widths, styles, style_name='Cell', total=None):
+    """Table for many same-shaped rows, measured once.
+
+    Body cells that fit on one line (by cached stringWidth) stay plain strings, which the
+    table draws without Paragraph wrapping at the same baseline; only longer text becomes a
+    Paragraph. Every row height is computed up front and passed as rowHeights, so ReportLab
+    never measures cells for layout, and page splits reuse the slices instead of re-measuring.
+    """
+    style = styles[style_name]
+    room = [w - CELL_PAD_X for w in col_widths]
+    line_height = style.leading + CELL_PAD_Y
+    data, heights = [], []
+
+    def paragraph_row(texts, row_style_name):
+        cells = [cell_para(text, styles, row_style_name) for text in texts]
+        data.append(cells)
+        heights.append(max(cell.wrap(w, 1e6)[1] for cell, w in zip(cells, room)) + CELL_PAD_Y)
+
+    paragraph_row(header, 'CellHeader')
+    for row in rows:
+        texts = [str(text) for text in row]
+        if all('\n' not in t and '  ' not in t and t == t.strip()
+               and cached_string_width(t, style.fontName, style.fontSize) <= w for t, w in zip(texts, room)):
+            data.append(texts)
+            heights.append(line_height)
+        else:
+            paragraph_row(texts, style_name)
+    if total:
+        paragraph_row(total, 'CellHeader')
+    table = Table(data, colWidths=col_widths, rowHeights=heights)
+    table.setStyle(table_style_card())
+    table.setStyle(table_style_plain_cells(style))
+    return table
+
+
+def _render_table(block, styles, spec):
+    """Navy header row; optional zebra body rows, bold total row and teal rule under the header."""
+    total = block.get('total')
+    uniform = block.get('uniform')
+    if uniform is None:
+        uniform = len(block['rows']) >= UNIFORM_TABLE_ROWS
+    if uniform:
+        table = uniform_table(block['header'], block['rows'], block['col_widths'], styles, total=total)
+    else:
+        data = table_rows(block['header'], block['rows'], styles)
+        if total:
+            data.append([cell_para(text, styles, 'CellHeader') for text in total])
+        table = Table(data, colWidths=block['col_widths'])
+        table.setStyle(table_style_card())
+    table.setStyle(table_style_header(block.get('zebra'), total, block.get('header_rule')))
+    return [table]
+
+
+def _signature_table(signer, date, styles, signature_style):
+    row = [
+        Paragraph('<b>Name</b><br/>' + _escape(signer['name']), styles['WhiteBody']),
+        Paragraph(_escape(signer['signature']), styles[signature_style]),  # Cursive/script font
+        Paragraph('<b>Date</b><br/>' + _escape(date), styles['WhiteBody']),
     ]
+    header = [cell_para('Name', styles, 'CellMuted'), cell_para('Signature', styles, 'CellMuted'), cell_para('Date', styles, 'CellMuted')]
+    return Table([header, row], colWidths=[2.0 * inch, 2.2 * inch, 1.5 * inch])
+
+
+def _render_signatures(block, styles, spec):
+    """One card per student signer, then the advisor on a shaded card (cursive signature column)."""
+    flowables = []
+    for signer in block['signers']:
+        sig_t = _signature_table(signer, block['date'], styles, 'Signature')
+        sig_t.setStyle(table_style_card())
+        flowables += [sig_t, Spacer(1, 0.2 * inch)]
+    advisor = block.get('advisor')
+    if advisor:
+        adv_table = _signature_table(advisor, block['date'], styles, 'SignatureTeal')
+        adv_table.setStyle(table_style_advisor())
+        flowables.append(adv_table)
+    return flowables
+
+
+def iter_phases_jsonl(path):
+    """Work-log phases read lazily from a JSON Lines file (one phase object per line)."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
 
-    for num, title, date_range, hours, team, tasks_list, outcome in phases:
+FRAME_FUZZ = 0.01  # pt; heights closer than this are equal when telling whether a frame is empty
+
+
+class PlannedGroup(Flowable):
+    """Flowables kept together on one page, placed with a single height check (replaces KeepTogether).
+
+    KeepTogether reports an impossible height so that every placement goes through split(),
+    which re-measures the whole group (on a deep copy of the frame) and hands the parts back
+    to be measured again one by one. Here the parts are wrapped once per frame width and
+    their offsets cached: a group that fits is drawn in place, one that fits a fresh frame
+    is preceded by an explicit FrameBreak, and one taller than a frame falls back to its
+    parts (which split across pages, as with KeepTogether). Part positions and spacing are
+    the frame's own, so the output is identical.
+    """
+
+    def __init__(self, content):
+        Flowable.__init__(self)
+        self.content = list(content)
+        self._layouts = {}  # frame width -> (width, height, [(part, bottom offset from top, part width)])
+        self._wrapped_at = None  # width the parts were last wrapped at (Paragraphs keep their lines)
+
+    def _layout(self, avail_width):
+        layout = self._layouts.get(avail_width)
+        if layout is None or self._wrapped_at != avail_width:
+            from reportlab import rl_config
+            merge = rl_config.overlapAttachedSpace  # as Frame: adjacent spaceAfter/spaceBefore overlap
+            width = y = space_after = 0
+            placed = []
+            for i, part in enumerate(self.content):
+                w, h = part.wrapOn(self.canv, avail_width, 0xfffffff)
+                if i:
+                    space_before = part.getSpaceBefore()
+                    y += max(space_before - space_after, 0) if merge else space_before
+                y += h
+                placed.append((part, y, w))
+                space_after = part.getSpaceAfter()
+                y += space_after
+                width = max(width, w)
+            layout = self._layouts[avail_width] = (width, y - space_after, placed)
+            self._wrapped_at = avail_width
+        return layout
+
+    def wrap(self, avail_width, avail_height):
+        self.width, self.height, _ = self._layout(avail_width)
+        return self.width, self.height
+
+    def getSpaceBefore(self):
+        return self.content[0].getSpaceBefore() if self.content else 0
+
+    def getSpaceAfter(self):
+        return self.content[-1].getSpaceAfter() if self.content else 0
+
+    def split(self, avail_width, avail_height):
+        _, height, _ = self._layout(avail_width)
+        # The frame sets itself on what it splits (as KeepTogether relies on); only its public
+        # geometry is read. A frame offers its whole inner height only at its top.
+        frame = getattr(self, '_frame', None)
+        frame_height = avail_height if frame is None else frame.height - frame.topPadding - frame.bottomPadding
+        if avail_height >= frame_height - FRAME_FUZZ:
+            return self.content
+        return [FrameBreak(), self] if height <= frame_height else [FrameBreak()] + self.content
+
+    def drawOn(self, canvas, x, y, _sW=0):
+        # Parts are drawn at their own frame positions (no wrapping translate), as if added one by one
+        avail_width = self.width + _sW
+        _, height, placed = self._layout(avail_width)
+        for part, bottom, w in placed:
+            part.drawOn(canvas, x, y + height - bottom, _sW=avail_width - w)
+
+
+def phase_flowables(phases, styles=None):
+    """Flowables for work-log phases, generated one phase at a time so `phases` may be a lazy iterator."""
+    styles = styles or get_styles()
+    for phase in phases:
         phase_story = []
         # Header row: phase title (teal) and date (right) as Paragraphs so long text wraps
-        header_data = [[cell_para(title, styles, 'PhaseTitle'), cell_para(date_range, styles)]]
-        header_t = Table(header_data, colWidths=[4.5 * inch, 2.0 * inch])
-        header_t.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), CARD_BG),
-            ('TEXTCOLOR', (0, 0), (0, -1), PRIMARY_BLUE),
-            ('TEXTCOLOR', (1, 0), (1, -1), TEXT_DARK),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, BORDER),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        header_t = Table([[cell_para(phase['title'], styles, 'PhaseTitle'), cell_para(phase['dates'], styles)]],
+                         colWidths=[4.5 * inch, 2.0 * inch])
+        header_t.setStyle(table_style_phase_header())
         phase_story.append(header_t)
         phase_story.append(Spacer(1, 0.08 * inch))
         # Meta: hours and team
-        phase_story.append(Paragraph(f'<b>Hours:</b> {hours} &nbsp;&nbsp; <b>Team:</b> {team}', ParagraphStyle('Meta', fontName='Helvetica', fontSize=9, textColor=TEXT_MUTED, spaceAfter=6)))
+        phase_story.append(Paragraph(f"<b>Hours:</b> {_hours_text(phase['hours'])} hours &nbsp;&nbsp; <b>Team:</b> {_escape(phase['team'])}",
+                                     styles['PhaseMeta']))
         # Bullet list of tasks
-        tasks_para = '<br/>'.join(f'• {t}' for t in tasks_list)
-        phase_story.append(Paragraph(tasks_para, ParagraphStyle('Tasks', fontName='Helvetica', fontSize=9, textColor=TEXT_DARK, leftIndent=12, spaceAfter=4)))
+        tasks_para = '<br/>'.join(f'• {_escape(t)}' for t in phase['tasks'])
+        phase_story.append(Paragraph(tasks_para, styles['PhaseTasks']))
         # Green italic outcome
-        phase_story.append(Paragraph(f'<i>Outcome: {outcome}</i>', ParagraphStyle('Outcome', fontName='Helvetica-Oblique', fontSize=10, textColor=CIVIC_GREEN, spaceAfter=12)))
-        story.append(KeepTogether(phase_story))
-        story.append(Spacer(1, 0.1 * inch))
-
-    # Total Time Summary table (Paragraphs so text fits)
-    story.append(Spacer(1, 0.25 * inch))
-    story.append(Paragraph('Total Time Summary', ParagraphStyle('Sect', fontName='Helvetica-Bold', fontSize=11, textColor=CIVIC_GOLD, spaceAfter=6)))
-    total_data = [
-        [cell_para('Phase', styles, 'CellHeader'), cell_para('Date Range', styles, 'CellHeader'),
-         cell_para('Hours', styles, 'CellHeader'), cell_para('Team Members', styles, 'CellHeader')],
-        [cell_para('1. Project Planning and Research', styles), cell_para('Nov 1-5, 2025', styles), cell_para('15', styles), cell_para('All team members', styles)],
-        [cell_para('2. UI/UX Design and Wireframing', styles), cell_para('Nov 6-12, 2025', styles), cell_para('20', styles), cell_para('Design team', styles)],
-        [cell_para('3. Database Setup and Backend', styles), cell_para('Nov 13-25, 2025', styles), cell_para('25', styles), cell_para('Backend team', styles)],
-        [cell_para('4. Frontend - Core Pages', styles), cell_para('Nov 26 - Dec 5, 2025', styles), cell_para('30', styles), cell_para('Frontend team', styles)],
-        [cell_para('5. Career Center Development', styles), cell_para('Dec 6-20, 2025', styles), cell_para('35', styles), cell_para('AI/Backend team', styles)],
-        [cell_para('6. Testing and QA', styles), cell_para('Dec 21-31, 2025', styles), cell_para('18', styles), cell_para('All team members', styles)],
-        [cell_para('7. Content Population', styles), cell_para('Jan 1-15, 2026', styles), cell_para('15', styles), cell_para('Content team', styles)],
-        [cell_para('8. Documentation and Final Prep', styles), cell_para('Jan 16-31, 2026', styles), cell_para('12', styles), cell_para('All team members', styles)],
-        [cell_para('TOTAL', styles, 'CellHeader'), cell_para('Nov 2025 - Jan 2026', styles, 'CellHeader'), cell_para('170', styles, 'CellHeader'), cell_para('25+ students', styles, 'CellHeader')],
-    ]
-    total_table = Table(total_data, colWidths=[2.25 * inch, 1.65 * inch, 0.85 * inch, 1.45 * inch])
-    total_table.setStyle(table_style_card())
-    total_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), CIVIC_NAVY),
-        ('TEXTCOLOR', (0, 0), (-1, 0), WHITE_TEXT),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -2), [CARD_BG, ROW_ALT]),
-        ('BACKGROUND', (0, -1), (-1, -1), CIVIC_NAVY),
-        ('TEXTCOLOR', (0, -1), (-1, -1), WHITE_TEXT),
-        ('LINEABOVE', (0, -1), (-1, -1), 2, ACCENT_TEAL),
-    ]))
-    story.append(total_table)
-    story.append(Spacer(1, 0.3 * inch))
-
-    # Team Contributions
-    story.append(Paragraph('Team Contributions', ParagraphStyle('Sect', fontName='Helvetica-Bold', fontSize=11, textColor=CIVIC_GOLD, spaceAfter=6)))
-    contrib_text = 'Collaborative project by the CATA TSA Chapter. Student developers led development, design, and content.'
-    story.append(Paragraph(_escape(contrib_text), ParagraphStyle('Body', fontName='Helvetica', fontSize=10, textColor=TEXT_DARK, spaceAfter=10, splitLongWords=False)))
-    named_data = [
-        [cell_para('Name', styles, 'CellHeader'), cell_para('Role', styles, 'CellHeader')],
-        [cell_para('Yatish Grandhe', styles), cell_para('Student Developer', styles)],
-        [cell_para('Dhyan Kanna', styles), cell_para('Student Developer', styles)],
-        [cell_para('Vihaan Kotagiri', styles), cell_para('Student Developer', styles)],
-    ]
-    named_table = Table(named_data, colWidths=[2.5 * inch, 2.0 * inch])
-    named_table.setStyle(table_style_card())
-    named_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), CIVIC_NAVY),
-        ('TEXTCOLOR', (0, 0), (-1, 0), WHITE_TEXT),
-        ('LINEABOVE', (0, 0), (-1, 0), 2, ACCENT_TEAL),
-    ]))
-    story.append(named_table)
-    story.append(Spacer(1, 0.25 * inch))
-
-    # Completion info grid
-    comp_data = [
-        [cell_para('PROJECT COMPLETION:', styles, 'CellMuted'), cell_para('January 2026', styles),
-         cell_para('STATUS:', styles, 'CellMuted'), cell_para('Completed and Deployed', styles)],
-        [cell_para('DEPLOYMENT:', styles, 'CellMuted'), cell_para('Vercel Platform', styles),
-         cell_para('URL:', styles, 'CellMuted'), cell_para('https://monroeresourcehub.us', styles)],
+        phase_story.append(Paragraph(f"<i>Outcome: {_escape(phase['outcome'])}</i>", styles['PhaseOutcome']))
+        yield PlannedGroup(phase_story)
+        yield Spacer(1, 0.1 * inch)
+
+
+def _render_phases(block, styles, spec):
+    """One kept-together card per work-log phase: title/date header, hours and team, tasks, outcome.
+
+    With a "source" JSONL file the phases are streamed from disk instead of the spec.
+    """
+    phases = iter_phases_jsonl(block['source']) if block.get('source') else spec.phases
+    return phase_flowables(phases, styles)
+
+
+def _nice_axis_max(value):
+    """(axis max, step): about five round steps covering `value`."""
+    raw = max(value, 1.0) / 5
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(s * magnitude for s in (1, 2, 2.5, 5, 10) if s * magnitude >= raw)
+    return step * math.ceil(max(value, 1.0) / step), step
+
+
+def _render_hours_chart(block, styles, spec):
+    """Bars of hours per week with the remaining budget (burn-down) as a line, on one axis."""
+    # Imported here: the graphics package is only needed by documents with charts
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+    from reportlab.graphics.shapes import Drawing, Line, PolyLine, Rect, String
+    weeks = block['weeks']
+    if not weeks:
+        return []
+    width = letter[0] - 2 * MARGIN
+    height = block.get('height', 2.4 * inch)
+    budget = block['budget']
+    axis_max, step = _nice_axis_max(max(budget, max(hours for _, hours, _ in weeks)))
+    drawing = Drawing(width, height)
+    chart = VerticalBarChart()
+    chart.x, chart.y = 36, 28
+    chart.width, chart.height = width - chart.x - 8, height - chart.y - 24
+    chart.data = [[hours for _, hours, _ in weeks]]
+    chart.bars[0].fillColor = ACCENT_TEAL
+    chart.bars[0].strokeColor = None
+    chart.barSpacing = 1
+    chart.valueAxis.valueMin, chart.valueAxis.valueMax, chart.valueAxis.valueStep = 0, axis_max, step
+    chart.valueAxis.labels.fontName = 'Helvetica'
+    chart.valueAxis.labels.fontSize = 7
+    chart.valueAxis.labels.fillColor = TEXT_MUTED
+    chart.valueAxis.strokeColor = BORDER
+    chart.valueAxis.visibleGrid = True
+    chart.valueAxis.gridStrokeColor = BORDER
+    every = max(1, len(weeks) // 14)  # at most ~14 week labels
+    chart.categoryAxis.categoryNames = [f'{monday:%b} {monday.day}' if i % every == 0 else ''
+                                        for i, (monday, _, _) in enumerate(weeks)]
+    chart.categoryAxis.labels.fontName = 'Helvetica'
+    chart.categoryAxis.labels.fontSize = 7
+    chart.categoryAxis.labels.fillColor = TEXT_MUTED
+    chart.categoryAxis.strokeColor = BORDER
+    drawing.add(chart)
+    slot = chart.width / len(weeks)
+    points = [chart.x, chart.y + chart.height * budget / axis_max]  # before the first week
+    for i, (_, _, remaining) in enumerate(weeks):
+        points += [chart.x + (i + 1) * slot, chart.y + chart.height * remaining / axis_max]
+    drawing.add(PolyLine(points, strokeColor=ACCENT_CORAL, strokeWidth=1.5))
+    # Legend, top left
+    legend_y = height - 12
+    drawing.add(Rect(chart.x, legend_y - 1, 8, 8, fillColor=ACCENT_TEAL, strokeColor=None))
+    drawing.add(String(chart.x + 12, legend_y, 'Hours per week', fontName='Helvetica', fontSize=8, fillColor=TEXT_DARK))
+    drawing.add(Line(chart.x + 100, legend_y + 3, chart.x + 116, legend_y + 3, strokeColor=ACCENT_CORAL, strokeWidth=1.5))
+    drawing.add(String(chart.x + 120, legend_y, f'Remaining of {_hours_text(round(budget, 2))} hours',
+                       fontName='Helvetica', fontSize=8, fillColor=TEXT_DARK))
+    return [drawing]
+
+
+# Block type -> renderer(block, styles, spec) returning an iterable of flowables
+BLOCK_RENDERERS = {
+    'meta': _render_meta,
+    'spacer': _render_spacer,
+    'image': _render_image,
+    'section': _render_section,
+    'paragraph': _render_paragraph,
+    'card': _render_card,
+    'table': _render_table,
+    'signatures': _render_signatures,
+    'phases': _render_phases,
+    'hours_chart': _render_hours_chart,
+}
+
+# Blocks computed from the work-log phases (or, except phase_summary, a time-entries "source")
+PHASE_BLOCKS = ('phases', 'phase_summary', 'team_summary', 'hours_chart')
+# Block type -> fields a spec must provide
+REQUIRED_FIELDS = {
+    'meta': ('rows', 'col_widths'),
+    'spacer': ('height',),
+    'image': ('src', 'width'),
+    'section': ('text',),
+    'paragraph': ('text',),
+    'card': ('text',),
+    'table': ('header', 'rows', 'col_widths'),
+    'signatures': ('date', 'signers'),
+    'phases': (),
+    'phase_summary': ('header', 'col_widths'),
+    'team_summary': ('header', 'col_widths'),
+    'hours_chart': (),
+    'roster': ('header', 'names', 'col_widths'),
+}
+
+
+def _lookup_placeholder(values, key, source):
+    value = values
+    for part in key.split('.'):
+        try:
+            value = value[int(part)] if isinstance(value, list) else value[part]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise SpecError(f'{source}: no value for placeholder {{{{{key}}}}}') from None
+    return value
+
+
+def _format_placeholder(value):
+    if isinstance(value, (list, tuple)):
+        return ', '.join(_format_placeholder(v) for v in value)
+    if isinstance(value, float):
+        return f'{value:g}'
+    return str(value)
+
+
+def fill_placeholders(value, values, source='<spec>'):
+    """Substitute {{name}} placeholders through strings, lists and dicts.
+
+    A string that is exactly one placeholder takes the value as-is (so a list of names
+    can fill a list field); placeholders inside longer text are formatted as text.
+    """
+    if isinstance(value, str):
+        whole = PLACEHOLDER_RE.fullmatch(value)
+        if whole:
+            return _lookup_placeholder(values, whole.group(1), source)
+        return PLACEHOLDER_RE.sub(lambda m: _format_placeholder(_lookup_placeholder(values, m.group(1), source)), value)
+    if isinstance(value, list):
+        return [fill_placeholders(v, values, source) for v in value]
+    if isinstance(value, dict):
+        return {k: fill_placeholders(v, values, source) for k, v in value.items()}
+    return value
+
+
+def has_placeholders(value):
+    if isinstance(value, str):
+        return PLACEHOLDER_RE.search(value) is not None
+    if isinstance(value, list):
+        return any(has_placeholders(v) for v in value)
+    if isinstance(value, dict):
+        return any(has_placeholders(v) for v in value.values())
+    return False
+
+
+# --- Hours store: work-log analytics from phases or time entries ---
+MONTHS = {name: number for number, names in enumerate(zip(
+    ('', 'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september', 'october', 'november', 'december'),
+    ('', 'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'))) for name in names if name}
+MONTHS['sept'] = 9
+# "November 1-5, 2025", "Nov 26 - Dec 5, 2025", "Dec 20, 2025 - Jan 4, 2026", "January 16, 2026"
+DATE_RANGE_RE = re.compile(r'^\s*([A-Za-z]+)\.?\s+(\d{1,2})(?:,\s*(\d{4}))?'
+                           r'(?:\s*[-\u2013]\s*(?:([A-Za-z]+)\.?\s+)?(\d{1,2})(?:,\s*(\d{4}))?)?\s*$')
+VECTORIZE_MIN_RECORDS = 2048  # below this, plain loops beat importing NumPy
+
+
+def parse_date_range(text):
+    """(start, end) dates of a phase's "dates" text; ValueError if it is not a date or range."""
+    m = DATE_RANGE_RE.match(text)
+    if not m or m.group(1).lower() not in MONTHS or (m.group(4) and m.group(4).lower() not in MONTHS):
+        raise ValueError(f'not a date range: {text!r}')
+    month1, day1, year1, month2, day2, year2 = m.groups()
+    year = int(year2 or year1 or 0)
+    if not year:
+        raise ValueError(f'date range has no year: {text!r}')
+    end_month = MONTHS[(month2 or month1).lower()]
+    end = date(year, end_month, int(day2 or day1))
+    start = date(int(year1) if year1 else year, MONTHS[month1.lower()], int(day1))
+    if start > end and not year1:
+        start = start.replace(year=year - 1)  # "Dec 20 - Jan 4, 2026"
+    if start > end:
+        raise ValueError(f'date range ends before it starts: {text!r}')
+    return start, end
+
+
+def _record_days(record):
+    """(start, end) day ordinals of a phase or time entry: "date", "start"/"end" (ISO) or "dates" text."""
+    if 'date' in record:
+        day = date.fromisoformat(str(record['date'])).toordinal()
+        return day, day
+    if 'start' in record:
+        start = date.fromisoformat(str(record['start'])).toordinal()
+        return start, date.fromisoformat(str(record.get('end', record['start']))).toordinal()
+    start, end = parse_date_range(record['dates'])
+    return start.toordinal(), end.toordinal()
+
+
+def iter_time_entries(path):
+    """Time entries ({date, hours, team}) read lazily from a CSV (header row) or JSON Lines file."""
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _numpy(records):
+    """NumPy for vectorized aggregates over many records, else None (small logs, or not installed)."""
+    if records < VECTORIZE_MIN_RECORDS:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class HoursStore:
+    """Typed, columnar hours records: first and last day (date ordinals), hours and team per record.
+
+    Phases span several days and time entries one; either way a record's hours are spread
+    evenly over its days for weekly figures. Columns are array.array, so large logs stay
+    compact and NumPy (for VECTORIZE_MIN_RECORDS or more records) views them without copying.
+    """
+
+    def __init__(self):
+        self.start = array('q')
+        self.end = array('q')
+        self.hours = array('d')
+        self.team = array('q')
+        self.teams = []  # team code -> name, in order of first appearance
+        self._team_codes = {}
+
+    def __len__(self):
+        return len(self.hours)
+
+    def append(self, start, end, hours, team=''):
+        code = self._team_codes.get(team)
+        if code is None:
+            code = self._team_codes[team] = len(self.teams)
+            self.teams.append(team)
+        self.start.append(start)
+        self.end.append(end)
+        self.hours.append(float(hours))
+        self.team.append(code)
+
+    @classmethod
+    def from_records(cls, records, source='<spec>'):
+        """Store for phases or time entries (dicts with hours, team and a date, start/end or dates)."""
+        store = cls()
+        for number, record in enumerate(records, 1):
+            try:
+                start, end = _record_days(record)
+                store.append(start, end, record['hours'], record.get('team', ''))
+            except (KeyError, TypeError, ValueError) as e:
+                raise SpecError(f'{source}: record {number}: {e}') from None
+        return store
+
+    def _columns(self, np):
+        return (np.frombuffer(self.start, np.int64), np.frombuffer(self.end, np.int64),
+                np.frombuffer(self.hours, np.float64), np.frombuffer(self.team, np.int64))
+
+    def total(self):
+        np = _numpy(len(self))
+        return float(np.frombuffer(self.hours, np.float64).sum()) if np else sum(self.hours)
+
+    def date_range(self):
+        """(first day, last day) as dates, or None when empty."""
+        if not len(self):
+            return None
+        np = _numpy(len(self))
+        if np:
+            start, end, _, _ = self._columns(np)
+            return date.fromordinal(int(start.min())), date.fromordinal(int(end.max()))
+        return date.fromordinal(min(self.start)), date.fromordinal(max(self.end))
+
+    def by_team(self):
+        """Team -> hours, largest first (ties in order of first appearance)."""
+        np = _numpy(len(self))
+        if np:
+            _, _, hours, team = self._columns(np)
+            sums = np.bincount(team, weights=hours, minlength=len(self.teams)).tolist()
+        else:
+            sums = [0.0] * len(self.teams)
+            for code, hours in zip(self.team, self.hours):
+                sums[code] += hours
+        order = sorted(range(len(self.teams)), key=lambda code: -sums[code])
+        return {self.teams[code]: sums[code] for code in order}
+
+    def weekly(self):
+        """[(monday, hours)] for every week from the first record to the last, empty weeks included.
+
+        Each record adds hours / days to every day it spans: a difference array over the day
+        axis (rate on at start, off after end) turns that into one cumulative pass.
+        """
+        if not len(self):
+            return []
+        first, last = self.date_range()
+        base = first.toordinal() - first.weekday()  # Monday of the first week
+        weeks = (last.toordinal() - base) // 7 + 1
+        size = weeks * 7 + 1
+        np = _numpy(len(self))
+        if np:
+            start, end, hours, _ = self._columns(np)
+            rate = hours / (end - start + 1)
+            delta = np.bincount(start - base, rate, size) - np.bincount(end + 1 - base, rate, size)
+            per_week = np.cumsum(delta)[:-1].reshape(weeks, 7).sum(axis=1).tolist()
+        else:
+            delta = [0.0] * size
+            for start, end, hours in zip(self.start, self.end, self.hours):
+                rate = hours / (end - start + 1)
+                delta[start - base] += rate
+                delta[end + 1 - base] -= rate
+            per_week = [0.0] * weeks
+            running = 0.0
+            for day in range(size - 1):
+                running += delta[day]
+                per_week[day // 7] += running
+        return [(date.fromordinal(base + 7 * week), hours) for week, hours in enumerate(per_week)]
+
+    def burndown(self, budget=None):
+        """[(monday, hours, remaining)] per week: hours logged and budget left after that week
+        (budget defaults to the total, so the last week ends at zero)."""
+        remaining = self.total() if budget is None else float(budget)
+        rows = []
+        for monday, hours in self.weekly():
+            remaining -= hours
+            rows.append((monday, hours, round(max(remaining, 0.0), 6)))
+        return rows
+
+
+def _month_span(first, last):
+    """'Nov 2025 - Jan 2026' (or just 'Nov 2025') for a date range."""
+    start, end = f'{first:%b %Y}', f'{last:%b %Y}'
+    return start if start == end else f'{start} - {end}'
+
+
+def _hours_store(block, phases, source, stores):
+    """Store for an analytics block: its time-entries "source" file, else the spec's phases
+    (built once per compile and shared by every block that reads them)."""
+    key = block.get('source') or ''
+    if key not in stores:
+        records = iter_time_entries(block['source']) if key else phases
+        stores[key] = HoursStore.from_records(records, block.get('source') or source)
+    return stores[key]
+
+
+def _phase_summary_table(block, phases, store):
+    """Expand a phase_summary block into a plain table block: one row per phase plus a total row
+    whose hours (and, unless given, date span) come from the hours store."""
+    rows = [
+        (f"{i}. {phase.get('short_title', phase['title'])}", phase.get('short_dates', phase['dates']),
+         _hours_text(phase['hours']), phase['team'])
+        for i, phase in enumerate(phases, 1)
     ]
-    comp_table = Table(comp_data, colWidths=[1.5 * inch, 1.8 * inch, 1.0 * inch, 2.2 * inch])
-    comp_table.setStyle(table_style_card())
-    story.append(comp_table)
+    total_dates = block.get('total_dates')
+    if total_dates is None:
+        span = store.date_range()
+        total_dates = _month_span(*span) if span else '—'
+    total = (block.get('total_label', 'TOTAL'), total_dates, _hours_text(store.total()), block.get('total_team', ''))
+    return {'type': 'table', 'header': block['header'], 'rows': rows, 'total': total,
+            'col_widths': block['col_widths'], 'zebra': True, 'uniform': block.get('uniform')}
+
+
+def _team_summary_table(block, store):
+    """Expand a team_summary block into a table block: hours and share per team, then the total."""
+    total = store.total()
+    rows = [(team or 'Unassigned', _hours_text(round(hours, 2)), f'{100 * hours / total:.0f}%' if total else '-')
+            for team, hours in store.by_team().items()]
+    return {'type': 'table', 'header': block['header'], 'rows': rows, 'col_widths': block['col_widths'],
+            'total': (block.get('total_label', 'TOTAL'), _hours_text(round(total, 2)), '100%' if total else '-'),
+            'zebra': True, 'uniform': block.get('uniform')}
+
+
+def _image_block(block, source):
+    """Resolve an image block's src ("/images/x.png" is the site's public/ folder, else relative
+    to the spec) and its size in points (height from the aspect ratio unless given)."""
+    src = block['src']
+    if src.startswith('/'):
+        block['url'] = src
+        block['src'] = os.path.join(REPO_ROOT, 'public', src.lstrip('/'))
+    else:
+        block['src'] = os.path.join(os.path.dirname(os.path.abspath(source)), src)
+    if not os.path.isfile(block['src']):
+        raise SpecError(f'{source}: image {src!r} not found')
+    if block.get('format', 'auto') not in ('auto', 'PNG', 'JPEG'):
+        raise SpecError(f"{source}: image format must be auto, PNG or JPEG, not {block['format']!r}")
+    try:
+        px_width, px_height = image_size(block['src'])
+    except OSError as e:
+        raise SpecError(f'{source}: image {src!r} cannot be read: {e}') from None
+    block['width'] = block['width'] * inch
+    if 'height' in block:
+        block['height'] = block['height'] * inch
+    else:
+        block['height'] = block['width'] * px_height / px_width
+    block['px'] = _derivative_size(block['src'], block['width'], block['height'])
+    return block
+
+
+def _compile_block(block, phases, source, stores):
+    kind = block.get('type')
+    if kind not in REQUIRED_FIELDS:
+        raise SpecError(f'{source}: unknown block type {kind!r}')
+    missing = [field for field in REQUIRED_FIELDS[kind] if field not in block]
+    if missing:
+        raise SpecError(f"{source}: {kind} block is missing {', '.join(missing)}")
+    if kind in PHASE_BLOCKS and not phases and not (kind != 'phase_summary' and block.get('source')):
+        raise SpecError(f'{source}: {kind} block needs a top-level "phases" list')
+    block = dict(block)
+    if block.get('source'):
+        # Data files are relative to the spec file
+        block['source'] = os.path.join(os.path.dirname(os.path.abspath(source)), block['source'])
+    if kind == 'image':
+        block = _image_block(block, source)
+    if kind == 'phase_summary':
+        block = _phase_summary_table(block, phases, _hours_store({}, phases, source, stores))
+    if kind == 'team_summary':
+        block = _team_summary_table(block, _hours_store(block, phases, source, stores))
+    if kind == 'hours_chart':
+        store = _hours_store(block, phases, source, stores)
+        try:
+            block['budget'] = store.total() if block.get('budget') in (None, '') else float(block['budget'])
+        except (TypeError, ValueError):
+            raise SpecError(f"{source}: hours_chart budget must be a number of hours, not {block['budget']!r}") from None
+        block['weeks'] = store.burndown(block['budget'])
+    if kind == 'roster':
+        block = {'type': 'table', 'header': block['header'], 'rows': [(name, block.get('role', '')) for name in _as_list(block['names'])],
+                 'col_widths': block['col_widths'], 'zebra': block.get('zebra'), 'header_rule': block.get('header_rule')}
+    if kind in ('meta', 'table'):
+        # A whole-cell placeholder may hold a list (e.g. student names); cells are text
+        block['rows'] = [[_format_placeholder(cell) for cell in row] for row in block['rows']]
+    if kind == 'signatures':
+        block['signers'] = [_signer(s) for s in _as_list(block['signers'])]
+        if block.get('advisor'):
+            block['advisor'] = _signer(block['advisor'])
+    # Spec lengths are in inches
+    if 'col_widths' in block:
+        block['col_widths'] = [w * inch for w in block['col_widths']]
+    if 'height' in block and kind != 'image':
+        block['height'] = block['height'] * inch
+    return block
+
+
+def _as_list(value):
+    # A one-name merge row fills a list field with a plain string
+    return [value] if isinstance(value, (str, dict)) else value
+
+
+def _signer(signer):
+    """Signer from a name string or a {name, signature} object; the signature defaults to the name."""
+    if isinstance(signer, str):
+        signer = {'name': signer}
+    return dict(signer, signature=signer.get('signature', signer['name']))
+
+
+def normalize_phase(phase, source='<spec>'):
+    """Phase with numeric hours (merge rows and query strings carry them as text)."""
+    hours = phase.get('hours')
+    if isinstance(hours, (int, float)) and not isinstance(hours, bool):
+        return phase
+    try:
+        return dict(phase, hours=float(hours))
+    except (TypeError, ValueError):
+        raise SpecError(f"{source}: phase {phase.get('title', '')!r}: hours must be a number, not {hours!r}") from None
+
+
+def compile_spec(raw, source='<spec>', values=None):
+    """Validate a parsed spec and resolve derived content (placeholders, units, phase summaries) once.
+
+    `values` override the spec's "defaults" when filling {{placeholders}}.
+    """
+    if not isinstance(raw, dict) or 'blocks' not in raw:
+        raise SpecError(f'{source}: a spec is an object with a "blocks" list')
+    values = {**raw.get('defaults', {}), **(values or {})}
+    filled = fill_placeholders({k: v for k, v in raw.items() if k != 'defaults'}, values, source)
+    name = filled.get('name') or os.path.splitext(os.path.basename(source))[0]
+    phases = [normalize_phase(phase, source) for phase in filled.get('phases', [])]
+    stores = {}  # hours store per data source, shared by the blocks that read it
+    blocks = [_compile_block(block, phases, source, stores) for block in filled['blocks']]
+    return DocumentSpec(
+        name=name,
+        title=filled.get('title', name.replace('-', ' ').upper()),
+        subtitle=filled.get('subtitle', 'Monroe Resource Hub | Central Academy of Technology and Arts | TSA 2026'),
+        metadata=filled.get('metadata', {}),
+        phases=phases,
+        blocks=blocks,
+        raw=raw,
+        source=source,
+    )
+
+
+def _parse_spec_file(path):
+    with open(path, encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise SpecError(f'{path}: YAML specs need PyYAML (pip install pyyaml)') from None
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+# (absolute path, mtime_ns, size) -> DocumentSpec; a batch run parses each spec file once
+_COMPILED_SPECS = {}
+
+
+def load_spec(path):
+    """Compiled spec for a file, cached until the file changes."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    spec = _COMPILED_SPECS.get(key)
+    if spec is None:
+        with _span('stage', 'compile-spec', source=os.path.basename(path)):
+            spec = compile_spec(_parse_spec_file(path), source=path)
+        _COMPILED_SPECS[key] = spec
+    return spec
+
+
+def find_specs(spec_dir=SPEC_DIR):
+    """Document name -> spec path for every spec file in a directory (sorted by file name)."""
+    specs = {}
+    if os.path.isdir(spec_dir):
+        for filename in sorted(os.listdir(spec_dir)):
+            stem, ext = os.path.splitext(filename)
+            if ext in SPEC_EXTENSIONS:
+                specs.setdefault(stem, os.path.join(spec_dir, filename))
+    return specs
+
+
+def resolve_spec(target):
+    """Spec path for a document name (looked up in scripts/documents/) or a path to a spec file."""
+    if os.path.isfile(target):
+        return os.path.abspath(target)
+    path = find_specs().get(target)
+    if path is None:
+        raise SpecError(f'no document spec named {target!r} in {SPEC_DIR}')
+    return path
+
+
+def iter_story(spec, styles=None):
+    """Flowables for a compiled spec, produced block by block."""
+    styles = styles or get_styles()
+    for block in spec.blocks:
+        render = BLOCK_RENDERERS[block['type']]
+        yield from (render(block, styles, spec) if _PROFILER is None else _timed_block(render, block, styles, spec))
+
+
+def build_story(spec, styles=None):
+    """Flowables for a compiled spec, as a list."""
+    return list(iter_story(spec, styles))
+
+
+class FlowableStream:
+    """List-like window over a flowable iterator, consumed from the front by a doc template.
+
+    ReportLab's build loop only touches the head of its flowables list (peek, delete, put
+    split remainders back, look ahead for keepWithNext), so only `lookahead` flowables are
+    materialized at a time and the story is never held in memory as a whole.
+    """
+
+    def __init__(self, flowables, lookahead=64):
+        self._iter = iter(flowables)
+        self._buffer = []
+        self.lookahead = lookahead
+        self.consumed = 0  # flowables pulled from the iterator so far
+
+    def _fill(self, count):
+        while self._iter is not None and len(self._buffer) < count:
+            try:
+                self._buffer.append(next(self._iter))
+                self.consumed += 1
+            except StopIteration:
+                self._iter = None
+
+    def __len__(self):
+        self._fill(self.lookahead)
+        return len(self._buffer)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            self._fill(self.lookahead if key.stop is None else key.stop)
+        else:
+            self._fill(key + 1)
+        return self._buffer[key]
+
+    def __setitem__(self, key, value):
+        self._buffer[key] = value
+
+    def __delitem__(self, key):
+        del self._buffer[key]
+
+    def insert(self, index, value):
+        self._buffer.insert(index, value)
+
+
+class StreamingDocTemplate(SimpleDocTemplate):
+    """SimpleDocTemplate whose build() also accepts a generator of flowables.
+
+    Pages are laid out and written to the canvas as flowables arrive, so the story is never
+    held whole; memory is flat in the story but not in the page count. ReportLab's canvas
+    keeps every finished page (its compressed content stream and page object, about 8 KB for a
+    work-log page) until save, so a streamed build peaks at about 1 MB plus that per page
+    (bench_tsa_pdfs.py stream checks it against 12 KB per page). Page templates, onFirstPage /
+    onLaterPages callbacks and doc.page numbering behave exactly as with a list.
+    `first_page` numbers the pages of a document that continues another (a chunk, see
+    render_spec_chunked); doc.page and canvas.getPageNumber() start there.
+    """
+
+    first_page = 1
+
+    def handle_documentBegin(self):
+        SimpleDocTemplate.handle_documentBegin(self)
+        self.page = self.first_page - 1
+        self.canv._pageNumber = self.first_page
+
+    def build(self, flowables, lookahead=64, **kwargs):
+        if not isinstance(flowables, list):
+            flowables = FlowableStream(flowables, lookahead)
+        SimpleDocTemplate.build(self, flowables, **kwargs)
+
+    # Profiling hooks (see Profiler); a single global check when profiling is off
+    def handle_flowable(self, flowables):
+        if _PROFILER is None:
+            return SimpleDocTemplate.handle_flowable(self, flowables)
+        with _PROFILER.span('flowable', type(flowables[0]).__name__, {'page': self.page}):
+            return SimpleDocTemplate.handle_flowable(self, flowables)
+
+    def handle_pageBegin(self):
+        if _PROFILER is not None:
+            self._page_span = _PROFILER.span('page', f'page {self.page + 1}', {'document': _target_name(self.filename)})
+            self._page_span.__enter__()
+        SimpleDocTemplate.handle_pageBegin(self)
+
+    def handle_pageEnd(self):
+        SimpleDocTemplate.handle_pageEnd(self)
+        span = getattr(self, '_page_span', None)
+        if span is not None:
+            self._page_span = None
+            span.__exit__(None, None, None)
+
+    def _endBuild(self):
+        if _PROFILER is None:
+            return SimpleDocTemplate._endBuild(self)
+        self._doSave = 0
+        SimpleDocTemplate._endBuild(self)
+        with _PROFILER.span('stage', 'save', {'document': _target_name(self.filename)}):
+            self.canv.save()
+
+
+class PdfSink:
+    """Writable binary target that keeps a rendered PDF in memory.
+
+    ReportLab hands over the finished file in one write(), so getvalue() returns that bytes
+    object itself (no copy). With `buffer` (a bytearray, memoryview or other writable buffer)
+    the PDF is written into it instead, getvalue() returns a memoryview of the used part, and
+    a PDF that does not fit raises ValueError.
+    """
+
+    def __init__(self, buffer=None, name='<memory>'):
+        self.name = name
+        self.buffer = memoryview(buffer).cast('B') if buffer is not None else None
+        self.chunks = []
+        self.size = 0
+
+    def write(self, data):
+        end = self.size + len(data)
+        if self.buffer is None:
+            self.chunks.append(data)
+        elif end > len(self.buffer):
+            raise ValueError(f'PDF needs more than the {len(self.buffer)} bytes of its buffer')
+        else:
+            self.buffer[self.size:end] = data
+        self.size = end
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        if self.buffer is not None:
+            return self.buffer[:self.size]
+        return self.chunks[0] if len(self.chunks) == 1 else b''.join(self.chunks)
+
+
+def _target_name(target):
+    """Short label for an output target (path or writable object), for profiles and logs."""
+    if isinstance(target, (str, os.PathLike)):
+        return os.path.basename(target)
+    return str(getattr(target, 'name', f'<{type(target).__name__}>'))
+
+
+def render_flowables(flowables, out_path, title, subtitle, metadata=None, reproducible=False, canvasmaker=None,
+                     first_page=1):
+    """Lay out flowables (a list or any iterable, streamed) under the standard header/footer chrome.
+
+    out_path is a file path or any writable binary target: a file object, pipe, io.BytesIO, a
+    PdfSink, or a writable buffer such as a pre-sized bytearray (wrapped in a PdfSink).
+    With `reproducible`, identical inputs give byte-identical PDFs: ReportLab's invariant mode
+    fixes the creation date (SOURCE_DATE_EPOCH, else 2000-01-01) and so the document ID,
+    which is a digest of the content and that date. `canvasmaker` swaps in a Canvas subclass
+    (see preview_tsa_pdfs.RecordingCanvas); the returned doc's .canv is the canvas used.
+    With `first_page` > 1 the flowables continue a document: pages are numbered from there
+    and all of them get the later-page chrome.
+    """
+    metadata = metadata or {}
+    if isinstance(out_path, (str, os.PathLike)):
+        out_path = os.fspath(out_path)
+        os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    elif not callable(getattr(out_path, 'write', None)):
+        out_path = PdfSink(out_path)
+    doc = StreamingDocTemplate(
+        out_path,
+        pagesize=letter,
+        leftMargin=MARGIN,
+        rightMargin=MARGIN,
+        topMargin=HEADER_HEIGHT + 0.25 * inch,
+        bottomMargin=BOTTOM_MARGIN,
+        invariant=1 if reproducible else None,  # None: rl_config.invariant (RL_invariant=1)
+    )
+    doc.first_page = first_page
 
     def on_first(canvas, doc):
-        canvas.setTitle('Work Log')
-        canvas.setAuthor('Monroe Resource Hub | CATA TSA')
-        first_page_cb(canvas, doc, 'WORK LOG', 'Monroe Resource Hub | Central Academy of Technology and Arts | TSA 2026')
+        canvas.setTitle(metadata.get('title', title.title()))
+        canvas.setAuthor(metadata.get('author', 'Monroe Resource Hub | CATA TSA'))
+        with _span('page', 'page-chrome'):
+            first_page_cb(canvas, doc, title, subtitle)
 
     def on_later(canvas, doc):
-        later_pages_cb(canvas, doc, 'WORK LOG', 'Monroe Resource Hub | Central Academy of Technology and Arts | TSA 2026')
+        with _span('page', 'page-chrome'):
+            later_pages_cb(canvas, doc, title, subtitle)
+
+    with _span('stage', 'layout', document=_target_name(out_path)), _without_ascii85():
+        doc.build(flowables, onFirstPage=on_first if first_page == 1 else on_later, onLaterPages=on_later,
+                  canvasmaker=canvasmaker or Canvas)
+    return doc
+
+
+def render_pdf(flowables, title, subtitle, metadata=None, buffer=None, reproducible=False):
+    """render_flowables() into memory: the PDF as bytes, or as a memoryview into `buffer`."""
+    sink = PdfSink(buffer)
+    render_flowables(flowables, sink, title, subtitle, metadata, reproducible)
+    return sink.getvalue()
+
+
+@contextmanager
+def _without_ascii85():
+    """ReportLab wraps compressed streams in ASCII85 by default (+25% on images and pages);
+    binary streams are fine for files served over HTTP."""
+    from reportlab import rl_config
+    previous, rl_config.useA85 = rl_config.useA85, 0
+    try:
+        yield
+    finally:
+        rl_config.useA85 = previous
+
+
+def render_spec(spec, out_path=None, reproducible=False):
+    """Render a compiled spec (or spec path) to out_path (default: public/documents/<name>.pdf),
+    a file path or writable binary target as for render_flowables().
 
-    doc.build(story, onFirstPage=on_first, onLaterPages=on_later)
-    print('Generated:', out_path)
+    The story is streamed into the layout engine block by block rather than built up front.
+    """
+    if not isinstance(spec, DocumentSpec):
+        spec = load_spec(spec)
+    out_path = out_path or os.path.join(OUT_DIR, f'{spec.name}.pdf')
+    render_flowables(iter_story(spec), out_path, spec.title, spec.subtitle, spec.metadata, reproducible)
+    if isinstance(out_path, (str, os.PathLike)):
+        print('Generated:', out_path)
     return out_path
 
 
-if __name__ == '__main__':
+def render_spec_bytes(spec, buffer=None, reproducible=False):
+    """Render a compiled spec (or spec path) in memory; see render_pdf()."""
+    if not isinstance(spec, DocumentSpec):
+        spec = load_spec(spec)
+    sink = PdfSink(buffer, f'{spec.name}.pdf')
+    render_flowables(iter_story(spec), sink, spec.title, spec.subtitle, spec.metadata, reproducible)
+    return sink.getvalue()
+
+
+def build_document(target):
+    """Build one document by name or spec path; returns the output path."""
+    return render_spec(resolve_spec(target))
+
+
+def build_student_copyright_checklist():
+    return build_document('student-copyright-checklist')
+
+
+def build_work_log():
+    return build_document('work-log')
+
+
+def _hash_file(h, path):
+    """Feed a file's bytes into hash `h`; a missing file hashes as its absence."""
+    if path and os.path.isfile(path):
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    else:
+        h.update(b'<missing>')
+
+
+def _style_definitions(styles):
+    """Plain, order-stable view of every ParagraphStyle attribute in a stylesheet."""
+    definitions = {}
+    for name, style in sorted(styles.items()):
+        attrs = {}
+        for key, value in sorted(style.__dict__.items()):
+            if key == 'parent':
+                value = value.name if value is not None else None
+            attrs[key] = repr(value)
+        definitions[name] = attrs
+    return definitions
+
+
+def document_fingerprint(spec, optimize=False, reproducible=False, chunks=1):
+    """Hash of everything that determines a document's bytes: spec data, styles, logo, signature
+    font and the build modes (post-build optimizer, reproducible output and its date, chunks)."""
+    h = hashlib.sha256()
+    h.update(f"v{BUILD_CACHE_VERSION}:{spec.name}:{'optimized' if optimize else 'plain'}".encode())
+    if reproducible:
+        h.update(f":reproducible:{os.environ.get('SOURCE_DATE_EPOCH', '')}".encode())
+    if chunks > 1:
+        h.update(f':chunks:{chunks}'.encode())
+    h.update(json.dumps(spec.raw, sort_keys=True).encode())
+    for block in spec.blocks:
+        if block.get('source'):
+            _hash_file(h, block['source'])
+        if block['type'] == 'image':
+            _hash_file(h, block['src'])
+    h.update(json.dumps(_style_definitions(get_styles()), sort_keys=True).encode())
+    _hash_file(h, LOGO_PATH)
+    h.update(get_signature_font().encode())
+    _hash_file(h, SIGNATURE_FONT_PATH)
+    return h.hexdigest()
+
+
+def load_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest.get('documents', {}) if manifest.get('version') == BUILD_CACHE_VERSION else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(documents, path=MANIFEST_PATH):
+    """Write the manifest atomically so an interrupted run never leaves it half-written."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': BUILD_CACHE_VERSION, 'documents': documents}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _init_worker():
+    """Pool initializer: fonts and the optimized logo are set up once per worker, not per document."""
+    init_resources()
+
+
+def _run_builder(spec_path, optimize=False, reproducible=False, chunks=1, pool=None):
+    """Build (and optionally optimize) one document from its spec file, check its size budget,
+    and report success or failure instead of raising. With `chunks` > 1 the document is
+    rendered in parts on `pool` (see render_spec_chunked)."""
+    start = time.perf_counter()
+    name = os.path.splitext(os.path.basename(spec_path))[0]
+    try:
+        spec = load_spec(spec_path)  # compiled once per worker process
+        name = spec.name
+        path = _output_path(name)
+        # Rendered (and optimized) in memory, so the PDF is hashed and written to disk once
+        if chunks > 1:
+            data, _ = render_spec_chunked(spec, chunks, pool, reproducible, page_numbers=True)
+        else:
+            data = render_spec_bytes(spec, reproducible=reproducible)
+        if optimize:
+            with _span('stage', 'optimize', document=os.path.basename(path)):
+                optimized = optimize_pdf_bytes(data)
+            data = optimized[0] if optimized else data
+        os.makedirs(OUT_DIR, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        print('Generated:', path)
+        result = {'name': name, 'ok': True, 'skipped': False, 'path': path, 'error': None, 'bytes': len(data),
+                  'sha256': hashlib.sha256(data).hexdigest()}
+        budget = spec.raw.get('size_budget_kb')
+        if budget is not None and len(data) > budget * 1024:
+            # The budget is for the document itself: an embedded signature font (scripts/fonts)
+            # adds its subset on top, and that size depends on which font is installed
+            fonts = sum(size for font, size in pdf_font_bytes(data).items() if font not in pdfmetrics.standardFonts)
+            if len(data) - fonts > budget * 1024:
+                result.update(ok=False, error=f'{name}: {(len(data) - fonts) / 1024:.1f} KB (without {fonts / 1024:.1f} KB '
+                                              f'of embedded fonts) is over its size budget of {budget} KB')
+        return dict(result, seconds=time.perf_counter() - start)
+    except Exception:
+        return {'name': name, 'ok': False, 'skipped': False, 'path': None, 'error': traceback.format_exc(), 'seconds': time.perf_counter() - start}
+
+
+def _output_path(name):
+    return os.path.join(OUT_DIR, f'{name}.pdf')
+
+
+def build_documents(targets=None, jobs=1, force=False, optimize=False, reproducible=False, chunks=1):
+    """Build documents (names or spec paths; default: every spec in scripts/documents/),
+    serially or on a pool of `jobs` processes, or one at a time each split into `chunks` parts
+    rendered on a pool of that many processes (for very long documents).
+
+    Documents whose input fingerprint matches the manifest (and whose PDF still exists) are
+    skipped unless `force` is set. With `optimize`, each new PDF goes through optimize_pdf_bytes();
+    with `reproducible`, identical inputs give identical bytes (see render_flowables).
+    Returns one result dict per document (name, ok, skipped, path, error, seconds, and for built
+    ones bytes, sha256 and changed: whether the bytes differ from the previous build) in request
+    order; a document over its spec's size_budget_kb is not ok.
+    """
+    spec_paths = [resolve_spec(t) for t in targets] if targets else list(find_specs().values())
+    specs = [load_spec(path) for path in spec_paths]
+    manifest = load_manifest()
+    fingerprints = {spec.name: document_fingerprint(spec, optimize, reproducible, chunks) for spec in specs}
+    results = {}
+    for spec in specs:
+        entry = manifest.get(spec.name)
+        if not force and entry and entry.get('fingerprint') == fingerprints[spec.name] and os.path.isfile(_output_path(spec.name)):
+            results[spec.name] = {'name': spec.name, 'ok': True, 'skipped': True, 'path': _output_path(spec.name), 'error': None, 'seconds': 0.0}
+    pending = [spec for spec in specs if spec.name not in results]
+    # Resize every embedded image once, on threads, before documents (and worker processes) need them
+    image_derivatives([(block['src'], block['px'], block.get('format', 'auto'))
+                       for spec in pending for block in spec.blocks if block['type'] == 'image'],
+                      max(jobs, chunks, IMAGE_JOBS))
+
+    if chunks > 1 and pending:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=chunks, initializer=_init_worker) as pool:
+            for spec in pending:
+                results[spec.name] = _run_builder(spec.source, optimize, reproducible, chunks, pool)
+    elif jobs <= 1 or len(pending) <= 1:
+        for spec in pending:
+            results[spec.name] = _run_builder(spec.source, optimize, reproducible)
+    else:
+        results.update(_build_in_pool(pending, jobs, optimize, reproducible))
+
+    built = [spec.name for spec in pending if results[spec.name]['ok']]
+    if built:
+        for name in built:
+            result = results[name]
+            result['changed'] = result['sha256'] != manifest.get(name, {}).get('sha256')
+            manifest[name] = {'fingerprint': fingerprints[name], 'output': os.path.basename(_output_path(name)),
+                              'sha256': result['sha256']}
+        save_manifest(manifest)
+    return [results[spec.name] for spec in specs]
+
+
+def _build_in_pool(specs, jobs, optimize=False, reproducible=False):
+    # Imported here: multiprocessing is ~20 ms of import time that serial/no-op runs never need
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    results = {}
+    with ProcessPoolExecutor(max_workers=min(jobs, len(specs)), initializer=_init_worker) as pool:
+        futures = {pool.submit(_run_builder, spec.source, optimize, reproducible): spec.name for spec in specs}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception:
+                # Worker died (e.g. killed or unpicklable result); record it like a build failure
+                results[name] = {'name': name, 'ok': False, 'skipped': False, 'path': None, 'error': traceback.format_exc(), 'seconds': 0.0}
+    return results
+
+
+def _reproducible_digest(spec_path, optimize=False):
+    """sha256 of one document rendered in reproducible mode (and optimized, when asked)."""
+    init_resources()
+    data = render_spec_bytes(load_spec(spec_path), reproducible=True)
+    if optimize:
+        optimized = optimize_pdf_bytes(data)
+        data = optimized[0] if optimized else data
+    return hashlib.sha256(data).hexdigest()
+
+
+def check_reproducible(targets=None, optimize=False):
+    """Render each document three times in reproducible mode and compare the hashes: twice in
+    this process (cold, then with warm caches) and once in a fresh process (different hash
+    seed, nothing shared). Nothing is written. Returns {name: [digest, digest, digest]}.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    spec_paths = [resolve_spec(t) for t in targets] if targets else list(find_specs().values())
+    digests = {}
+    for path in spec_paths:
+        name = load_spec(path).name
+        digests[name] = [_reproducible_digest(path, optimize), _reproducible_digest(path, optimize)]
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            digests[name].append(pool.submit(_reproducible_digest, path, optimize).result())
+    return digests
+
+
+# --- Chunked rendering: one long document laid out on several processes ---
+CHUNK_MIN_WEIGHT = 60  # about 20 pages of phase cards; smaller chunks cost more in startup and merging than they save
+_CHUNK_PAGES = {}  # (spec name, chunk plan) -> page count of each chunk at the last render
+
+
+def _story_units(spec):
+    """(block index, phase index or None, weight) for every point a story may be split at:
+    between blocks, and between the phases of a phases block. Weights approximate height
+    (one phase card is about four table rows)."""
+    units = []
+    for index, block in enumerate(spec.blocks):
+        if block['type'] == 'phases':
+            count = sum(1 for _ in iter_phases_jsonl(block['source'])) if block.get('source') else len(spec.phases)
+            units += [(index, phase, 1.0) for phase in range(count)]
+        else:
+            units.append((index, None, max(1.0, len(block.get('rows', ())) / 4)))
+    return units
+
+
+def plan_chunks(spec, chunks):
+    """Split a spec's story into at most `chunks` runs of about equal weight, at section
+    boundaries. Each chunk is a tuple of (block index, phase start, phase stop) slices; start
+    and stop are None for a whole block."""
+    units = _story_units(spec)
+    total = sum(weight for _, _, weight in units)
+    chunks = max(1, min(chunks, int(total // CHUNK_MIN_WEIGHT)))
+    plan, current, done = [], [], 0.0
+    for index, phase, weight in units:
+        if current and len(plan) < chunks - 1 and done >= total * (len(plan) + 1) / chunks:
+            plan.append(current)
+            current = []
+        last = current[-1] if current else None
+        if phase is not None and last is not None and last[0] == index:
+            current[-1] = (index, last[1], phase + 1)
+        else:
+            current.append((index, phase, None if phase is None else phase + 1))
+        done += weight
+    plan.append(current)
+    return [tuple(chunk) for chunk in plan]
+
+
+def iter_chunk_story(spec, chunk, styles=None):
+    """Flowables for one chunk of a spec's story (see plan_chunks)."""
+    styles = styles or get_styles()
+    for index, start, stop in chunk:
+        block = spec.blocks[index]
+        if start is None:
+            yield from BLOCK_RENDERERS[block['type']](block, styles, spec)
+        else:
+            phases = iter_phases_jsonl(block['source']) if block.get('source') else spec.phases
+            yield from phase_flowables(islice(phases, start, stop), styles)
+
+
+def _render_chunk(spec_path, chunk, first_page, reproducible=False):
+    """Worker: (PDF bytes, page count) of one chunk, its pages numbered from first_page."""
+    spec = load_spec(spec_path)
+    sink = PdfSink(name=f'{spec.name}.pdf')
+    doc = render_flowables(iter_chunk_story(spec, chunk), sink, spec.title, spec.subtitle, spec.metadata,
+                           reproducible, first_page=first_page)
+    return sink.getvalue(), doc.page - first_page + 1
+
+
+def render_spec_chunked(spec, chunks, pool=None, reproducible=False, page_numbers=False):
+    """Render one long document as up to `chunks` parts laid out in parallel on `pool` (a
+    process pool; by default one is started for the call) and merged into one PDF, sharing
+    identical fonts, images and forms (needs pikepdf). Returns (bytes, {'chunks', 'pages',
+    'first_pages', 'rerendered'}), or the plain single-process render when pikepdf is missing
+    or the document is too short to split.
+
+    Every chunk after the first starts a new page, so pages break at chunk boundaries that a
+    single render would fill. Page counts do not depend on page numbers, so chunks are laid
+    out at once with the start pages of their last render (page 2 at first); the chrome is
+    the same on every later page, but with `page_numbers` any chunk that started elsewhere is
+    rendered again with its real first page.
+    """
+    if not isinstance(spec, DocumentSpec):
+        spec = load_spec(spec)
+    plan = plan_chunks(spec, chunks)
+    if len(plan) == 1 or importlib.util.find_spec('pikepdf') is None:
+        return render_spec_bytes(spec, reproducible=reproducible), {'chunks': 1, 'pages': None, 'first_pages': [1], 'rerendered': 0}
+    key = (spec.name, tuple(plan))
+    known = _CHUNK_PAGES.get(key)
+    starts = [1] + ([1 + sum(known[:k]) for k in range(1, len(plan))] if known else [2] * (len(plan) - 1))
+    owned = None
+    if pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = owned = ProcessPoolExecutor(max_workers=len(plan), initializer=_init_worker)
+    try:
+        parts = [f.result() for f in [pool.submit(_render_chunk, spec.source, chunk, start, reproducible)
+                                      for chunk, start in zip(plan, starts)]]
+        pages = [count for _, count in parts]
+        real = [1 + sum(pages[:k]) for k in range(len(plan))]
+        stale = [k for k in range(len(plan)) if starts[k] != real[k]] if page_numbers else []
+        futures = {k: pool.submit(_render_chunk, spec.source, plan[k], real[k], reproducible) for k in stale}
+        for k, future in futures.items():
+            parts[k] = future.result()
+    finally:
+        if owned is not None:
+            owned.shutdown()
+    _CHUNK_PAGES[key] = pages
+    data = merge_pdf_chunks([data for data, _ in parts])
+    return data, {'chunks': len(plan), 'pages': sum(pages), 'first_pages': real if page_numbers else starts,
+                  'rerendered': len(stale)}
+
+
+# --- Post-build optimizer (optional: needs pikepdf) ---
+PDF_FLATE_LEVEL = 9
+_PAINT_OPERATORS = frozenset(['f', 'F', 'f*', 'B', 'B*', 'b', 'b*', 'S', 's', 'sh', 'Do', 'Tj', 'TJ', "'", '"', 'BI', 'INLINE IMAGE'])
+
+
+def _content_key(obj, keys):
+    """Hashable key of a PDF object's content: streams by bytes and dictionary, dictionaries and
+    arrays by their members, so references to equal objects (an image's SMask, a form's font
+    resources) compare by content rather than object number. `keys` memoizes indirect objects."""
+    import pikepdf
+    if isinstance(obj, (pikepdf.Stream, pikepdf.Dictionary, pikepdf.Array)) and obj.is_indirect:
+        objgen = obj.objgen
+        if objgen not in keys:
+            keys[objgen] = objgen  # cycle guard
+            keys[objgen] = _direct_content_key(obj, keys)
+        return keys[objgen]
+    return _direct_content_key(obj, keys)
+
+
+def _direct_content_key(obj, keys):
+    import pikepdf
+    if isinstance(obj, pikepdf.Stream):
+        fields = tuple((name, _content_key(value, keys)) for name, value in sorted(obj.stream_dict.items()) if name != '/Length')
+        return hashlib.sha256(obj.read_raw_bytes() + repr(fields).encode()).digest()
+    if isinstance(obj, pikepdf.Dictionary):
+        return tuple((name, _content_key(value, keys)) for name, value in sorted(obj.items()))
+    if isinstance(obj, pikepdf.Array):
+        return tuple(_content_key(value, keys) for value in obj)
+    return obj.unparse() if isinstance(obj, pikepdf.Object) else repr(obj)
+
+
+def _dedupe_streams(pdf):
+    """Point every reference to a byte-identical stream (image, font program, form) at one copy."""
+    import pikepdf
+    keys, canonical, replace = {}, {}, {}
+    for obj in pdf.objects:
+        if isinstance(obj, pikepdf.Stream):
+            first = canonical.setdefault(_content_key(obj, keys), obj)
+            if first.objgen != obj.objgen:
+                replace[obj.objgen] = first
+    _replace_references(pdf, replace)
+    return len(replace)
+
+
+def _dedupe_fonts(pdf):
+    """Point every reference to an identical font dictionary at one copy (chunks of one
+    document each carry the same standard fonts and, often, the same embedded subsets)."""
+    import pikepdf
+    keys, canonical, replace = {}, {}, {}
+    for obj in pdf.objects:
+        if isinstance(obj, pikepdf.Dictionary) and obj.get('/Type') == '/Font':
+            first = canonical.setdefault(_content_key(obj, keys), obj)
+            if first.objgen != obj.objgen:
+                replace[obj.objgen] = first
+    _replace_references(pdf, replace)
+    return len(replace)
+
+
+def _replace_references(pdf, replace):
+    """Rewrite every indirect reference to an object in `replace` (objgen -> object)."""
+    import pikepdf
+
+    def rewrite(container):
+        items = container.items() if isinstance(container, pikepdf.Dictionary) else enumerate(container)
+        for key, value in list(items):
+            if not isinstance(value, pikepdf.Object):
+                continue  # numbers and strings come back as Python values
+            if value.is_indirect:
+                if value.objgen in replace:
+                    container[key] = replace[value.objgen]
+            elif isinstance(value, (pikepdf.Dictionary, pikepdf.Array)):
+                rewrite(value)
+
+    if replace:
+        for obj in pdf.objects:
+            if isinstance(obj, pikepdf.Stream):
+                rewrite(obj.stream_dict)
+            elif isinstance(obj, (pikepdf.Dictionary, pikepdf.Array)):
+                rewrite(obj)
+
+
+def _strip_background_fill(pdf, content_owner, box):
+    """Drop a white fill covering `box` when it is the first thing painted (invisible on a white page)."""
+    import pikepdf
+    instructions = pikepdf.parse_content_stream(content_owner)
+    white, rect, strip = False, None, None
+    for i, (operands, operator) in enumerate(instructions):
+        op = str(operator)
+        if op in ('rg', 'g'):
+            white = all(float(v) == 1 for v in operands)
+        elif op == 're':
+            x, y, w, h = (float(v) for v in operands)
+            rect = (i, x <= box[0] and y <= box[1] and x + w >= box[2] and y + h >= box[3])
+        elif op in ('f', 'F', 'f*'):
+            if white and rect and rect[1]:
+                strip = (rect[0], i)
+            break
+        elif op in _PAINT_OPERATORS:
+            break
+    if strip is None:
+        return False
+    kept = [ins for i, ins in enumerate(instructions) if i not in strip]
+    data = pikepdf.unparse_content_stream(kept)
+    if isinstance(content_owner, pikepdf.Page):
+        content_owner.obj.Contents = pdf.make_stream(data)
+    else:
+        content_owner.write(data)
+    return True
+
+
+def optimize_pdf_bytes(data, linearize=True):
+    """Shrink a PDF held in memory: share identical streams, drop full-page white background
+    fills, recompress every stream at Flate level 9 into object streams and linearize
+    (fast web view). Returns (optimized bytes, {'before', 'after', 'duplicates', 'fills'}),
+    or None when pikepdf is not installed."""
+    try:
+        import pikepdf
+    except ImportError:
+        return None
+    from io import BytesIO
+    pikepdf.settings.set_flate_compression_level(PDF_FLATE_LEVEL)
+    out = BytesIO()
+    with pikepdf.open(BytesIO(data)) as pdf:
+        duplicates = _dedupe_streams(pdf)
+        fills = 0
+        for page in pdf.pages:
+            fills += _strip_background_fill(pdf, page, [float(v) for v in page.mediabox])
+            for xobject in page.Resources.get('/XObject', {}).values():
+                if xobject.get('/Subtype') == '/Form':
+                    fills += _strip_background_fill(pdf, xobject, [float(v) for v in xobject.BBox])
+        pdf.remove_unreferenced_resources()
+        pdf.save(out, compress_streams=True, recompress_flate=True,
+                 stream_decode_level=pikepdf.StreamDecodeLevel.generalized,
+                 object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                 linearize=linearize, deterministic_id=True)
+    optimized = out.getvalue()
+    return optimized, {'before': len(data), 'after': len(optimized), 'duplicates': duplicates, 'fills': fills}
+
+
+def merge_pdf_chunks(parts):
+    """Concatenate PDFs (bytes) into one, keeping the first one's document info, and share the
+    fonts, images and forms they have in common. Needs pikepdf."""
+    import pikepdf
+    from io import BytesIO
+    from contextlib import ExitStack
+    out = BytesIO()
+    with ExitStack() as stack:
+        pdfs = [stack.enter_context(pikepdf.open(BytesIO(data))) for data in parts]
+        merged = pdfs[0]
+        for pdf in pdfs[1:]:
+            merged.pages.extend(pdf.pages)
+        merged.remove_unreferenced_resources()  # first: each chunk's forms list every font of that chunk
+        _dedupe_streams(merged)
+        _dedupe_fonts(merged)
+        merged.save(out, compress_streams=True, object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                    deterministic_id=True)
+    return out.getvalue()
+
+
+def optimize_pdf(path, linearize=True):
+    """optimize_pdf_bytes() for a PDF file, rewritten in place. Returns the stats dict, or None
+    when pikepdf is not installed (the file is left as built)."""
+    with open(path, 'rb') as f:
+        optimized = optimize_pdf_bytes(f.read(), linearize)
+    if optimized is None:
+        return None
+    data, stats = optimized
+    with open(path, 'wb') as f:
+        f.write(data)
+    return stats
+
+
+_PDF_XREF_ENTRY_RE = re.compile(rb'(\d{10}) \d{5} n')
+_PDF_REF_RE = re.compile(rb'(\d+) 0 R')
+_PDF_STREAM_RE = re.compile(rb'\bstream\r?\n')  # keyword only: not inside a name like /BitstreamVera
+
+
+def font_bytes(pdf_path):
+    """Bytes each font adds to a PDF, by font name (subset prefixes like ABCDEF+ dropped):
+    font dictionaries, descriptors, width and ToUnicode objects and the embedded subset.
+
+    Object sizes come from the cross-reference table of ReportLab's classic (non-stream) xref.
+    PDFs with an xref stream (written by --optimize and --chunks) are measured through pikepdf.
+    """
+    with open(pdf_path, 'rb') as f:
+        return pdf_font_bytes(f.read())
+
+
+def pdf_font_bytes(data):
+    """font_bytes() for a PDF held in memory."""
+    startxref = data.rindex(b'startxref')
+    xref = int(data[startxref + len(b'startxref'):].split()[0])
+    if not data.startswith(b'xref', xref):
+        return _font_bytes_pikepdf(data)
+    offsets = sorted(int(m.group(1)) for m in _PDF_XREF_ENTRY_RE.finditer(data, xref))
+    objects = {}
+    for start, end in zip(offsets, offsets[1:] + [xref]):
+        number = int(data[start:data.index(b' ', start)])
+        objects[number] = data[start:end]
+
+    def closure(number, seen):
+        if number in seen or number not in objects:
+            return 0
+        seen.add(number)
+        body = objects[number]
+        head = _PDF_STREAM_RE.split(body, 1)[0]
+        return len(body) + sum(closure(int(ref), seen) for ref in _PDF_REF_RE.findall(head))
+
+    sizes = {}
+    seen = set()
+    for number, body in objects.items():
+        head = _PDF_STREAM_RE.split(body, 1)[0]
+        match = re.search(rb'/BaseFont /(?:[A-Z]{6}\+)?([^\s/>]+)', head)
+        if b'/Type /Font' in head and match:
+            name = match.group(1).decode('latin-1')
+            sizes[name] = sizes.get(name, 0) + closure(number, seen)
+    return dict(sorted(sizes.items(), key=lambda kv: -kv[1]))
+
+
+def _font_bytes_pikepdf(data):
+    """font_bytes() for a PDF whose objects may sit in object streams: each object counts its
+    serialized dictionary plus, for a stream (the embedded subset), its stored bytes."""
+    import pikepdf
+    from io import BytesIO
+
+    def size(obj):
+        if isinstance(obj, pikepdf.Stream):
+            return len(obj.stream_dict.unparse()) + len(obj.read_raw_bytes())
+        return len(obj.unparse(resolved=True))
+
+    def closure(obj, seen):
+        if isinstance(obj, pikepdf.Stream):
+            members = obj.stream_dict.values()
+        elif isinstance(obj, pikepdf.Dictionary):
+            members = obj.values()
+        elif isinstance(obj, pikepdf.Array):
+            members = list(obj)
+        else:
+            return 0
+        total = 0
+        for value in members:
+            if not isinstance(value, pikepdf.Object):
+                continue  # numbers and strings come back as Python values
+            if value.is_indirect:
+                if value.objgen not in seen:
+                    seen.add(value.objgen)
+                    total += size(value) + closure(value, seen)
+            else:
+                total += closure(value, seen)
+        return total
+
+    sizes = {}
+    seen = set()
+    with pikepdf.open(BytesIO(data)) as pdf:
+        for obj in pdf.objects:
+            if isinstance(obj, pikepdf.Dictionary) and obj.get('/Type') == '/Font' and '/BaseFont' in obj:
+                if obj.objgen in seen:
+                    continue
+                seen.add(obj.objgen)
+                name = re.sub(r'^[A-Z]{6}\+', '', str(obj.BaseFont)[1:])
+                sizes[name] = sizes.get(name, 0) + size(obj) + closure(obj, seen)
+    return dict(sorted(sizes.items(), key=lambda kv: -kv[1]))
+
+
+def report_font_bytes(results):
+    for r in results:
+        if r['ok'] and r['path'] and os.path.isfile(r['path']):
+            fonts = font_bytes(r['path'])
+            total = os.path.getsize(r['path'])
+            detail = ', '.join(f'{name} {size:,} B' for name, size in fonts.items())
+            print(f"  fonts  {r['name']:<30} {sum(fonts.values()):,} of {total:,} B ({detail})")
+
+
+def report_results(results, wall_seconds):
+    """Print per-document status and wall-clock time against the summed (serial) build time."""
+    for r in results:
+        if r['skipped']:
+            print(f"  SKIP   {r['name']:<30} unchanged")
+        elif r['ok']:
+            same = '' if r.get('changed', True) else '  (same bytes as the previous build)'
+            print(f"  OK     {r['name']:<30} {r['seconds']:.2f}s  {r['bytes'] / 1024:.1f} KB  sha256 {r['sha256'][:12]}{same}")
+        else:
+            print(f"  FAILED {r['name']:<30} {r['seconds']:.2f}s")
+            print(r['error'], file=sys.stderr)
+    if all(r['skipped'] for r in results):
+        print(f'All {len(results)} documents up to date ({wall_seconds * 1000:.0f} ms)')
+        return
+    serial = sum(r['seconds'] for r in results)
+    speedup = serial / wall_seconds if wall_seconds > 0 else 1.0
+    ok = sum(1 for r in results if r['ok'] and not r['skipped'])
+    skipped = sum(1 for r in results if r['skipped'])
+    print(f'Built {ok}/{len(results) - skipped} documents ({skipped} unchanged) in {wall_seconds:.2f}s wall-clock '
+          f'(serial {serial:.2f}s, speedup {speedup:.2f}x)')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate TSA competition PDFs into public/documents/.')
+    parser.add_argument('documents', nargs='*', metavar='DOCUMENT',
+                        help=f"document names or spec files to build (default: every spec in scripts/documents: {', '.join(find_specs())})")
+    parser.add_argument('--spec-dir', action='append', default=[], metavar='DIR',
+                        help='also build every .json/.yaml spec in DIR (repeatable)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='build documents in N worker processes (default: 1, serial)')
+    parser.add_argument('--force', action='store_true',
+                        help='rebuild every document even if its inputs are unchanged')
+    parser.add_argument('--download-fonts', action='store_true',
+                        help=f'allow downloading the signature font if missing (same as {FONT_DOWNLOAD_ENV}=1)')
+    parser.add_argument('--optimize', action='store_true',
+                        help='shrink each built PDF (shared streams, recompression, linearized) with pikepdf')
+    parser.add_argument('--chunks', type=int, default=1, metavar='N',
+                        help='render each document in up to N parts on N processes and merge them (needs pikepdf; '
+                             'for documents of thousands of pages, replaces --jobs)')
+    parser.add_argument('--reproducible', action='store_true',
+                        help='byte-identical PDFs for identical inputs (fixed date from SOURCE_DATE_EPOCH, else 2000-01-01)')
+    parser.add_argument('--check-reproducible', action='store_true',
+                        help='render each document three times (two processes) and fail unless the bytes match; writes nothing')
+    parser.add_argument('--font-report', action='store_true',
+                        help='print how many bytes each font adds to each PDF')
+    parser.add_argument('--profile', metavar='FILE',
+                        help='record per-stage, per-page and per-flowable timings to a Chrome trace-event JSON file '
+                             '(builds run serially; combine with --force to profile unchanged documents)')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='with --profile, also record peak memory (tracemalloc; slows the build down)')
+    args = parser.parse_args(argv)
+    targets = list(args.documents)
+    for spec_dir in args.spec_dir:
+        targets += find_specs(spec_dir).values()
+    try:
+        targets = [resolve_spec(t) for t in targets]
+    except SpecError as e:
+        parser.error(str(e))
+    if args.download_fonts:
+        os.environ[FONT_DOWNLOAD_ENV] = '1'  # inherited by worker processes
+    if args.optimize:
+        if importlib.util.find_spec('pikepdf') is None:
+            print('Note: pikepdf is not installed (pip install pikepdf); --optimize leaves PDFs as built.', file=sys.stderr)
+    if args.chunks > 1 and importlib.util.find_spec('pikepdf') is None:
+        print('Note: pikepdf is not installed (pip install pikepdf); --chunks renders each PDF in one process.', file=sys.stderr)
+
     if not os.path.exists(LOGO_PATH):
         print('Warning: Logo not found at', LOGO_PATH, '- run from repo root.')
-    build_student_copyright_checklist()
-    build_work_log()
+    if args.check_reproducible:
+        digests = check_reproducible(targets, args.optimize)
+        for name, runs in digests.items():
+            status = 'SAME  ' if len(set(runs)) == 1 else 'DIFFER'
+            print(f"  {status} {name:<30} {'  '.join(d[:12] for d in runs)}")
+        return 0 if all(len(set(runs)) == 1 for runs in digests.values()) else 1
+    start = time.perf_counter()
+    if args.profile:
+        with profile(memory=args.profile_memory) as profiler:
+            results = build_documents(targets, jobs=1, force=args.force, optimize=args.optimize,
+                                      reproducible=args.reproducible)
+    else:
+        results = build_documents(targets, jobs=args.jobs, force=args.force, optimize=args.optimize,
+                                  reproducible=args.reproducible, chunks=args.chunks)
+    report_results(results, time.perf_counter() - start)
+    if args.font_report:
+        report_font_bytes(results)
+    if args.profile:
+        profiler.report()
+        profiler.write(args.profile)
+        print('Profile written to', args.profile)
     print('Done. PDFs in', OUT_DIR)
+    return 0 if all(r['ok'] for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Mail-merge TSA PDFs: one personalized document per row of a CSV or JSONL file.
+Rows fill the {{placeholders}} of a document spec (see scripts/documents/README.md); blocks
+without placeholders are laid out once per process and reused for every row.
+Run from repo root: python scripts/merge_tsa_pdfs.py student-copyright-checklist teams.csv [--jobs 4]
+Output: public/documents/merged/<document>-<row id>.pdf
+Interrupted or partly failed runs resume: rerun the same command and only missing,
+failed or changed rows are rendered.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import traceback
+
+import generate_tsa_pdfs as g
+
+MERGE_OUT_DIR = os.path.join(g.OUT_DIR, 'merged')
+PROGRESS_FILE = '.merge-progress.jsonl'
+LIST_SEPARATOR = ';'
+
+
+def _slug(text):
+    return re.sub(r'[^A-Za-z0-9]+', '-', str(text)).strip('-').lower() or 'row'
+
+
+def _file_stem(row_id):
+    """File name stem for a row id: the id itself when it is already a slug, else its slug plus
+    a short hash of the id, so ids that slug alike ('Team A', 'team-a') get distinct files.
+    Stable across runs, so resume finds each row's own PDF."""
+    row_id = str(row_id)
+    slug = _slug(row_id)
+    if slug == row_id:
+        return slug
+    return f"{slug}-{hashlib.sha256(row_id.encode('utf-8')).hexdigest()[:8]}"
+
+
+def _csv_value(text):
+    """CSV cell -> value; 'a; b; c' becomes a list (student names, hours per phase)."""
+    if LIST_SEPARATOR in text:
+        return [part.strip() for part in text.split(LIST_SEPARATOR)]
+    return text.strip()
+
+
+def iter_rows(path):
+    """Rows of a CSV (header line required) or JSONL file, read lazily.
+
+    Every row gets an 'id' (its own 'id' column, else its 1-based position); empty CSV
+    cells are dropped so the spec's defaults apply.
+    """
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.lower().endswith(('.jsonl', '.ndjson')):
+            rows = (json.loads(line) for line in f if line.strip())
+        else:
+            rows = ({k: _csv_value(v) for k, v in row.items() if k and v and v.strip()} for row in csv.DictReader(f))
+        for number, row in enumerate(rows, 1):
+            row.setdefault('id', str(number))
+            yield row
+
+
+class MergeTemplate:
+    """A document spec prepared for many rows.
+
+    Blocks without placeholders are compiled and turned into flowables once; per row only
+    the blocks that reference row values (and the phase blocks, when the phases do) are
+    compiled and rendered. Reusing the static flowables is safe because every output has
+    the same frame width, so ReportLab re-wraps them to identical layouts.
+    """
+
+    def __init__(self, target):
+        self.path = g.resolve_spec(target)
+        with open(self.path, 'rb') as f:
+            self.digest = hashlib.sha256(f.read()).hexdigest()
+        self.raw = g._parse_spec_file(self.path)
+        if not isinstance(self.raw, dict) or 'blocks' not in self.raw:
+            raise g.SpecError(f'{self.path}: a spec is an object with a "blocks" list')
+        self.name = self.raw.get('name') or os.path.splitext(os.path.basename(self.path))[0]
+        self.styles = g.get_styles()
+        phases_vary = g.has_placeholders(self.raw.get('phases', []))
+        # (None, index into static_flowables) or (index into dynamic_blocks, None), in spec order
+        self.segments = []
+        self.dynamic_blocks = []
+        static = []
+        for block in self.raw['blocks']:
+            if g.has_placeholders(block) or block.get('source') or \
+                    (phases_vary and block.get('type') in g.PHASE_BLOCKS):
+                self.segments.append((len(self.dynamic_blocks), None))
+                self.dynamic_blocks.append(block)
+            else:
+                self.segments.append((None, len(static)))
+                static.append(block)
+        spec = g.compile_spec({'name': self.raw.get('name', ''), 'phases': [] if phases_vary else self.raw.get('phases', []),
+                               'blocks': static}, self.path)
+        self.static_flowables = [list(g.BLOCK_RENDERERS[block['type']](block, self.styles, spec)) for block in spec.blocks]
+
+    def compile_row(self, row):
+        """Compiled spec holding only this row's dynamic blocks; raises SpecError on missing values."""
+        raw = dict(self.raw, blocks=self.dynamic_blocks)
+        return g.compile_spec(raw, self.path, values=row)
+
+    def iter_story(self, spec):
+        for dynamic, static in self.segments:
+            if dynamic is None:
+                yield from self.static_flowables[static]
+            else:
+                block = spec.blocks[dynamic]
+                yield from g.BLOCK_RENDERERS[block['type']](block, self.styles, spec)
+
+    def output_path(self, spec, row, out_dir):
+        return os.path.join(out_dir, f"{spec.name}-{_file_stem(row['id'])}.pdf")
+
+    def row_fingerprint(self, row):
+        """Changes when the spec file or the row's values change (drives resume)."""
+        payload = json.dumps(row, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(f'{self.digest}\n{payload}'.encode('utf-8')).hexdigest()
+
+    def render_row(self, row, out_dir):
+        """Render one row; returns a result dict (id, ok, path, error, seconds) instead of raising."""
+        start = time.perf_counter()
+        path = None
+        try:
+            spec = self.compile_row(row)
+            path = self.output_path(spec, row, out_dir)
+            g.render_flowables(self.iter_story(spec), path, spec.title, spec.subtitle, spec.metadata)
+            return {'id': row['id'], 'ok': True, 'path': path, 'error': None, 'seconds': time.perf_counter() - start}
+        except g.SpecError as e:
+            # Bad row values (missing placeholder, non-numeric hours): the message names the field
+            return {'id': row['id'], 'ok': False, 'path': path, 'error': str(e), 'seconds': time.perf_counter() - start}
+        except Exception:
+            return {'id': row['id'], 'ok': False, 'path': path, 'error': traceback.format_exc(), 'seconds': time.perf_counter() - start}
+
+
+def load_progress(out_dir):
+    """(document, row id) -> latest ledger entry; a truncated last line (interrupted write) is ignored."""
+    entries = {}
+    path = os.path.join(out_dir, PROGRESS_FILE)
+    if not os.path.isfile(path):
+        return entries
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict) or 'document' not in entry:
+                continue
+            entries[entry['document'], entry['id']] = entry
+    return entries
+
+
+def _is_done(entry, fingerprint):
+    return bool(entry and entry.get('ok') and entry.get('fingerprint') == fingerprint and os.path.isfile(entry.get('path') or ''))
+
+
+# Per-process template for pool workers, prepared once by the initializer
+_WORKER_TEMPLATE = None
+
+
+def _init_merge_worker(target):
+    global _WORKER_TEMPLATE
+    g.init_resources()
+    _WORKER_TEMPLATE = MergeTemplate(target)
+
+
+def _merge_in_worker(row, out_dir):
+    return _WORKER_TEMPLATE.render_row(row, out_dir)
+
+
+def _merge_in_pool(target, rows, out_dir, jobs):
+    """Yield results as workers finish, keeping at most a few rows per worker in flight."""
+    # Imported here, as in generate_tsa_pdfs: serial merges never need multiprocessing
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    window = jobs * 4
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_merge_worker, initargs=(target,)) as pool:
+        pending = {}
+        rows = iter(rows)
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < window:
+                row = next(rows, None)
+                if row is None:
+                    exhausted = True
+                else:
+                    pending[pool.submit(_merge_in_worker, row, out_dir)] = row
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                row = pending.pop(future)
+                try:
+                    yield row, future.result()
+                except Exception:
+                    yield row, {'id': row['id'], 'ok': False, 'path': None, 'error': traceback.format_exc(), 'seconds': 0.0}
+
+
+def merge_documents(target, rows_path, out_dir=MERGE_OUT_DIR, jobs=1, force=False):
+    """Render `target` once per row of `rows_path`, yielding result dicts as documents finish.
+
+    Results are appended to out_dir/.merge-progress.jsonl as they arrive; rows already built
+    from the same spec and values are yielded with skipped=True unless `force` is set.
+    """
+    template = MergeTemplate(target)
+    os.makedirs(out_dir, exist_ok=True)
+    progress = {} if force else load_progress(out_dir)
+    fingerprints = {}
+
+    def todo():
+        for row in iter_rows(rows_path):
+            fingerprints[row['id']] = template.row_fingerprint(row)
+            entry = progress.get((template.name, row['id']))
+            if _is_done(entry, fingerprints[row['id']]):
+                skipped.append({'id': row['id'], 'ok': True, 'skipped': True, 'path': entry['path'], 'error': None, 'seconds': 0.0})
+            else:
+                yield row
+
+    skipped = []
+    if jobs <= 1:
+        g.init_resources()
+        results = ((row, template.render_row(row, out_dir)) for row in todo())
+    else:
+        results = _merge_in_pool(target, todo(), out_dir, jobs)
+    with open(os.path.join(out_dir, PROGRESS_FILE), 'a', encoding='utf-8') as ledger:
+        for row, result in results:
+            while skipped:
+                yield skipped.pop(0)
+            ledger.write(json.dumps({'document': template.name, 'id': row['id'], 'ok': result['ok'], 'path': result['path'],
+                                     'fingerprint': fingerprints[row['id']]}) + '\n')
+            ledger.flush()
+            yield dict(result, skipped=False)
+    yield from skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render one personalized TSA PDF per row of a CSV or JSONL file.')
+    parser.add_argument('document', help='document name (e.g. work-log) or spec file with {{placeholders}}')
+    parser.add_argument('rows', help="CSV (header row; ';' separates list values) or JSONL file, one document per row")
+    parser.add_argument('--out-dir', default=MERGE_OUT_DIR, help='output folder (default: public/documents/merged)')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='render in N worker processes (default: 1)')
+    parser.add_argument('--force', action='store_true', help='ignore the progress ledger and render every row')
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
+    start = time.perf_counter()
+    built = skipped = failed = 0
+    for result in merge_documents(args.document, args.rows, args.out_dir, args.jobs, args.force):
+        if result['skipped']:
+            skipped += 1
+        elif result['ok']:
+            built += 1
+            print(f"  OK     {result['id']:<20} {result['seconds']:.2f}s  {result['path']}")
+        else:
+            failed += 1
+            print(f"  FAILED {result['id']:<20} {result['seconds']:.2f}s")
+            print(result['error'], file=sys.stderr)
+    wall = time.perf_counter() - start
+    rate = built / wall if wall > 0 else 0.0
+    print(f'Merged {built} documents ({skipped} up to date, {failed} failed) in {wall:.2f}s ({rate:.1f} documents/s)')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""
+Preview TSA documents: the same compiled document spec rendered to PDF, static HTML or
+low-resolution PNG page thumbnails (e.g. for the admin dashboard).
+Run from repo root: python scripts/preview_tsa_pdfs.py [DOCUMENT ...] [--format html,png] [--width 160]
+Output: public/documents/previews/<name>.html and <name>-<page>.png
+
+A PDF render records each page's drawing operations as it goes (RecordingCanvas). That
+display list is cached with the PDF bytes, so thumbnails after a PDF render, and a PDF
+after thumbnails, repeat no layout work. HTML is built from the document model directly.
+"""
+
+import argparse
+import base64
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import time
+from collections import OrderedDict, namedtuple
+from io import BytesIO
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfbase import pdfmetrics
+
+import generate_tsa_pdfs as g
+
+PREVIEW_OUT_DIR = os.path.join(g.OUT_DIR, 'previews')
+THUMBNAIL_WIDTH = 160  # px
+THUMBNAIL_SUPERSAMPLE = 2  # drawn at 2x, then downsampled (antialiasing)
+LAYOUT_CACHE_SIZE = 64
+LAYOUT_STATS = {'hits': 0, 'misses': 0}
+
+# Page drawing operations per page, plus the form XObjects and images they reference
+DisplayList = namedtuple('DisplayList', 'page_size pages forms images fonts')
+Layout = namedtuple('Layout', 'pdf display')
+
+
+class RecordingCanvas(g.Canvas):
+    """Canvas that keeps each page's PDF operators (before compression), each form's
+    operators, the source of each image XObject and the font resource names."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.recorded_pages = []
+        self.recorded_forms = {}
+        self.recorded_images = {}
+
+    def showPage(self):
+        self.recorded_pages.append(list(self._code))
+        super().showPage()
+
+    def endForm(self, **extra_attributes):
+        self.recorded_forms[self._doc.getXObjectName(self._formData[0])] = list(self._code)
+        super().endForm(**extra_attributes)
+
+    def drawImage(self, image, *args, **kwargs):
+        start = len(self._code)
+        result = super().drawImage(image, *args, **kwargs)
+        for line in self._code[start:]:
+            for name in re.findall(r'/(\S+) Do', line):
+                self.recorded_images[name] = image
+        return result
+
+    def display_list(self):
+        fonts = {internal.lstrip('/'): name for name, internal in self._doc.fontMapping.items()}
+        return DisplayList(self._pagesize, self.recorded_pages, self.recorded_forms, self.recorded_images, fonts)
+
+
+# --- Shared layout cache ---
+_LAYOUTS = OrderedDict()
+
+
+def layout_key(spec):
+    """Hash of a compiled spec's content (so merged or service-filled specs are keyed by their values)."""
+    payload = json.dumps([g.BUILD_CACHE_VERSION, spec.name, spec.title, spec.subtitle, spec.metadata, spec.phases,
+                          spec.blocks], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def layout(spec):
+    """PDF bytes and page display lists for a compiled spec, from one (reproducible) render,
+    memoized per spec content."""
+    key = layout_key(spec)
+    cached = _LAYOUTS.get(key)
+    if cached is not None:
+        _LAYOUTS.move_to_end(key)
+        LAYOUT_STATS['hits'] += 1
+        return cached
+    LAYOUT_STATS['misses'] += 1
+    sink = g.PdfSink(name=f'{spec.name}.pdf')
+    doc = g.render_flowables(g.iter_story(spec), sink, spec.title, spec.subtitle, spec.metadata,
+                             reproducible=True, canvasmaker=RecordingCanvas)
+    result = _LAYOUTS[key] = Layout(sink.getvalue(), doc.canv.display_list())
+    if len(_LAYOUTS) > LAYOUT_CACHE_SIZE:
+        _LAYOUTS.popitem(last=False)
+    return result
+
+
+def clear_layout_cache():
+    _LAYOUTS.clear()
+    LAYOUT_STATS.update(hits=0, misses=0)
+
+
+# --- Thumbnails: a small painter for the operators ReportLab emits ---
+# Strings, hex strings, names, array brackets, numbers, operators
+_TOKEN_RE = re.compile(r'\((?:\\.|[^\\)])*\)|<[0-9A-Fa-f\s]*>|/[^\s/\[\]()<>]+|[\[\]]|[-+]?(?:\d+\.?\d*|\.\d+)|[A-Za-z\'"*][\w\'"*]*')
+_ESCAPES = {'n': '\n', 'r': '\r', 't': '\t', 'b': '\b', 'f': '\f'}
+_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+def _pdf_string(token):
+    if token.startswith('<'):
+        return bytes.fromhex(re.sub(r'\s', '', token[1:-1])).decode('latin-1')
+    return re.sub(r'\\([0-7]{1,3}|.)', lambda m: chr(int(m.group(1), 8)) if m.group(1).isdigit()
+                  else _ESCAPES.get(m.group(1), m.group(1)), token[1:-1])
+
+
+def _multiply(m, n):
+    """Matrix product m x n (PDF row-vector convention: m applies first)."""
+    return (m[0] * n[0] + m[1] * n[2], m[0] * n[1] + m[1] * n[3],
+            m[2] * n[0] + m[3] * n[2], m[2] * n[1] + m[3] * n[3],
+            m[4] * n[0] + m[5] * n[2] + n[4], m[4] * n[1] + m[5] * n[3] + n[5])
+
+
+def _bezier(p0, p1, p2, p3, steps=6):
+    return [tuple((1 - t) ** 3 * a + 3 * (1 - t) ** 2 * t * b + 3 * (1 - t) * t ** 2 * c + t ** 3 * d
+                  for a, b, c, d in zip(p0, p1, p2, p3)) for t in (i / steps for i in range(1, steps + 1))]
+
+
+class ThumbnailPainter:
+    """Paints a DisplayList page with Pillow. Fills, strokes and images are drawn; text is
+    drawn as greeked bars of its measured width, which is what reads at thumbnail size."""
+
+    def __init__(self, display, width):
+        from PIL import Image, ImageDraw
+        self.Image = Image
+        self.display = display
+        page_w, page_h = display.page_size
+        self.scale = width * THUMBNAIL_SUPERSAMPLE / page_w
+        self.size = (width * THUMBNAIL_SUPERSAMPLE, round(page_h * self.scale))
+        self.page_h = page_h
+        self.image = Image.new('RGB', self.size, 'white')
+        self.draw = ImageDraw.Draw(self.image)
+        self._images = {}
+
+    def paint(self, page_index):
+        self.state = {'ctm': _IDENTITY, 'fill': (0, 0, 0), 'stroke': (0, 0, 0), 'line_width': 1.0}
+        self.stack = []
+        self.run(self.display.pages[page_index])
+        return self.image
+
+    def png(self, width):
+        out = BytesIO()
+        self.image.resize((width, round(self.size[1] / THUMBNAIL_SUPERSAMPLE)), self.Image.LANCZOS).save(out, 'PNG', optimize=True)
+        return out.getvalue()
+
+    def _point(self, x, y, matrix=None):
+        a, b, c, d, e, f = matrix or self.state['ctm']
+        return ((a * x + c * y + e) * self.scale, (self.page_h - (b * x + d * y + f)) * self.scale)
+
+    def run(self, code):
+        operands = []
+        path = []  # subpaths of device points
+        text = None
+        for line in code:
+            for token in _TOKEN_RE.findall(line):
+                first = token[0]
+                if first in '(/<[]' or first.isdigit() or first in '-+.':
+                    operands.append(token)
+                    continue
+                text = self.operator(token, operands, path, text)
+                operands = []
+
+    def operator(self, op, operands, path, text):
+        state = self.state
+        nums = []
+        for operand in operands:
+            try:
+                nums.append(float(operand))
+            except ValueError:
+                pass
+        if op == 'q':
+            self.stack.append(dict(state))
+        elif op == 'Q':
+            if self.stack:
+                self.state = self.stack.pop()
+        elif op == 'cm' and len(nums) == 6:
+            state['ctm'] = _multiply(tuple(nums), state['ctm'])
+        elif op in ('rg', 'RG', 'g', 'G', 'k', 'K', 'sc', 'scn', 'SC', 'SCN') and nums:
+            color = self._color(nums)
+            state['stroke' if op[0] in 'GKRS' and op not in ('sc', 'scn') else 'fill'] = color
+        elif op == 'w' and nums:
+            state['line_width'] = nums[0]
+        elif op == 'm' and len(nums) == 2:
+            path.append([self._point(*nums)])
+        elif op == 'l' and len(nums) == 2 and path:
+            path[-1].append(self._point(*nums))
+        elif op in ('c', 'v', 'y') and path:
+            current = path[-1][-1]
+            points = [self._point(nums[i], nums[i + 1]) for i in range(0, len(nums) - 1, 2)]
+            if op == 'v':
+                points.insert(0, current)
+            elif op == 'y':
+                points.append(points[-1])
+            if len(points) == 3:
+                path[-1].extend(_bezier(current, *points))
+        elif op == 're' and len(nums) == 4:
+            x, y, w, h = nums
+            path.append([self._point(x, y), self._point(x + w, y), self._point(x + w, y + h), self._point(x, y + h), None])
+        elif op == 'h' and path:
+            path[-1].append(None)
+        elif op in ('f', 'F', 'f*', 'B', 'B*', 'b', 'b*', 'S', 's', 'n'):
+            if op in ('f', 'F', 'f*', 'B', 'B*', 'b', 'b*'):
+                for subpath in path:
+                    points = [p for p in subpath if p is not None]
+                    if len(points) > 2:
+                        self.draw.polygon(points, fill=state['fill'])
+            if op in ('B', 'B*', 'b', 'b*', 'S', 's'):
+                width = max(1, round(state['line_width'] * self.scale * abs(state['ctm'][0] or state['ctm'][3] or 1)))
+                for subpath in path:
+                    points = [p for p in subpath if p is not None]
+                    if op in ('b', 'b*', 's') or (subpath and subpath[-1] is None):
+                        points.append(points[0])
+                    if len(points) > 1:
+                        self.draw.line(points, fill=state['stroke'], width=width)
+            path.clear()
+        elif op == 'BT':
+            text = {'tm': _IDENTITY, 'tlm': _IDENTITY, 'font': state.get('font'), 'size': state.get('font_size', 12.0),
+                    'leading': state.get('leading', 0.0), 'tc': 0.0, 'tw': 0.0, 'th': 1.0, 'mode': 0}
+        elif text is not None:
+            self._text_operator(op, operands, nums, text)
+            if op == 'ET':
+                state['font'], state['font_size'], state['leading'] = text['font'], text['size'], text['leading']
+                text = None
+        elif op == 'Do' and operands:
+            self._do(operands[0].lstrip('/'))
+        return text
+
+    def _color(self, nums):
+        if len(nums) == 1:
+            nums = nums * 3
+        elif len(nums) == 4:  # CMYK
+            c, m, y, k = nums
+            nums = [(1 - c) * (1 - k), (1 - m) * (1 - k), (1 - y) * (1 - k)]
+        return tuple(max(0, min(255, round(v * 255))) for v in nums[:3])
+
+    def _text_operator(self, op, operands, nums, text):
+        if op == 'Tf' and operands:
+            text['font'] = self.display.fonts.get(operands[0].lstrip('/'))
+            text['size'] = nums[-1] if nums else text['size']
+        elif op == 'TL' and nums:
+            text['leading'] = nums[0]
+        elif op in ('Tc', 'Tw', 'Tr', 'Tz') and nums:
+            key = {'Tc': 'tc', 'Tw': 'tw', 'Tr': 'mode', 'Tz': 'th'}[op]
+            text[key] = nums[0] / 100 if op == 'Tz' else nums[0]
+        elif op == 'Tm' and len(nums) == 6:
+            text['tm'] = text['tlm'] = tuple(nums)
+        elif op in ('Td', 'TD') and len(nums) == 2:
+            if op == 'TD':
+                text['leading'] = -nums[1]
+            text['tm'] = text['tlm'] = _multiply((1, 0, 0, 1, nums[0], nums[1]), text['tlm'])
+        elif op in ('T*', "'", '"'):
+            text['tm'] = text['tlm'] = _multiply((1, 0, 0, 1, 0, -text['leading']), text['tlm'])
+            if op != 'T*':
+                self._show(text, [operands[-1]])
+        elif op in ('Tj', 'TJ'):
+            self._show(text, operands)
+
+    def _show(self, text, operands):
+        """Advance over a text run, drawing a bar from its baseline to about x-height."""
+        size = text['size']
+        width = 0.0
+        for operand in operands:
+            if operand[0] in '(<':
+                s = _pdf_string(operand)
+                if text['font'] in pdfmetrics.standardFonts:
+                    run = pdfmetrics.stringWidth(s, text['font'], size)
+                else:
+                    run = 0.5 * size * len(s)
+                width += (run + text['tc'] * len(s) + text['tw'] * s.count(' ')) * text['th']
+            elif operand not in '[]':
+                width -= float(operand) / 1000 * size * text['th']
+        if text['mode'] != 3 and width > 0:
+            matrix = _multiply(text['tm'], self.state['ctm'])
+            y0, y1 = 0.05 * size, 0.62 * size
+            corners = [self._point(0, y0, matrix), self._point(width, y0, matrix),
+                       self._point(width, y1, matrix), self._point(0, y1, matrix)]
+            r, g_, b = self.state['fill']
+            self.draw.polygon(corners, fill=tuple(round(255 - (255 - v) * 0.6) for v in (r, g_, b)))
+        text['tm'] = _multiply((1, 0, 0, 1, width, 0), text['tm'])
+
+    def _do(self, name):
+        if name in self.display.forms:
+            self.stack.append(dict(self.state))
+            self.run(self.display.forms[name])
+            self.state = self.stack.pop()
+        elif name in self.display.images:
+            (x0, y0), (x1, y1) = self._point(0, 1), self._point(1, 0)
+            box = (round(min(x0, x1)), round(min(y0, y1)), round(max(x0, x1)), round(max(y0, y1)))
+            size = (max(1, box[2] - box[0]), max(1, box[3] - box[1]))
+            key = (name, size)
+            if key not in self._images:
+                source = getattr(self.display.images[name], 'fileName', self.display.images[name])
+                if hasattr(source, 'seek'):  # drawn from in-memory bytes (generate_tsa_pdfs._image_bytes)
+                    source.seek(0)
+                image = self.Image.open(source).convert('RGBA')
+                self._images[key] = image.resize(size, self.Image.LANCZOS)
+            picture = self._images[key]
+            self.image.paste(picture, box[:2], picture)
+
+
+def thumbnails(display, width=THUMBNAIL_WIDTH, pages=None):
+    """PNG bytes per page (or for the given 0-based page indexes) of a DisplayList."""
+    result = []
+    for index in range(len(display.pages)) if pages is None else pages:
+        painter = ThumbnailPainter(display, width)
+        painter.paint(index)
+        result.append(painter.png(width))
+    return result
+
+
+# --- HTML: the document model as static, self-contained HTML ---
+def _css(color):
+    return '#' + color.hexval()[2:]
+
+
+HTML_STYLE = f'''
+body {{ margin: 0; background: #eef2f6; font: 10pt/1.45 Helvetica, Arial, sans-serif; color: {_css(g.TEXT_DARK)}; }}
+main {{ max-width: {letter[0]:.0f}pt; margin: 0 auto; background: #fff; padding: 0 {g.MARGIN:.0f}pt {g.MARGIN:.0f}pt; box-sizing: border-box; }}
+header {{ display: flex; gap: 14pt; align-items: center; padding: {g.MARGIN:.0f}pt 0 10pt; border-bottom: 2pt solid {_css(g.ACCENT_TEAL)}; margin-bottom: 18pt; }}
+header img {{ width: {g.LOGO_SIZE:.0f}pt; height: {g.LOGO_SIZE:.0f}pt; object-fit: contain; }}
+header h1 {{ margin: 0; font-size: 19pt; }}
+header p, footer {{ margin: 0; font-size: 9pt; color: {_css(g.TEXT_MUTED)}; }}
+footer {{ border-top: 0.5pt solid {_css(g.FOOTER_TEXT)}; padding-top: 8pt; margin-top: 24pt; text-align: center; color: {_css(g.FOOTER_TEXT)}; font-size: 8pt; }}
+h2 {{ color: {_css(g.ACCENT_TEAL)}; font-size: 13pt; margin: 10pt 0 8pt; }}
+h2.heading {{ color: {_css(g.PRIMARY_BLUE)}; font-size: 15pt; }}
+table {{ width: 100%; border-collapse: collapse; background: {_css(g.CARD_BG)}; margin-bottom: 4pt; }}
+td, th {{ border: 0.5pt solid {_css(g.BORDER)}; padding: 8pt 10pt; text-align: left; vertical-align: middle; font-size: 9pt; }}
+th {{ background: {_css(g.PRIMARY_BLUE)}; color: #fff; }}
+tbody tr:nth-child(even) {{ background: {_css(g.ROW_ALT)}; }}
+tfoot td {{ font-weight: bold; }}
+td.label {{ color: {_css(g.TEXT_MUTED)}; }}
+.card {{ background: {_css(g.CARD_BG)}; border-left: 5pt solid {_css(g.ACCENT_TEAL)}; padding: 10pt 12pt; }}
+.muted {{ color: {_css(g.TEXT_MUTED)}; }}
+.note {{ font-style: italic; color: {_css(g.TEXT_MUTED)}; }}
+.phase {{ break-inside: avoid; margin-bottom: 8pt; }}
+.phase .title {{ display: flex; justify-content: space-between; background: {_css(g.CARD_BG)}; border: 0.5pt solid {_css(g.BORDER)}; padding: 8pt 10pt; }}
+.phase .title strong {{ color: {_css(g.ACCENT_TEAL)}; }}
+.phase ul {{ margin: 4pt 0; padding-left: 14pt; }}
+.outcome {{ font-style: italic; color: {_css(g.ACCENT_CORAL)}; }}
+.signature {{ font-family: 'Dancing Script', cursive; font-size: 16pt; }}
+.advisor {{ background: {_css(g.PRIMARY_BLUE)}; color: #fff; }}
+.advisor td {{ color: #fff; }}
+svg {{ max-width: 100%; height: auto; }}
+'''
+
+# ReportLab paragraph markup (card "markup": true) kept in HTML; other tags are dropped
+_HTML_TAGS_RE = re.compile(r'<(/?)(\w+)[^>]*?(/?)>')
+_KEPT_TAGS = {'b': 'b', 'strong': 'strong', 'i': 'i', 'em': 'em', 'u': 'u', 'br': 'br', 'super': 'sup', 'sub': 'sub'}
+
+
+def _markup_html(text):
+    def tag(m):
+        name = _KEPT_TAGS.get(m.group(2).lower())
+        if name is None:
+            return ''
+        return f'<{name}>' if name == 'br' else f'<{m.group(1)}{name}>'
+    return _HTML_TAGS_RE.sub(tag, text)
+
+
+def _e(text):
+    return html.escape(str(text))
+
+
+def _html_table(header, rows, total=None, label_columns=False):
+    out = ['<table>']
+    if header:
+        out.append('<thead><tr>' + ''.join(f'<th>{_e(cell)}</th>' for cell in header) + '</tr></thead>')
+    out.append('<tbody>')
+    for row in rows:
+        out.append('<tr>' + ''.join(f'<td class="label">{_e(cell)}</td>' if label_columns and i % 2 == 0 else f'<td>{_e(cell)}</td>'
+                                    for i, cell in enumerate(row)) + '</tr>')
+    out.append('</tbody>')
+    if total:
+        out.append('<tfoot><tr>' + ''.join(f'<td>{_e(cell)}</td>' for cell in total) + '</tr></tfoot>')
+    out.append('</table>')
+    return ''.join(out)
+
+
+def _html_signatures(block, spec):
+    out = []
+    for signer in block['signers']:
+        out.append(_html_table(['Name', 'Signature', 'Date'], []).replace(
+            '<tbody></tbody>', f"<tbody><tr><td><b>Name</b><br>{_e(signer['name'])}</td><td class=\"signature\">"
+                               f"{_e(signer['signature'])}</td><td><b>Date</b><br>{_e(block['date'])}</td></tr></tbody>"))
+    advisor = block.get('advisor')
+    if advisor:
+        out.append(f"<table class=\"advisor\"><tr><td><b>Name</b><br>{_e(advisor['name'])}</td><td class=\"signature\">"
+                   f"{_e(advisor['signature'])}</td><td><b>Date</b><br>{_e(block['date'])}</td></tr></table>")
+    return '\n'.join(out)
+
+
+def _html_phases(block, spec):
+    phases = g.iter_phases_jsonl(block['source']) if block.get('source') else spec.phases
+    return '\n'.join(
+        f"<article class=\"phase\"><div class=\"title\"><strong>{_e(phase['title'])}</strong><span>{_e(phase['dates'])}</span></div>"
+        f"<p><b>Hours:</b> {g._hours_text(phase['hours'])} hours &nbsp; <b>Team:</b> {_e(phase['team'])}</p>"
+        f"<ul>{''.join(f'<li>{_e(task)}</li>' for task in phase['tasks'])}</ul>"
+        f"<p class=\"outcome\">Outcome: {_e(phase['outcome'])}</p></article>"
+        for phase in phases)
+
+
+def _html_hours_chart(block, spec):
+    """The same chart Drawing as the PDF, as inline SVG."""
+    from reportlab.graphics import renderSVG
+    drawings = g._render_hours_chart(block, g.get_styles(), spec)
+    svg = renderSVG.drawToString(drawings[0]) if drawings else ''
+    return svg[svg.find('<svg'):]
+
+
+def _html_image(block, spec):
+    """A site image by its URL; an image next to the spec inlined from the derivative cache."""
+    if block.get('url'):
+        src = block['url']
+    else:
+        path = g.image_derivative(block['src'], block['px'], block.get('format', 'auto'))
+        with open(path, 'rb') as f:
+            src = f"data:image/{'png' if path.endswith('.png') else 'jpeg'};base64,{base64.b64encode(f.read()).decode()}"
+    figure = (f"<figure style=\"text-align: {block.get('align', 'center')}\"><img src=\"{_e(src)}\" alt=\"{_e(block.get('caption', ''))}\" "
+              f"style=\"width: {block['width']:.0f}pt; height: {block['height']:.0f}pt\">")
+    if block.get('caption'):
+        figure += f"<figcaption class=\"muted\">{_e(block['caption'])}</figcaption>"
+    return figure + '</figure>'
+
+
+# Block type -> html(block, spec); mirrors generate_tsa_pdfs.BLOCK_RENDERERS
+HTML_BLOCKS = {
+    'meta': lambda block, spec: _html_table(None, block['rows'], label_columns=True),
+    'spacer': lambda block, spec: f"<div style=\"height: {block['height']:.0f}pt\"></div>",
+    'image': _html_image,
+    'section': lambda block, spec: (f"<h2 class=\"heading\">{_e(block['text'])}</h2>" if block.get('style') == 'heading'
+                                    else f"<h2>{_e(block['text'])}</h2>"),
+    'paragraph': lambda block, spec: f"<p class=\"{block.get('style', 'body')}\">{_e(block['text'])}</p>",
+    'card': lambda block, spec: f"<div class=\"card\">{_markup_html(block['text']) if block.get('markup') else _e(block['text'])}</div>",
+    'table': lambda block, spec: _html_table(block['header'], block['rows'], block.get('total')),
+    'signatures': _html_signatures,
+    'phases': _html_phases,
+    'hours_chart': _html_hours_chart,
+}
+
+
+def render_html(spec, logo_src='/logo.png'):
+    """Static HTML page for a compiled spec (no layout pass); logo_src is the logo's URL."""
+    body = '\n'.join(HTML_BLOCKS[block['type']](block, spec) for block in spec.blocks)
+    title = spec.metadata.get('title', spec.title.title())
+    return (f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n<title>{_e(title)}</title>\n'
+            f'<style>{HTML_STYLE}</style>\n</head>\n<body>\n<main>\n'
+            f'<header><img src="{_e(logo_src)}" alt=""><div><h1>{_e(spec.title)}</h1><p>{_e(spec.subtitle)}</p></div></header>\n'
+            f'{body}\n<footer>Monroe Resource Hub | Central Academy of Technology and Arts | TSA Chapter | monroeresourcehub.us</footer>\n'
+            f'</main>\n</body>\n</html>\n')
+
+
+# --- Backends ---
+def render_pdf(spec):
+    return layout(spec).pdf
+
+
+def render_thumbnails(spec, width=THUMBNAIL_WIDTH, pages=None):
+    return thumbnails(layout(spec).display, width, pages)
+
+
+# Format -> render(spec) returning bytes, str or a list of page images
+BACKENDS = {
+    'pdf': render_pdf,
+    'html': render_html,
+    'png': render_thumbnails,
+}
+
+
+def write_previews(spec, formats, out_dir=PREVIEW_OUT_DIR, width=THUMBNAIL_WIDTH):
+    """Write the requested formats for one spec; returns the written paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for fmt in formats:
+        if fmt == 'png':
+            outputs = [(f'{spec.name}-{page}.png', data) for page, data in enumerate(render_thumbnails(spec, width), 1)]
+        elif fmt == 'html':
+            outputs = [(f'{spec.name}.html', render_html(spec).encode('utf-8'))]
+        else:
+            outputs = [(f'{spec.name}.{fmt}', BACKENDS[fmt](spec))]
+        for filename, data in outputs:
+            path = os.path.join(out_dir, filename)
+            with open(path, 'wb') as f:
+                f.write(data)
+            paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render TSA document previews: static HTML and PNG page thumbnails.')
+    parser.add_argument('documents', nargs='*', metavar='DOCUMENT', help='document names or spec files (default: every spec)')
+    parser.add_argument('--format', default='html,png', help=f"comma-separated formats: {', '.join(BACKENDS)} (default: html,png)")
+    parser.add_argument('--width', type=int, default=THUMBNAIL_WIDTH, help=f'thumbnail width in px (default: {THUMBNAIL_WIDTH})')
+    parser.add_argument('--out-dir', default=PREVIEW_OUT_DIR, help='output folder (default: public/documents/previews)')
+    args = parser.parse_args(argv)
+    formats = [f.strip() for f in args.format.split(',') if f.strip()]
+    unknown = [f for f in formats if f not in BACKENDS]
+    if unknown:
+        parser.error(f"unknown format(s): {', '.join(unknown)}")
+    try:
+        spec_paths = [g.resolve_spec(t) for t in args.documents] if args.documents else list(g.find_specs().values())
+    except g.SpecError as e:
+        parser.error(str(e))
+    g.init_resources()
+    for spec_path in spec_paths:
+        start = time.perf_counter()
+        spec = g.load_spec(spec_path)
+        paths = write_previews(spec, formats, args.out_dir, args.width)
+        print(f'  {spec.name:<30} {len(paths)} files  {1000 * (time.perf_counter() - start):.0f} ms')
+    print('Previews in', args.out_dir)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Read the site's `resources` and `categories` tables (types/database.ts) for printed catalogs,
+and saved `resumes` for server-side resume PDFs.
+Production reads Postgres (RESOURCES_DATABASE_URL=postgresql://..., needs `pip install psycopg`);
+offline runs use a local SQLite mirror with the same columns.
+Build the mirror: python scripts/resource_db.py mirror [--from DSN | --geojson FILE | --synthetic N]
+Default mirror: scripts/data/resources.sqlite3
+"""
+
+import argparse
+import json
+import os
+import queue
+import sqlite3
+import sys
+import time
+import uuid
+from collections import namedtuple
+from contextlib import contextmanager
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+MIRROR_PATH = os.path.join(SCRIPTS_DIR, 'data', 'resources.sqlite3')
+DATABASE_URL_ENV = 'RESOURCES_DATABASE_URL'
+LOCATIONS_PATH = os.path.join(os.path.dirname(SCRIPTS_DIR), 'public', 'data', 'locations.json')
+PAGE_SIZE = 1000  # rows per keyset page: one round trip per page, memory bounded by one page
+POOL_SIZE = 4
+
+Category = namedtuple('Category', 'id name icon description')
+ResourceRow = namedtuple('ResourceRow', 'id name description category_id category address phone email website')
+
+# SQLite mirror of the columns the catalog reads; JSON and array columns are stored as JSON text
+MIRROR_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS categories (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    icon TEXT NOT NULL,
+    description TEXT,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS resources (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    category_id TEXT NOT NULL REFERENCES categories (id),
+    contact_info TEXT,
+    website TEXT,
+    address TEXT,
+    services_offered TEXT,
+    population_served TEXT,
+    is_approved INTEGER NOT NULL DEFAULT 0,
+    is_spotlighted INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS resources_catalog_order ON resources (category_id, name, id);
+'''
+
+
+class ConnectionPool:
+    """Fixed-size pool of DB-API connections from `connect()`, opened on first use and reused.
+
+    connection() blocks while all `size` connections are checked out, so concurrent exports
+    never open more than that many connections to the server.
+    """
+
+    def __init__(self, connect, size=POOL_SIZE):
+        self._connect = connect
+        self._idle = queue.LifoQueue()
+        self._slots = queue.Queue()
+        for _ in range(size):
+            self._slots.put(None)
+
+    @contextmanager
+    def connection(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            self._slots.get()  # wait for a free slot before opening another connection
+            try:
+                conn = self._connect()
+            except Exception:
+                self._slots.put(None)
+                raise
+        try:
+            yield conn
+            conn.rollback()  # end the read transaction, so pooled Postgres connections are not left idle in one
+        except BaseException:
+            conn.close()
+            self._slots.put(None)
+            raise
+        self._idle.put(conn)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class ResourceDatabase:
+    """Catalog queries over either backend: a postgres:// or postgresql:// DSN, or a SQLite
+    path (optionally sqlite:///path). SQL differs only in the parameter placeholder."""
+
+    def __init__(self, dsn=None, pool_size=POOL_SIZE):
+        dsn = dsn or os.environ.get(DATABASE_URL_ENV) or MIRROR_PATH
+        if dsn.startswith(('postgres://', 'postgresql://')):
+            try:
+                import psycopg
+            except ImportError:
+                raise RuntimeError('Postgres needs psycopg (pip install psycopg)') from None
+            self.backend, self.placeholder = 'postgres', '%s'
+            connect = lambda: psycopg.connect(dsn)
+        else:
+            path = dsn[len('sqlite:///'):] if dsn.startswith('sqlite:///') else dsn
+            if not os.path.isfile(path):
+                raise FileNotFoundError(f'no resource database at {path} (build one: python scripts/resource_db.py mirror)')
+            self.backend, self.placeholder = 'sqlite', '?'
+            # Read-only URI: catalog exports never write to the mirror
+            connect = lambda: sqlite3.connect(f'file:{path}?mode=ro', uri=True, check_same_thread=False)
+        self.dsn = dsn
+        self.pool = ConnectionPool(connect, pool_size)
+
+    def close(self):
+        self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _sql(self, sql):
+        return sql.replace('?', self.placeholder)
+
+    def categories(self):
+        """Every category by id, read in one query (the catalog's only join, done in memory)."""
+        with self.pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute('SELECT id, name, icon, description FROM categories ORDER BY name, id')
+            return {str(row[0]): Category(str(row[0]), *row[1:]) for row in cur.fetchall()}
+
+    def category_counts(self, approved_only=True):
+        """Resources per category id, in one grouped query."""
+        with self.pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute('SELECT category_id, COUNT(*) FROM resources' + (' WHERE is_approved' if approved_only else '')
+                        + ' GROUP BY category_id')
+            return {str(category_id): count for category_id, count in cur.fetchall()}
+
+    def iter_resources(self, categories=None, approved_only=True, page_size=PAGE_SIZE):
+        """Resources in catalog order (category name, then resource name), streamed a page at a time.
+
+        Each page is a keyset query on (name, id) within one category, which the
+        (category_id, name, id) index answers without sorting or skipping rows, so page N costs
+        the same as page 1 (OFFSET pages get slower the deeper they go). A connection is held
+        only while a page is fetched.
+        """
+        categories = self.categories() if categories is None else categories
+        approved = ' AND is_approved' if approved_only else ''
+        first = self._sql('SELECT id, name, description, contact_info, website, address FROM resources '
+                          f'WHERE category_id = ?{approved} ORDER BY name, id LIMIT ?')
+        after = self._sql('SELECT id, name, description, contact_info, website, address FROM resources '
+                          f'WHERE category_id = ?{approved} AND (name, id) > (?, ?) ORDER BY name, id LIMIT ?')
+        for category in sorted(categories.values(), key=lambda c: (c.name, c.id)):
+            last = None
+            while True:
+                with self.pool.connection() as conn:
+                    cur = conn.cursor()
+                    if last is None:
+                        cur.execute(first, (category.id, page_size))
+                    else:
+                        cur.execute(after, (category.id, last[0], last[1], page_size))
+                    rows = cur.fetchall()
+                for row in rows:
+                    yield _resource_row(row, category)
+                if len(rows) < page_size:
+                    break
+                last = (rows[-1][1], rows[-1][0])
+
+    def iter_resumes(self, page_size=PAGE_SIZE):
+        """(id, title, resume_data) of every saved resume, in id order, a keyset page at a time."""
+        first = self._sql('SELECT id, title, resume_data FROM resumes ORDER BY id LIMIT ?')
+        after = self._sql('SELECT id, title, resume_data FROM resumes WHERE id > ? ORDER BY id LIMIT ?')
+        last = None
+        while True:
+            with self.pool.connection() as conn:
+                cur = conn.cursor()
+                if last is None:
+                    cur.execute(first, (page_size,))
+                else:
+                    cur.execute(after, (last, page_size))
+                rows = cur.fetchall()
+            for resume_id, title, data in rows:
+                yield str(resume_id), title or '', json.loads(data) if isinstance(data, str) else data
+            if len(rows) < page_size:
+                break
+            last = rows[-1][0]
+
+
+def _resource_row(row, category):
+    resource_id, name, description, contact, website, address = row
+    if isinstance(contact, str):  # SQLite mirror: JSON text; psycopg decodes json columns itself
+        contact = json.loads(contact)
+    contact = contact or {}
+    return ResourceRow(str(resource_id), name, description or '', category.id, category.name,
+                       address or contact.get('address') or '', contact.get('phone') or '',
+                       contact.get('email') or '', website or '')
+
+
+# --- Building the SQLite mirror ---
+def create_mirror(path=MIRROR_PATH):
+    """Empty SQLite mirror at `path` (replacing any previous one); returns an open connection."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    if os.path.exists(path):
+        os.remove(path)
+    conn = sqlite3.connect(path)
+    conn.executescript(MIRROR_SCHEMA)
+    return conn
+
+
+def _insert(conn, categories, resources, batch=PAGE_SIZE):
+    """Insert Category tuples and resource dicts (types/database.ts column names) in batches."""
+    conn.executemany('INSERT INTO categories (id, name, icon, description) VALUES (?, ?, ?, ?)', categories)
+    sql = ('INSERT INTO resources (id, name, description, category_id, contact_info, website, address, '
+           'services_offered, population_served, is_approved, is_spotlighted) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
+    count, rows = 0, []
+    for r in resources:
+        rows.append((str(r['id']), r['name'], r.get('description'), str(r['category_id']),
+                     json.dumps(r['contact_info']) if r.get('contact_info') is not None else None,
+                     r.get('website'), r.get('address'),
+                     json.dumps(r.get('services_offered')), json.dumps(r.get('population_served')),
+                     int(bool(r.get('is_approved', True))), int(bool(r.get('is_spotlighted', False)))))
+        if len(rows) >= batch:
+            conn.executemany(sql, rows)
+            count += len(rows)
+            rows = []
+    conn.executemany(sql, rows)
+    conn.commit()
+    return count + len(rows)
+
+
+def mirror_from_database(source_dsn, path=MIRROR_PATH):
+    """Copy every category and resource from a database (e.g. production Postgres) into a new mirror."""
+    with ResourceDatabase(source_dsn) as source:
+        categories = source.categories()
+        conn = create_mirror(path)
+        try:
+            columns = 'id, name, description, category_id, contact_info, website, address, services_offered, ' \
+                      'population_served, is_approved, is_spotlighted'
+
+            def rows():
+                # Keyset on the primary key alone: a plain copy needs no catalog order
+                first = source._sql(f'SELECT {columns} FROM resources ORDER BY id LIMIT ?')
+                after = source._sql(f'SELECT {columns} FROM resources WHERE id > ? ORDER BY id LIMIT ?')
+                last = None
+                while True:
+                    with source.pool.connection() as src:
+                        cur = src.cursor()
+                        if last is None:
+                            cur.execute(first, (PAGE_SIZE,))
+                        else:
+                            cur.execute(after, (last, PAGE_SIZE))
+                        page = cur.fetchall()
+                    for row in page:
+                        record = dict(zip(columns.split(', '), row))
+                        for key in ('contact_info', 'services_offered', 'population_served'):
+                            if isinstance(record[key], str):
+                                record[key] = json.loads(record[key])
+                        yield record
+                    if len(page) < PAGE_SIZE:
+                        return
+                    last = page[-1][0]
+
+            return _insert(conn, categories.values(), rows())
+        finally:
+            conn.close()
+
+
+def mirror_from_geojson(geojson_path=LOCATIONS_PATH, path=MIRROR_PATH):
+    """Mirror built from the map's locations.json (the data the site shipped with), for offline runs."""
+    with open(geojson_path, encoding='utf-8') as f:
+        features = json.load(f).get('features', [])
+    categories = {}
+    resources = []
+    for feature in features:
+        props = feature.get('properties') or {}
+        name = props.get('category') or 'Uncategorized'
+        category = categories.setdefault(name, Category(str(uuid.uuid5(uuid.NAMESPACE_URL, f'category:{name}')), name, 'MapPin', None))
+        resources.append({'id': uuid.uuid5(uuid.NAMESPACE_URL, f"resource:{props.get('name')}:{props.get('address')}"),
+                          'name': props.get('name', 'Unnamed resource'), 'description': props.get('description'),
+                          'category_id': category.id, 'address': props.get('address'), 'is_approved': True})
+    conn = create_mirror(path)
+    try:
+        return _insert(conn, categories.values(), resources)
+    finally:
+        conn.close()
+
+
+SYNTHETIC_CATEGORIES = ('Food & Financial Aid', 'Education & Digital', 'Housing & Support', 'Education & STEM',
+                        'Education & Training', 'Health & Wellness', 'Legal Aid', 'Transportation')
+
+
+def mirror_synthetic(count, path=MIRROR_PATH):
+    """Mirror with `count` generated resources spread over a few categories (load and benchmarks)."""
+    categories = [Category(str(uuid.uuid5(uuid.NAMESPACE_URL, f'category:{name}')), name, 'MapPin', None)
+                  for name in SYNTHETIC_CATEGORIES]
+
+    def resources():
+        for i in range(count):
+            yield {'id': uuid.uuid5(uuid.NAMESPACE_URL, f'resource:{i}'), 'name': f'Community Resource {i:06d}',
+                   'description': 'Provides services and referrals to residents of Monroe and Union County.',
+                   'category_id': categories[i % len(categories)].id,
+                   'contact_info': {'phone': f'(704) 555-{i % 10000:04d}'}, 'website': f'https://example.org/r/{i}',
+                   'address': f'{100 + i % 900} Main St, Monroe, NC 28110', 'is_approved': i % 20 != 0}
+
+    conn = create_mirror(path)
+    try:
+        return _insert(conn, categories, resources())
+    finally:
+        conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the local SQLite mirror of the resources database.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    mirror = sub.add_parser('mirror', help='(re)build the SQLite mirror')
+    source = mirror.add_mutually_exclusive_group()
+    source.add_argument('--from', dest='source', metavar='DSN', help=f'copy from this database (default: ${DATABASE_URL_ENV})')
+    source.add_argument('--geojson', metavar='FILE', help='build from a GeoJSON FeatureCollection (default source '
+                                                          'when no database URL is set: public/data/locations.json)')
+    source.add_argument('--synthetic', type=int, metavar='N', help='generate N resources')
+    mirror.add_argument('--out', default=MIRROR_PATH, help='mirror path (default: scripts/data/resources.sqlite3)')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    source_dsn = args.source or (None if args.geojson or args.synthetic else os.environ.get(DATABASE_URL_ENV))
+    if args.synthetic is not None:
+        count = mirror_synthetic(args.synthetic, args.out)
+    elif source_dsn:
+        count = mirror_from_database(source_dsn, args.out)
+    else:
+        count = mirror_from_geojson(args.geojson or LOCATIONS_PATH, args.out)
+    print(f'Mirrored {count} resources to {args.out} in {time.perf_counter() - start:.2f}s')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
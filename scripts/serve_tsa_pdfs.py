@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Serve TSA PDFs on demand: personalized document specs and resource directories, rendered per request.
+Standard library only (asyncio); rendering runs in a bounded pool of worker processes.
+Run from repo root: python scripts/serve_tsa_pdfs.py [--port 8765] [--jobs 2]
+  GET /documents                                    names of the document specs
+  GET /documents/<name>.pdf?team_name=...&students=Ann;Bo   fills the spec's {{placeholders}}
+  GET /resources.pdf?category=...&near=LAT,LON&radius_km=5  resource directory
+  GET /health                                       pool, cache and coalescing counters (JSON)
+Identical requests share one render while it runs and recent PDFs are served from memory;
+when every worker is busy and the queue is full, new renders get 503 with Retry-After.
+Renders are reproducible, so a PDF's ETag (its sha256) only changes when its content does.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import OrderedDict, namedtuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import generate_resource_directory as d
+import generate_tsa_pdfs as g
+import merge_tsa_pdfs as m
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+QUEUE_PER_WORKER = 2  # renders waiting per worker before new ones are turned away
+CACHE_BYTES = 64 * 1024 * 1024
+CACHE_ENTRIES = 512
+CHUNK_SIZE = 64 * 1024
+MAX_REQUEST_LINE = 8192
+REQUEST_TIMEOUT = 10  # seconds to receive the request head
+RETRY_AFTER = 1  # seconds, sent with 503
+
+
+class BadRequest(ValueError):
+    """Invalid query parameters; answered with 400."""
+
+
+Rendered = namedtuple('Rendered', 'data etag')
+
+
+def _rendered(data):
+    return Rendered(data, '"%s"' % hashlib.sha256(data).hexdigest()[:32])
+
+
+class PdfCache:
+    """LRU of Rendered PDFs, bounded by total bytes and entry count."""
+
+    def __init__(self, max_bytes=CACHE_BYTES, max_entries=CACHE_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.bytes = 0
+
+    def get(self, key):
+        rendered = self.entries.get(key)
+        if rendered is not None:
+            self.entries.move_to_end(key)
+        return rendered
+
+    def put(self, key, rendered):
+        if len(rendered.data) > self.max_bytes:
+            return
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes -= len(old.data)
+        self.entries[key] = rendered
+        self.bytes += len(rendered.data)
+        while self.bytes > self.max_bytes or len(self.entries) > self.max_entries:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= len(evicted.data)
+
+
+# --- Worker side: one template / resource list per process, reused across requests ---
+_WORKER_TEMPLATES = {}
+_WORKER_RESOURCES = {}
+
+
+def _init_service_worker():
+    g.init_resources()
+
+
+def render_document(spec_path, stat_key, values):
+    """Rendered PDF for a document spec with its placeholders filled from `values`."""
+    template = _WORKER_TEMPLATES.get(spec_path)
+    if template is None or template[0] != stat_key:
+        template = _WORKER_TEMPLATES[spec_path] = (stat_key, m.MergeTemplate(spec_path))
+    template = template[1]
+    spec = template.compile_row(values)
+    return _rendered(g.render_pdf(template.iter_story(spec), spec.title, spec.subtitle, spec.metadata, reproducible=True))
+
+
+def render_resources(stat_key, category=None, near=None, radius_km=None):
+    """Rendered PDF for a resource directory, optionally one category and/or sorted by distance."""
+    resources = _WORKER_RESOURCES.get(stat_key)
+    if resources is None:
+        _WORKER_RESOURCES.clear()
+        resources = _WORKER_RESOURCES[stat_key] = d.load_resources()
+    if category is not None:
+        resources = [r for r in resources if r.category.lower() == category.lower()]
+        if not resources:
+            raise BadRequest(f'no resources in category {category!r}')
+    plans = d.plan_directories(resources, near=near, radius_km=radius_km)
+    entries = [entry for label in plans for entry in plans[label]]
+    if near is not None:
+        entries.sort(key=lambda e: (e[0], e[1].name))
+    label = resources[0].category if category is not None else 'All resources'
+    sink = g.PdfSink()
+    d.build_directory(label, entries, sink, reproducible=True)
+    return _rendered(sink.getvalue())
+
+
+# --- Server side ---
+def _query_values(query):
+    """Query string -> placeholder values; 'a;b' becomes a list, as in merge CSV cells."""
+    return {key: m._csv_value(value) for key, value in parse_qsl(query) if value.strip()}
+
+
+def _parse_resource_query(values):
+    try:
+        near = d._parse_point(values['near']) if 'near' in values else None
+        radius_km = float(values['radius_km']) if 'radius_km' in values else None
+    except (ValueError, TypeError, AttributeError, argparse.ArgumentTypeError):
+        raise BadRequest('near must be LAT,LON and radius_km a number') from None
+    if radius_km is not None and near is None:
+        raise BadRequest('radius_km needs near')
+    category = values.get('category')
+    if isinstance(category, list):
+        raise BadRequest('give one category')
+    return category, near, radius_km
+
+
+class PdfService:
+    """Routes requests to renders on a process pool, with coalescing, an LRU cache and backpressure.
+
+    A render is keyed by what determines its bytes: the endpoint, its parameters and the stat of
+    the input file (spec or locations.json), so editing an input invalidates cached PDFs.
+    """
+
+    def __init__(self, jobs=2, queue_per_worker=QUEUE_PER_WORKER, cache=None):
+        self.jobs = jobs
+        self.max_inflight = jobs * (1 + queue_per_worker)
+        self.pool = self._start_pool()
+        # Start the workers now: forked lazily on the first render, they would inherit that
+        # request's client socket and keep it open after the server closes its end
+        for future in [self.pool.submit(os.getpid) for _ in range(jobs)]:
+            future.result()
+        self.cache = cache or PdfCache()
+        self.inflight = {}
+        self.stats = {'requests': 0, 'renders': 0, 'cache_hits': 0, 'coalesced': 0, 'rejected': 0, 'errors': 0,
+                      'pool_restarts': 0}
+
+    def _start_pool(self, mp_context=None):
+        # Imported here, as in generate_tsa_pdfs: only the server process needs multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_service_worker, mp_context=mp_context)
+
+    def _replace_pool(self, broken):
+        """Swap in a new pool for `broken`, whose worker died (killed, out of memory) and took it down."""
+        if self.pool is not broken:
+            return  # another request already replaced it
+        import multiprocessing
+        self.stats['pool_restarts'] += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+        # Clients are connected by now, so forked workers would hold their sockets open; workers
+        # from a fork server (a fresh interpreter) inherit none. Started now, not on the next render.
+        forkserver = 'forkserver' in multiprocessing.get_all_start_methods()
+        self.pool = self._start_pool(multiprocessing.get_context('forkserver') if forkserver else None)
+        for _ in range(self.jobs):
+            self.pool.submit(os.getpid)
+
+    def close(self):
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+    def health(self):
+        return dict(self.stats, jobs=self.jobs, inflight=len(self.inflight), max_inflight=self.max_inflight,
+                    cache_entries=len(self.cache.entries), cache_bytes=self.cache.bytes)
+
+    def plan(self, path, query):
+        """(cache key, worker function, args) for a PDF endpoint; raises BadRequest or SpecError."""
+        values = _query_values(query)
+        if path == '/resources.pdf':
+            category, near, radius_km = _parse_resource_query(values)
+            stat_key = tuple(g._stat_key(d.LOCATIONS_PATH))
+            args = (stat_key, category, near, radius_km)
+            return ('resources',) + args, render_resources, args
+        name = unquote(path[len('/documents/'):-len('.pdf')])
+        if not name or '/' in name or name.startswith('.'):
+            raise BadRequest('bad document name')
+        spec_path = g.find_specs().get(name)
+        if spec_path is None:
+            raise LookupError(name)
+        stat_key = tuple(g._stat_key(spec_path))
+        values.pop('id', None)
+        key = ('document', spec_path, stat_key, tuple(sorted((k, json.dumps(v)) for k, v in values.items())))
+        return key, render_document, (spec_path, stat_key, dict(values, id=name))
+
+    async def render(self, key, fn, args):
+        """Rendered PDF and how it was obtained ('hit', 'coalesced' or 'miss'); None when saturated.
+
+        A render whose pool broke under it is retried once on a new pool.
+        """
+        from concurrent.futures.process import BrokenProcessPool
+        for retry in (False, True):
+            pool = self.pool
+            try:
+                return await self._render_once(key, fn, args)
+            except BrokenProcessPool:
+                self._replace_pool(pool)
+                if retry:
+                    raise
+
+    async def _render_once(self, key, fn, args):
+        rendered = self.cache.get(key)
+        if rendered is not None:
+            self.stats['cache_hits'] += 1
+            return rendered, 'hit'
+        future = self.inflight.get(key)
+        how = 'coalesced'
+        if future is None:
+            if len(self.inflight) >= self.max_inflight:
+                self.stats['rejected'] += 1
+                return None, 'rejected'
+            how = 'miss'
+            self.stats['renders'] += 1
+            future = asyncio.get_running_loop().run_in_executor(self.pool, fn, *args)
+            self.inflight[key] = future
+            future.add_done_callback(lambda f: self._finished(key, f))
+        else:
+            self.stats['coalesced'] += 1
+        # shield: a client that disconnects must not cancel a render other requests are waiting on
+        return await asyncio.shield(future), how
+
+    def _finished(self, key, future):
+        self.inflight.pop(key, None)
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+
+    async def handle(self, reader, writer):
+        try:
+            try:
+                head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), REQUEST_TIMEOUT)
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+                return
+            lines = head.decode('latin-1').split('\r\n')
+            request_line = lines[0]
+            headers = {}
+            for line in lines[1:]:
+                name, sep, value = line.partition(':')
+                if sep:
+                    headers[name.strip().lower()] = value.strip()
+            parts = request_line.split()
+            if len(parts) != 3 or len(request_line) > MAX_REQUEST_LINE:
+                await self._respond(writer, 400, b'bad request\n')
+                return
+            method, target, _version = parts
+            if method not in ('GET', 'HEAD'):
+                await self._respond(writer, 405, b'GET only\n', extra={'Allow': 'GET, HEAD'})
+                return
+            self.stats['requests'] += 1
+            await self._route(writer, method, urlsplit(target), headers)
+        finally:
+            writer.close()
+
+    async def _route(self, writer, method, url, headers):
+        head_only = method == 'HEAD'
+        if url.path == '/health':
+            await self._respond_json(writer, self.health(), head_only)
+            return
+        if url.path in ('/documents', '/documents/'):
+            await self._respond_json(writer, sorted(g.find_specs()), head_only)
+            return
+        if not (url.path == '/resources.pdf' or (url.path.startswith('/documents/') and url.path.endswith('.pdf'))):
+            await self._respond(writer, 404, b'not found\n')
+            return
+        start = time.perf_counter()
+        try:
+            rendered, how = await self.render(*self.plan(url.path, url.query))
+        except LookupError:
+            await self._respond(writer, 404, b'no such document\n')
+            return
+        except (BadRequest, g.SpecError) as e:
+            await self._respond(writer, 400, f'{e}\n'.encode('utf-8'))
+            return
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f'render failed: {url.path}?{url.query}: {e!r}', file=sys.stderr)
+            await self._respond(writer, 500, b'render failed\n')
+            return
+        if rendered is None:
+            await self._respond(writer, 503, b'busy, retry shortly\n', extra={'Retry-After': str(RETRY_AFTER)})
+            return
+        extra = {
+            'ETag': rendered.etag,
+            'X-Cache': how,
+            'Server-Timing': f'render;dur={1000 * (time.perf_counter() - start):.1f}',
+        }
+        if rendered.etag in (tag.strip() for tag in headers.get('if-none-match', '').split(',')):
+            await self._respond(writer, 304, b'', extra=extra)
+            return
+        extra['Content-Disposition'] = f'inline; filename="{os.path.basename(url.path)}"'
+        await self._respond(writer, 200, rendered.data, 'application/pdf', head_only, extra=extra)
+
+    async def _respond_json(self, writer, payload, head_only=False):
+        await self._respond(writer, 200, json.dumps(payload, indent=2).encode('utf-8') + b'\n',
+                            'application/json', head_only)
+
+    async def _respond(self, writer, status, body, content_type='text/plain; charset=utf-8', head_only=False, extra=None):
+        reasons = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                   500: 'Internal Server Error', 503: 'Service Unavailable'}
+        headers = {'Content-Type': content_type, 'Content-Length': str(len(body)), 'Connection': 'close'}
+        headers.update(extra or {})
+        head = f'HTTP/1.1 {status} {reasons[status]}\r\n' + ''.join(f'{k}: {v}\r\n' for k, v in headers.items()) + '\r\n'
+        try:
+            writer.write(head.encode('latin-1'))
+            if not head_only:
+                # Written in chunks with drain() so a slow client holds at most one chunk in memory
+                view = memoryview(body)
+                for offset in range(0, len(view), CHUNK_SIZE):
+                    writer.write(view[offset:offset + CHUNK_SIZE])
+                    await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, jobs=2, queue_per_worker=QUEUE_PER_WORKER, ready=None):
+    """Run the service until cancelled; `ready` (an asyncio.Event or None) is set once listening."""
+    service = PdfService(jobs, queue_per_worker)
+    server = await asyncio.start_server(service.handle, host, port, limit=MAX_REQUEST_LINE * 2)
+    addresses = ', '.join(f'http://{s.getsockname()[0]}:{s.getsockname()[1]}' for s in server.sockets)
+    print(f'Serving TSA PDFs on {addresses} ({jobs} workers)')
+    try:
+        async with server:
+            if ready is not None:
+                ready.set()
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve personalized TSA PDFs over HTTP.')
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'interface to listen on (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'port (default: {DEFAULT_PORT})')
+    parser.add_argument('-j', '--jobs', type=int, default=2, help='render worker processes (default: 2)')
+    parser.add_argument('--queue', type=int, default=QUEUE_PER_WORKER,
+                        help=f'renders allowed to wait per worker before answering 503 (default: {QUEUE_PER_WORKER})')
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    try:
+        asyncio.run(serve(args.host, args.port, args.jobs, args.queue))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,8 @@
+"""Shared setup for the TSA PDF script tests: run with `python -m pytest scripts/tests` from repo root."""
+
+import os
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
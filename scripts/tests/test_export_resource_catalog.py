@@ -0,0 +1,24 @@
+import io
+
+import export_resource_catalog as catalog
+import generate_tsa_pdfs as g
+import resource_db
+
+
+def test_catalog_headings_and_counts():
+    rows = [resource_db.ResourceRow('r1', 'Pantry', '', 'c1', 'Food & Aid', '', '', '', ''),
+            resource_db.ResourceRow('r2', 'Clinic', '', 'c2', 'Health', '', '', '', ''),
+            resource_db.ResourceRow('r3', 'Dentist', '', 'c2', 'Health', '', '', '', '')]
+    texts = [f.text for f in catalog.catalog_flowables(rows, {'c1': 1, 'c2': 2}) if hasattr(f, 'text')]
+    assert texts[0] == 'Food &amp; Aid' and texts[1] == '1 resource'
+    assert 'Health' in texts and '2 resources' in texts
+
+
+def test_export_streams_every_approved_resource(tmp_path):
+    path = str(tmp_path / 'resources.sqlite3')
+    resource_db.mirror_synthetic(120, path)
+    out = io.BytesIO()
+    with resource_db.ResourceDatabase(path) as db:
+        resources, pages = catalog.export_catalog(db, out, reproducible=True, page_size=9)
+        assert resources == sum(db.category_counts().values()) == 114
+    assert pages > 1 and out.getvalue().startswith(b'%PDF')
@@ -0,0 +1,32 @@
+import random
+
+import pytest
+
+import generate_resource_directory as d
+
+
+def _resources(points):
+    return [d.Resource(f'R{i}', 'Food', '', '', lat, lon) for i, (lat, lon) in enumerate(points)]
+
+
+@pytest.mark.parametrize('query_lat', [0.0, 35.0, 60.0, 75.0])
+def test_within_matches_brute_force_away_from_the_reference_latitude(query_lat):
+    rng = random.Random(7)
+    # Most resources near the equator set the grid's reference latitude; the query is elsewhere
+    points = [(rng.uniform(-1, 1), rng.uniform(-1, 1)) for _ in range(300)]
+    points += [(query_lat + rng.uniform(-0.5, 0.5), rng.uniform(-1.5, 1.5)) for _ in range(300)]
+    resources = _resources(points)
+    grid = d.SpatialGrid(resources, cell_km=2.0)
+    for radius_km in (3, 25, 60):
+        expected = sorted((d.haversine_km(query_lat, 0.0, r.lat, r.lon), r.name) for r in resources
+                          if d.haversine_km(query_lat, 0.0, r.lat, r.lon) <= radius_km)
+        assert [(km, r.name) for km, r in grid.within(query_lat, 0.0, radius_km)] == expected
+
+
+def test_unique_slugs_suffix_labels_that_slug_alike():
+    slugs = d.unique_slugs(['Food & Aid', 'Food Aid', 'food-aid', 'Health'])
+    assert list(slugs.values()) == ['food-aid', 'food-aid-2', 'food-aid-3', 'health']
+
+
+def test_resource_count_pluralises():
+    assert [d.resource_count(n) for n in (0, 1, 2)] == ['0 resources', '1 resource', '2 resources']
@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+import generate_resumes as r
+
+RESUME = {
+    'personalInfo': {'firstName': 'Jordan', 'lastName': 'Rivera', 'email': 'jordan@example.com'},
+    'summary': 'Student developer who builds accessible web tools for local nonprofits.',
+    'experience': [{'id': 'e1', 'company': 'Monroe Public Library', 'position': 'Technology Volunteer',
+                    'startDate': '2024-06-01', 'current': True, 'achievements': ['Taught 40+ seniors', 2024, None, '  ']}],
+    'education': [{'id': 'd1', 'institution': 'Central Academy of Technology and Arts', 'degree': 'High School Diploma',
+                   'startDate': '2022-08-20', 'endDate': '2026-06-05'}],
+    'skills': ['Python', 3, None, ' SQL ', ''],
+}
+
+
+def test_load_resume_keeps_non_string_items_as_text():
+    from io import BytesIO
+    import pikepdf
+    resume = r.load_resume(RESUME)
+    assert resume['skills'] == ['Python', '3', 'SQL']
+    assert resume['experience'][0]['achievements'] == ['Taught 40+ seniors', '2024']
+    loose = r.load_resume(dict(RESUME, skills='Python', experience=[
+        {'id': 'e2', 'company': None, 'position': None, 'achievements': 'Ran the help desk'}],
+        education=[{'id': 'd2', 'institution': 'Central Academy', 'degree': None, 'field': None}]))
+    assert loose['skills'] == ['Python']
+    assert loose['experience'][0]['achievements'] == ['Ran the help desk']
+    with pikepdf.open(BytesIO(r.render_resume_bytes(loose, 'minimal', reproducible=True))) as pdf:
+        text = b''.join(page.Contents.read_bytes() for page in pdf.pages)
+    assert b'Ran the help desk' in text and b'None' not in text
+
+
+def test_load_resume_rejects_non_objects():
+    with pytest.raises(r.ResumeError):
+        r.load_resume('[1, 2]')
+
+
+@pytest.mark.parametrize('template', sorted(r.TEMPLATES))
+def test_every_template_renders_reproducibly(template):
+    first = r.render_resume_bytes(RESUME, template, reproducible=True)
+    assert first.startswith(b'%PDF')
+    assert r.render_resume_bytes(RESUME, template, reproducible=True) == first
+
+
+def test_ids_that_slug_alike_get_distinct_files(tmp_path):
+    rows = [{'id': resume_id, 'resume_data': RESUME} for resume_id in ('a/b', 'a-b', 'A-B')]
+    results = list(r.render_resumes(rows, str(tmp_path), template='minimal', reproducible=True))
+    paths = [result['path'] for result in results]
+    assert all(result['ok'] for result in results)
+    assert len(set(paths)) == 3 and all(os.path.isfile(path) for path in paths)
+    assert os.path.basename(paths[1]) == 'a-b-minimal.pdf'
@@ -0,0 +1,203 @@
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+import generate_tsa_pdfs as g
+
+
+def test_check_reproducible_hashes_agree():
+    digests = g.check_reproducible()
+    assert set(digests) == set(g.find_specs())
+    for name, runs in digests.items():
+        assert len(set(runs)) == 1, (name, runs)
+
+
+def _checkout(root):
+    """Copy of the scripts and the logo under `root`, as a fresh clone elsewhere would have them."""
+    shutil.copytree(os.path.join(g.REPO_ROOT, 'scripts'), os.path.join(root, 'scripts'),
+                    ignore=shutil.ignore_patterns('.image-cache', '.cache', '__pycache__', 'tests', 'data'))
+    os.makedirs(os.path.join(root, 'public'))
+    shutil.copy(g.LOGO_PATH, os.path.join(root, 'public', 'logo.png'))
+    return root
+
+
+def _build(root):
+    subprocess.run([sys.executable, os.path.join('scripts', 'generate_tsa_pdfs.py'), '--reproducible'],
+                   cwd=root, check=True, capture_output=True)
+    out = os.path.join(root, 'public', 'documents')
+    return {name: hashlib.sha256(open(os.path.join(out, name), 'rb').read()).hexdigest()
+            for name in sorted(os.listdir(out)) if name.endswith('.pdf')}
+
+
+def test_reproducible_output_does_not_depend_on_checkout_path(tmp_path):
+    first = _build(_checkout(str(tmp_path / 'one')))
+    second = _build(_checkout(str(tmp_path / 'elsewhere' / 'two')))
+    assert first and first == second
+
+
+BUILD = '''
+import json, sys
+sys.path.insert(0, 'scripts')
+import generate_tsa_pdfs as g
+print(json.dumps({r['name']: r['skipped'] for r in g.build_documents(reproducible=True) if r['ok']}))
+'''
+
+
+def _build_skipped(root):
+    done = subprocess.run([sys.executable, '-c', BUILD], cwd=root, check=True, capture_output=True, text=True)
+    return json.loads(done.stdout.splitlines()[-1])
+
+
+def test_manifest_skips_unchanged_documents(tmp_path):
+    root = _checkout(str(tmp_path / 'repo'))
+    names = set(g.find_specs())
+    assert _build_skipped(root) == dict.fromkeys(names, False)
+    assert _build_skipped(root) == dict.fromkeys(names, True)
+    spec = os.path.join(root, 'scripts', 'documents', 'work-log.json')
+    with open(spec, 'a', encoding='utf-8') as f:
+        f.write('\n')  # same content, new stat: the fingerprint is of the compiled spec, so still skipped
+    assert _build_skipped(root)['work-log'] is True
+    with open(spec, encoding='utf-8') as f:
+        raw = json.load(f)
+    with open(spec, 'w', encoding='utf-8') as f:
+        json.dump(dict(raw, title='WORK LOG (REVISED)'), f)
+    assert _build_skipped(root) == dict(dict.fromkeys(names, True), **{'work-log': False})
+    os.remove(os.path.join(root, 'public', 'documents', 'student-copyright-checklist.pdf'))
+    assert _build_skipped(root) == dict(dict.fromkeys(names, True), **{'student-copyright-checklist': False})
+
+
+def test_phase_summary_of_an_empty_store_has_no_date_span():
+    block = {'header': ['Phase', 'Dates', 'Hours', 'Team'], 'col_widths': [2, 2, 1, 1]}
+    table = g._phase_summary_table(block, [], g.HoursStore())
+    assert table['rows'] == []
+    assert table['total'][1] == '—'
+
+
+def test_missing_image_falls_back_without_failing_the_batch(tmp_path, monkeypatch):
+    cache = tmp_path / 'image-cache'
+    monkeypatch.setattr(g, 'IMAGE_CACHE_DIR', str(cache))
+    monkeypatch.setattr(g, 'IMAGE_CACHE_INDEX', str(cache / 'sources.json'))
+    monkeypatch.setattr(g, '_IMAGE_SOURCES', None)
+    monkeypatch.setattr(g, '_IMAGE_PATHS', {})
+    missing = str(tmp_path / 'missing.png')
+    fallback, derivative = g.image_derivatives([(missing, 256, 'PNG'), (g.LOGO_PATH, 256, 'PNG')])
+    assert fallback == missing
+    assert os.path.dirname(derivative) == str(cache) and os.path.isfile(derivative)
+
+
+def test_shared_styles_are_read_only():
+    styles = g.get_styles()
+    with pytest.raises(TypeError):
+        styles['PlainBody'] = styles['Cell']
+    with pytest.raises(AttributeError):
+        styles['PlainBody'].fontSize = 30
+    copy = styles['PlainBody'].clone('Bigger', fontSize=30)
+    copy.leading = 34
+    assert (copy.fontSize, copy.leading) == (30, 34)
+    assert styles['PlainBody'].fontSize != 30 and g.get_styles() is styles
+
+
+def _vera_pdf():
+    """A one-line PDF with an embedded TrueType subset (ReportLab's bundled Vera)."""
+    import reportlab
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.platypus import Paragraph
+    pdfmetrics.registerFont(TTFont('TestVera', os.path.join(os.path.dirname(reportlab.__file__), 'fonts', 'Vera.ttf')))
+    story = [Paragraph('Signed, Jordan Rivera', ParagraphStyle('TestVera', fontName='TestVera'))]
+    return g.render_pdf(story, 'FONTS', 'Subtitle', reproducible=True)
+
+
+def test_font_report_measures_optimized_and_merged_pdfs(tmp_path, capsys):
+    data = _vera_pdf()
+    paths = {}
+    for kind, pdf in (('plain', data), ('optimized', g.optimize_pdf_bytes(data)[0]),
+                      ('merged', g.merge_pdf_chunks([data, data]))):
+        paths[kind] = tmp_path / f'{kind}.pdf'
+        paths[kind].write_bytes(pdf)
+    sizes = {kind: g.font_bytes(str(path)) for kind, path in paths.items()}
+    vera, plain = next(iter(sizes['plain'].items()))  # largest first: the embedded subset
+    assert vera.startswith('BitstreamVera') and plain > 5000
+    for kind in ('optimized', 'merged'):
+        # the subset program dominates; dictionaries serialize a little differently per writer
+        assert abs(sizes[kind][vera] - plain) < 0.05 * plain
+        assert set(sizes[kind]) == set(sizes['plain'])
+    g.report_font_bytes([{'name': 'optimized', 'ok': True, 'path': str(paths['optimized'])}])
+    assert vera in capsys.readouterr().out
+
+
+def test_size_budget_leaves_out_the_embedded_signature_font(tmp_path):
+    import reportlab
+    root = _checkout(str(tmp_path / 'repo'))
+    shutil.copy(os.path.join(os.path.dirname(reportlab.__file__), 'fonts', 'VeraBI.ttf'),
+                os.path.join(root, 'scripts', 'fonts', 'Script.ttf'))
+    for flags in ([], ['--optimize']):
+        done = subprocess.run([sys.executable, os.path.join('scripts', 'generate_tsa_pdfs.py'), '--force', *flags],
+                              cwd=root, capture_output=True, text=True)
+        assert done.returncode == 0, done.stdout + done.stderr
+    fonts = g.font_bytes(os.path.join(root, 'public', 'documents', 'student-copyright-checklist.pdf'))
+    assert any(name.startswith('BitstreamVera') for name in fonts)
+    # the second run loaded the font from its cached path; only the path is kept, not a parsed copy
+    cache = os.path.join(root, 'scripts', 'fonts', '.cache')
+    assert os.listdir(cache) == ['resolved.json']
+    with open(os.path.join(cache, 'resolved.json'), encoding='utf-8') as f:
+        assert json.load(f)['SignatureScript']['path'].endswith('Script.ttf')
+
+
+
+def _page_labels(data):
+    """Page number the test's page callback drew on each page of a PDF."""
+    import re
+    from io import BytesIO
+    import pikepdf
+    labels = []
+    with pikepdf.open(BytesIO(data)) as pdf:
+        for page in pdf.pages:
+            contents = page.obj.Contents
+            streams = list(contents) if isinstance(contents, pikepdf.Array) else [contents]
+            text = b''.join(stream.read_bytes() for stream in streams)
+            labels.append(int(re.search(rb'PAGE-LABEL-(\d+)', text).group(1)))
+    return labels
+
+
+def test_chunked_build_numbers_pages_like_a_serial_build(tmp_path, monkeypatch):
+    from concurrent.futures import ProcessPoolExecutor
+    pytest.importorskip('pikepdf')
+    later_pages_cb = g.later_pages_cb
+
+    def numbered(canvas, doc, title, subtitle):
+        later_pages_cb(canvas, doc, title, subtitle)
+        canvas.drawString(40, 20, f'PAGE-LABEL-{canvas.getPageNumber()}')
+
+    # Workers fork after the patches, so they number pages the same way; no start pages known yet
+    monkeypatch.setattr(g, 'first_page_cb', numbered)
+    monkeypatch.setattr(g, 'later_pages_cb', numbered)
+    monkeypatch.setattr(g, '_CHUNK_PAGES', {})
+    monkeypatch.setattr(g, 'OUT_DIR', str(tmp_path / 'out'))
+    with open(g.find_specs()['work-log'], encoding='utf-8') as f:
+        raw = json.load(f)
+    raw['phases'] = [dict(raw['phases'][i % len(raw['phases'])], hours=5) for i in range(150)]
+    raw.pop('size_budget_kb', None)
+    spec_path = str(tmp_path / 'long-log.json')
+    with open(spec_path, 'w', encoding='utf-8') as f:
+        json.dump(raw, f)
+    assert len(g.plan_chunks(g.load_spec(spec_path), 3)) == 3
+
+    serial = g._run_builder(spec_path)
+    with ProcessPoolExecutor(max_workers=3) as pool:
+        chunked = g._run_builder(spec_path, chunks=3, pool=pool)
+    assert serial['ok'] and chunked['ok'], (serial['error'], chunked['error'])
+    with open(serial['path'], 'rb') as f:
+        serial_labels = _page_labels(f.read())
+    with open(chunked['path'], 'rb') as f:
+        chunked_labels = _page_labels(f.read())
+    assert serial_labels == list(range(1, len(serial_labels) + 1))
+    # every part starts a new page, so the chunked PDF may be a page or two longer
+    assert chunked_labels == list(range(1, len(chunked_labels) + 1))
+    assert len(serial_labels) <= len(chunked_labels) <= len(serial_labels) + 2
@@ -0,0 +1,51 @@
+import os
+
+import merge_tsa_pdfs as m
+
+HEADER = 'id,students,hours\n'
+
+
+def _merge(rows_path, out_dir, **kwargs):
+    return {result['id']: result for result in m.merge_documents('work-log', rows_path, out_dir, **kwargs)}
+
+
+def test_merge_resumes_from_the_progress_ledger(tmp_path):
+    rows_path = str(tmp_path / 'rows.csv')
+    out_dir = str(tmp_path / 'merged')
+    with open(rows_path, 'w', encoding='utf-8') as f:
+        f.write(HEADER + 'ann,Ann Lee,1;2;3;4;5;6;7;8\n' + 'bo,Bo Diaz,1;2;x;4;5;6;7;8\n')
+
+    first = _merge(rows_path, out_dir)
+    assert first['ann']['ok'] and not first['ann']['skipped'] and os.path.isfile(first['ann']['path'])
+    assert not first['bo']['ok']
+    assert "hours must be a number, not 'x'" in first['bo']['error']
+    assert 'Traceback' not in first['bo']['error']
+
+    with open(rows_path, 'a', encoding='utf-8') as f:
+        f.write('cy,Cy Park,\n')  # empty cell: the spec's default hours apply
+    second = _merge(rows_path, out_dir)
+    assert second['ann']['skipped'] and second['ann']['path'] == first['ann']['path']
+    assert not second['bo']['ok'] and not second['bo']['skipped']  # failed rows are retried
+    assert second['cy']['ok'] and not second['cy']['skipped']
+
+    with open(rows_path, 'w', encoding='utf-8') as f:
+        f.write(HEADER + 'ann,Ann Lee,1;2;3;4;5;6;7;9\n' + 'bo,Bo Diaz,1;2;3;4;5;6;7;8\n' + 'cy,Cy Park,\n')
+    third = _merge(rows_path, out_dir)
+    assert not third['ann']['skipped'] and third['ann']['ok']  # changed values are rebuilt
+    assert third['bo']['ok'] and third['cy']['skipped']
+    assert not any(result['skipped'] for result in _merge(rows_path, out_dir, force=True).values())
+
+
+def test_ids_that_slug_alike_get_their_own_files(tmp_path):
+    rows_path = str(tmp_path / 'rows.csv')
+    out_dir = str(tmp_path / 'merged')
+    with open(rows_path, 'w', encoding='utf-8') as f:
+        f.write(HEADER + 'Team A,Ann Lee,\n' + 'team-a,Bo Diaz,\n')
+    first = _merge(rows_path, out_dir)
+    assert first['Team A']['ok'] and first['team-a']['ok']
+    assert first['Team A']['path'] != first['team-a']['path']
+    assert os.path.basename(first['team-a']['path']) == 'work-log-team-a.pdf'
+    assert all(os.path.isfile(result['path']) for result in first.values())
+    second = _merge(rows_path, out_dir)
+    assert all(result['skipped'] for result in second.values())
+    assert {result['path'] for result in second.values()} == {result['path'] for result in first.values()}
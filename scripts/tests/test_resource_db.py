@@ -0,0 +1,31 @@
+import uuid
+
+import resource_db
+
+
+def _ids(db, **kwargs):
+    return [row.id for row in db.iter_resources(**kwargs)]
+
+
+def test_keyset_pages_match_one_page(tmp_path):
+    path = str(tmp_path / 'resources.sqlite3')
+    resource_db.mirror_synthetic(203, path)
+    with resource_db.ResourceDatabase(path) as db:
+        whole = _ids(db)
+        for page_size in (1, 7, 19, 24):  # 24 divides a category exactly (last page is full)
+            assert _ids(db, page_size=page_size) == whole
+        assert len(whole) == len(set(whole)) == sum(db.category_counts().values())
+        assert len(_ids(db, approved_only=False, page_size=7)) == 203
+
+
+def test_keyset_pages_break_name_ties_by_id(tmp_path):
+    path = str(tmp_path / 'resources.sqlite3')
+    category = resource_db.Category('c1', 'Food', 'MapPin', None)
+    ids = sorted(str(uuid.uuid5(uuid.NAMESPACE_URL, f'same:{i}')) for i in range(10))
+    conn = resource_db.create_mirror(path)
+    try:
+        resource_db._insert(conn, [category], [{'id': i, 'name': 'Food Pantry', 'category_id': 'c1'} for i in ids])
+    finally:
+        conn.close()
+    with resource_db.ResourceDatabase(path) as db:
+        assert _ids(db, page_size=3) == ids
@@ -0,0 +1,85 @@
+import asyncio
+import os
+import signal
+
+import pytest
+
+import serve_tsa_pdfs as s
+
+HOURS = ';'.join(str(h) for h in range(1, 9))
+
+
+async def _get(port, target, headers=''):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f'GET {target} HTTP/1.1\r\nHost: test\r\n{headers}Connection: close\r\n\r\n'.encode('latin-1'))
+    await writer.drain()
+    data = await asyncio.wait_for(reader.read(), 60)
+    writer.close()
+    head, _, body = data.partition(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    fields = dict(line.split(': ', 1) for line in lines[1:])
+    return int(lines[0].split()[1]), fields, body
+
+
+def _run(service, *requests):
+    """Serve `service` on an ephemeral port and make the requests concurrently."""
+    async def main():
+        server = await asyncio.start_server(service.handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await asyncio.gather(*(_get(port, *request) for request in requests))
+    return asyncio.run(main())
+
+
+@pytest.fixture(scope='module')
+def service():
+    service = s.PdfService(jobs=1)
+    yield service
+    service.close()
+
+
+def test_non_numeric_hours_is_400(service):
+    (status, _, body), = _run(service, (f'/documents/work-log.pdf?hours=a;{HOURS[2:]}',))
+    assert status == 400
+    assert b'hours must be a number' in body
+
+
+def test_unknown_document_is_404(service):
+    (status, _, _), = _run(service, ('/documents/no-such-spec.pdf',))
+    assert status == 404
+
+
+def test_etag_round_trip_is_304(service):
+    (status, fields, body), = _run(service, (f'/documents/work-log.pdf?hours={HOURS}',))
+    assert status == 200 and body.startswith(b'%PDF')
+    assert int(fields['Content-Length']) == len(body)
+    (status, again, body), = _run(service, (f'/documents/work-log.pdf?hours={HOURS}',
+                                            f'If-None-Match: {fields["ETag"]}\r\n'))
+    assert status == 304 and body == b''
+    assert again['ETag'] == fields['ETag'] and again['X-Cache'] == 'hit'
+
+
+def test_saturated_queue_is_503():
+    service = s.PdfService(jobs=1, queue_per_worker=0)
+    try:
+        first, second = _run(service, (f'/documents/work-log.pdf?hours={HOURS}&team_name=A',),
+                             (f'/documents/work-log.pdf?hours={HOURS}&team_name=B',))
+    finally:
+        service.close()
+    assert sorted([first[0], second[0]]) == [200, 503]
+    busy = first if first[0] == 503 else second
+    assert busy[1]['Retry-After'] == str(s.RETRY_AFTER)
+    assert service.stats['rejected'] == 1
+
+
+def test_render_recovers_from_a_killed_worker():
+    service = s.PdfService(jobs=1)
+    try:
+        os.kill(service.pool.submit(os.getpid).result(), signal.SIGKILL)
+        (status, _, body), = _run(service, (f'/documents/work-log.pdf?hours={HOURS}&team_name=K',))
+        assert status == 200 and body.startswith(b'%PDF')
+        assert service.stats['pool_restarts'] == 1
+        (status, _, _), = _run(service, (f'/documents/work-log.pdf?hours={HOURS}&team_name=L',))
+        assert status == 200 and service.stats['pool_restarts'] == 1
+    finally:
+        service.close()